@@ -0,0 +1,105 @@
+"""HTTP/1.1 풀링 vs HTTP/2 다중화 비교 벤치마크
+
+kiwoom_rest_api.testing.mock_server.MockKiwoom(ASGI 앱)을 hypercorn(h2c 지원)으로 띄우고
+StockInfo.basic_stock_information_request_ka10001을 use_async=True로 동시에 호출하여
+두 전송 모드의 처리량과 사용된 연결 수를 비교합니다.
+
+    pip install hypercorn h2
+    python benchmarks/bench_http2.py --requests 2000 --concurrency 200 --latency-ms 20
+"""
+import argparse
+import asyncio
+import socket
+import threading
+import time
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+class ConnectionCounter:
+    """ASGI wrapper around MockKiwoom that records the client address of every request"""
+
+    def __init__(self, mock: MockKiwoom):
+        self.mock = mock
+        self.connections = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.connections.add(tuple(scope.get("client") or ()))
+        await self.mock(scope, receive, send)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app: ConnectionCounter, port: int) -> None:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.loglevel = "WARNING"
+    config.accesslog = None
+
+    async def run() -> None:
+        # 별도 스레드에서는 시그널 핸들러를 쓸 수 없으므로 종료 트리거를 직접 지정
+        await serve(app, config, shutdown_trigger=asyncio.Event().wait)
+
+    thread = threading.Thread(target=lambda: asyncio.run(run()), daemon=True)
+    thread.start()
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("mock server did not start")
+
+
+async def run_mode(base_url: str, http2: bool, total: int, concurrency: int) -> float:
+    session = KiwoomSession(
+        http2=http2,
+        http2_prior_knowledge=http2,
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    )
+    stock_info = StockInfo(base_url=base_url, use_async=True, session=session)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            return await stock_info.basic_stock_information_request_ka10001(f"{i % 1000:06d}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(total)])
+    elapsed = time.perf_counter() - start
+    await session.aclose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    app = ConnectionCounter(MockKiwoom(latency=args.latency_ms / 1000))
+    port = _free_port()
+    start_server(app, port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"{'mode':<8}{'requests':>10}{'seconds':>10}{'req/s':>10}{'conns':>8}")
+    for label, http2 in (("http1.1", False), ("http2", True)):
+        app.connections.clear()
+        elapsed = asyncio.run(run_mode(base_url, http2, args.requests, args.concurrency))
+        print(f"{label:<8}{args.requests:>10}{elapsed:>10.2f}{args.requests / elapsed:>10.0f}{len(app.connections):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""process_response JSON 디코딩 마이크로 벤치마크
+
+기록된 응답 본문(--payload 파일, 여러 개 지정 가능) 또는 kt00018 / ka10080 형태의 합성 응답을
+각 백엔드(json, orjson, msgspec)로 디코딩하여 호출당 소요 시간을 비교합니다.
+"before" 열은 기존 경로(response.json(): 텍스트 디코딩 후 표준 json 파싱)입니다.
+
+    pip install orjson msgspec
+    python benchmarks/bench_json_decode.py
+    python benchmarks/bench_json_decode.py --payload recorded/kt00018.json --payload recorded/ka10080.json
+"""
+import argparse
+import json
+import os
+import random
+import timeit
+
+import httpx
+
+from kiwoom_rest_api.core.base import process_response
+from kiwoom_rest_api.core.json_codec import get_json_backend, set_json_backend
+
+
+def _signed(value: int) -> str:
+    return f"{'+' if value >= 0 else '-'}{abs(value)}"
+
+
+def synthetic_kt00018(rows: int) -> bytes:
+    """계좌평가잔고내역요청 응답 형태"""
+    rnd = random.Random(18)
+    holdings = []
+    for i in range(rows):
+        price = rnd.randint(1000, 900000)
+        holdings.append({
+            "stk_cd": f"A{i:06d}", "stk_nm": f"종목{i}", "evltv_prft": _signed(rnd.randint(-10**7, 10**7)),
+            "prft_rt": f"{rnd.uniform(-30, 30):.2f}", "pur_pric": f"{price:015d}", "pred_close_pric": f"{price:015d}",
+            "rmnd_qty": f"{rnd.randint(1, 5000):015d}", "trde_able_qty": f"{rnd.randint(1, 5000):015d}",
+            "cur_prc": f"{price:015d}", "pred_buyq": "000000000000000", "pred_sellq": "000000000000000",
+            "tdy_buyq": "000000000000000", "tdy_sellq": "000000000000000", "pur_amt": f"{price * 10:015d}",
+            "pur_cmsn": "000000000000150", "evlt_amt": f"{price * 10:015d}", "sell_cmsn": "000000000000150",
+            "tax": "000000000000450", "sum_cmsn": "000000000000300", "poss_rt": f"{rnd.uniform(0, 10):.2f}",
+            "crd_tp": "00", "crd_tp_nm": "", "crd_loan_dt": "",
+        })
+    return json.dumps({
+        "tot_pur_amt": "000000017598258", "tot_evlt_amt": "000000025789890", "tot_evlt_pl": "000000008191632",
+        "tot_prft_rt": "46.55", "prsm_dpst_aset_amt": "000000025789890", "tot_loan_amt": "000000000000000",
+        "tot_crd_loan_amt": "000000000000000", "tot_crd_ls_amt": "000000000000000",
+        "acnt_evlt_remn_indv_tot": holdings, "return_code": 0, "return_msg": "조회가 완료되었습니다",
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def synthetic_ka10080(rows: int) -> bytes:
+    """주식분봉차트조회요청 응답 형태"""
+    rnd = random.Random(80)
+    candles = []
+    for i in range(rows):
+        price = rnd.randint(50000, 60000)
+        candles.append({
+            "cur_prc": _signed(price), "trde_qty": str(rnd.randint(0, 100000)), "cntr_tm": f"20250110{i % 24:02d}{i % 60:02d}00",
+            "open_pric": _signed(price + 100), "high_pric": _signed(price + 300), "low_pric": _signed(price - 300),
+            "upd_stkpc_tp": "", "upd_rt": "", "bic_inds_tp": "", "sm_inds_tp": "", "stk_infr": "", "upd_stkpc_event": "",
+            "pred_close_pric": "",
+        })
+    return json.dumps({"stk_cd": "005930", "stk_min_pole_chart_qry": candles, "return_code": 0, "return_msg": "정상"},
+                      ensure_ascii=False).encode("utf-8")
+
+
+def _response(body: bytes) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=body,
+        headers={"content-type": "application/json;charset=UTF-8", "cont-yn": "Y", "next-key": "x",
+                 "access-control-expose-headers": "cont-yn,next-key"},
+    )
+
+
+def bench(body: bytes, number: int) -> dict:
+    results = {}
+
+    def before() -> None:
+        # 기존 구현: response.json() (text 디코딩 + json.loads) 후 헤더 병합
+        response = _response(body)
+        response.json()
+
+    results["before"] = min(timeit.repeat(before, number=number, repeat=5)) / number
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            set_json_backend(backend)
+        except ImportError:
+            continue
+        results[backend] = min(timeit.repeat(lambda: process_response(_response(body)), number=number, repeat=5)) / number
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payload", action="append", default=[], help="기록된 응답 본문(JSON) 파일 경로")
+    parser.add_argument("--rows", type=int, default=900, help="합성 응답의 행 수")
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = {}
+    for path in args.payload:
+        with open(path, "rb") as f:
+            payloads[os.path.basename(path)] = f.read()
+    if not payloads:
+        payloads["kt00018 (synthetic)"] = synthetic_kt00018(args.rows)
+        payloads["ka10080 (synthetic)"] = synthetic_ka10080(args.rows)
+
+    original_backend = get_json_backend()
+    columns = ("before", "json", "orjson", "msgspec")
+    print(f"{'payload':<24}{'KiB':>8}" + "".join(f"{c + ' ms':>13}" for c in columns) + f"{'speedup':>10}")
+    for name, body in payloads.items():
+        results = bench(body, args.number)
+        best = min(v for k, v in results.items() if k != "before")
+        cells = "".join(f"{results[c] * 1000:>13.3f}" if c in results else f"{'n/a':>13}" for c in columns)
+        print(f"{name:<24}{len(body) / 1024:>8.0f}{cells}{results['before'] / best:>9.1f}x")
+    set_json_backend(original_backend)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""요청 파이프라인 벤치마크 (sync / async / 커넥션 풀 / 응답 캐시)
+
+로컬 목 서버(kiwoom_rest_api.testing.mock_server, 실제 소켓)에 ka10081 일봉 조회를 보내
+대상별 · 동시성별 · 응답 크기(행 수)별 처리량(req/s)과 지연 p50/p99를 측정합니다.
+
+대상:
+    make_request          요청마다 일회용 httpx.Client (커넥션 재사용 없음)
+    make_request_pooled   KiwoomSession.client 공유 (keep-alive 커넥션 풀)
+    make_request_async    KiwoomSession.async_client 공유
+    execute_request       Chart.stock_daily_chart_request_ka10081 → KiwoomBaseAPI._execute_request
+                          (재시도 정책 포함 전체 경로, 동기)
+    execute_request_async 위와 같은 경로의 비동기 버전 (coalescer 포함)
+    execute_cached        ResponseCache를 켠 execute_request (종목 10개를 반복 조회)
+
+결과는 JSON으로 저장해 기준선(baseline)으로 쓰고, 이후 실행을 기준선과 비교해
+처리량이 --threshold 이상 떨어지거나 p99가 그만큼 늘어난 항목을 REGRESSION으로 표시합니다 (종료 코드 1).
+수치는 실행한 기기에 따라 달라지므로 기준선은 저장소에 두지 않고 같은 기기에서 먼저 --save로 만들어야 합니다.
+--compare로 지정한 기준선이 없거나 측정 항목과 겹치는 항목이 하나도 없으면 비교를 건너뛰지 않고 오류로 종료합니다.
+
+    python benchmarks/bench_pipeline.py --save benchmarks/baseline.json
+    python benchmarks/bench_pipeline.py --compare benchmarks/baseline.json --threshold 0.15
+    python benchmarks/bench_pipeline.py --targets make_request_async,execute_request_async --concurrency 1,64 --rows 1,900
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from kiwoom_rest_api.core.async_client import make_request_async
+from kiwoom_rest_api.core.cache import ResponseCache
+from kiwoom_rest_api.core.json_codec import get_json_backend
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.core.sync_client import make_request
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+TARGETS = (
+    "make_request",
+    "make_request_pooled",
+    "make_request_async",
+    "execute_request",
+    "execute_request_async",
+    "execute_cached",
+)
+ASYNC_TARGETS = ("make_request_async", "execute_request_async")
+CACHED_CODES = 10
+
+
+def _code(i: int, cached: bool) -> str:
+    # 캐시 대상이 아니면 매 요청 다른 종목으로 보내 캐시/coalescer가 개입하지 않게 함
+    return f"{i % CACHED_CODES if cached else i:06d}"
+
+
+def _raw_args(base_url: str, i: int) -> dict:
+    return {
+        "endpoint": f"{base_url}/api/dostk/chart",
+        "method": "POST",
+        "json": {"stk_cd": _code(i, False), "base_dt": "20250110", "upd_stkpc_tp": "1"},
+        "headers": {"api-id": "ka10081", "cont-yn": "N", "next-key": ""},
+    }
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def _sync_workload(target: str, base_url: str, session: KiwoomSession) -> Callable[[int], object]:
+    if target == "make_request":
+        return lambda i: make_request(**_raw_args(base_url, i))
+    if target == "make_request_pooled":
+        return lambda i: make_request(client=session.client, **_raw_args(base_url, i))
+    chart = Chart(base_url=base_url, session=session)
+    cached = target == "execute_cached"
+    return lambda i: chart.stock_daily_chart_request_ka10081(_code(i, cached), "20250110", "1")
+
+
+def _async_workload(target: str, base_url: str, session: KiwoomSession) -> Callable[[int], object]:
+    if target == "make_request_async":
+        return lambda i: make_request_async(client=session.async_client, **_raw_args(base_url, i))
+    chart = Chart(base_url=base_url, use_async=True, session=session)
+    return lambda i: chart.stock_daily_chart_request_ka10081(_code(i, False), "20250110", "1")
+
+
+def run_sync(call: Callable[[int], object], total: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+
+    def one(i: int) -> None:
+        start = time.perf_counter()
+        call(i)
+        latencies.append(time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    return latencies
+
+
+async def run_async(call: Callable[[int], object], total: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        # 고정된 수의 워커가 요청을 하나씩 가져가므로 동시에 진행 중인 요청은 최대 concurrency개
+        for i in counter:
+            start = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return latencies
+
+
+def bench_case(mock: MockKiwoom, base_url: str, target: str, concurrency: int, rows: int, total: int, warmup: int) -> Dict:
+    mock.page_size = mock.rows = rows
+    mock.reset()
+    response_cache = ResponseCache(ttls={"ka10081": 3600}) if target == "execute_cached" else None
+    session = KiwoomSession(max_connections=concurrency, max_keepalive_connections=concurrency, response_cache=response_cache)
+    try:
+        if target in ASYNC_TARGETS:
+            async def run() -> List[float]:
+                call = _async_workload(target, base_url, session)
+                await run_async(call, warmup, min(concurrency, max(warmup, 1)))
+                started = time.perf_counter()
+                result = await run_async(call, total, concurrency)
+                result.append(time.perf_counter() - started)
+                await session.aclose()
+                return result
+
+            latencies = asyncio.run(run())
+            elapsed = latencies.pop()
+        else:
+            call = _sync_workload(target, base_url, session)
+            run_sync(call, warmup, min(concurrency, max(warmup, 1)))
+            started = time.perf_counter()
+            latencies = run_sync(call, total, concurrency)
+            elapsed = time.perf_counter() - started
+    finally:
+        session.close()
+    latencies.sort()
+    return {
+        "name": f"{target}/c{concurrency}/r{rows}",
+        "target": target,
+        "concurrency": concurrency,
+        "rows": rows,
+        "requests": total,
+        "seconds": round(elapsed, 4),
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def compare(results: List[Dict], baseline: Dict, threshold: float) -> List[str]:
+    """Return the names of cases that regressed against the baseline"""
+    previous = {case["name"]: case for case in baseline.get("results", [])}
+    regressions = []
+    for case in results:
+        before = previous.get(case["name"])
+        if before is None:
+            case["status"] = "new"
+            continue
+        case["rps_change"] = round(case["rps"] / before["rps"] - 1, 4) if before["rps"] else 0.0
+        case["p99_change"] = round(case["p99_ms"] / before["p99_ms"] - 1, 4) if before["p99_ms"] else 0.0
+        regressed = case["rps_change"] < -threshold or case["p99_change"] > threshold
+        case["status"] = "REGRESSION" if regressed else "ok"
+        if regressed:
+            regressions.append(case["name"])
+    return regressions
+
+
+def _ints(text: str) -> List[int]:
+    return [int(value) for value in text.split(",") if value]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--targets", default=",".join(TARGETS))
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표로 구분한 동시성 수준")
+    parser.add_argument("--rows", default="1,100,900", help="쉼표로 구분한 응답 행 수 (응답 크기)")
+    parser.add_argument("--requests", type=int, default=500, help="항목당 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="목 서버 응답 지연")
+    parser.add_argument("--save", help="결과 JSON 저장 경로 (기준선)")
+    parser.add_argument("--compare", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀로 판정할 상대 변화율")
+    args = parser.parse_args()
+
+    targets = [target for target in args.targets.split(",") if target]
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+    baseline: Optional[Dict] = None
+    if args.compare:
+        # 측정 전에 확인해 기준선 없이 몇 분씩 돌고 나서야 실패하지 않게 함
+        try:
+            with open(args.compare, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            parser.error(f"baseline {args.compare} not found; create it first with --save {args.compare}")
+        except ValueError as e:
+            parser.error(f"baseline {args.compare} is not valid JSON: {e}")
+
+    mock = MockKiwoom(latency=args.latency_ms / 1000)
+    results = []
+    with mock.serve() as server:
+        print(f"{'case':<36}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for target in targets:
+            for concurrency in _ints(args.concurrency):
+                for rows in _ints(args.rows):
+                    case = bench_case(mock, server.url, target, concurrency, rows, args.requests, args.warmup)
+                    results.append(case)
+                    print(f"{case['name']:<36}{case['rps']:>10.0f}{case['p50_ms']:>10.2f}{case['p99_ms']:>10.2f}")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "httpx": httpx.__version__,
+            "json_backend": get_json_backend(),
+            "mock_latency_ms": args.latency_ms,
+        },
+        "results": results,
+    }
+
+    regressions: Optional[List[str]] = None
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        print()
+        print(f"{'case':<36}{'rps Δ':>10}{'p99 Δ':>10}  status")
+        for case in results:
+            if "rps_change" in case:
+                print(f"{case['name']:<36}{case['rps_change']:>+10.1%}{case['p99_change']:>+10.1%}  {case['status']}")
+            else:
+                print(f"{case['name']:<36}{'':>10}{'':>10}  {case['status']}")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    if baseline is not None and all(case["status"] == "new" for case in results):
+        print(f"\nNo case in {args.compare} matches this run; nothing was compared")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,56 @@
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any
+import asyncio
+import threading
 import time
 
-from kiwoom_rest_api.config import get_api_key, get_api_secret, TOKEN_URL
+from kiwoom_rest_api.config import (
+    get_api_key,
+    get_api_secret,
+    get_base_url,
+    TOKEN_URL,
+    TOKEN_REFRESH_MARGIN,
+    USE_TOKEN_CACHE,
+    TOKEN_CACHE_PATH,
+)
+from kiwoom_rest_api.auth.token_store import FileTokenStore, token_cache_key
 from kiwoom_rest_api.core.sync_client import make_request
+from kiwoom_rest_api.core.async_client import make_request_async
+from kiwoom_rest_api.core.hooks import logger
 
 class TokenManager:
     """Manages OAuth tokens for Kiwoom API"""
     
-    def __init__(self):
+    _EXPIRY_FORMAT = "%Y%m%d%H%M%S"
+    
+    def __init__(
+        self,
+        session=None,
+        refresh_margin: float = TOKEN_REFRESH_MARGIN,
+        token_store: Optional[FileTokenStore] = None,
+    ):
+        """
+        Args:
+            session (KiwoomSession, optional): 토큰 요청에 사용할 커넥션 풀 세션
+            refresh_margin (float): 만료 몇 초 전부터 미리 갱신할지 (기본값: 300초)
+            token_store (FileTokenStore, optional): 프로세스 간 공유 토큰 캐시.
+                생략 시 KIWOOM_USE_TOKEN_CACHE 또는 KIWOOM_TOKEN_CACHE_PATH가 설정되어 있으면 파일 캐시 사용
+        """
         self._access_token = None
         self._token_expiry = None
         self._refresh_token = None
         self._refresh_expiry = None
+        self.session = session
+        self.refresh_margin = refresh_margin
+        # 동시에 만료를 감지한 스레드/코루틴 중 하나만 토큰을 발급받도록 보장 (single-flight)
+        self._lock = threading.Lock()
+        self._async_task: Optional[asyncio.Task] = None
+        self._auto_refresh_thread: Optional[threading.Thread] = None
+        self._auto_refresh_stop = threading.Event()
+        if token_store is None and (USE_TOKEN_CACHE or TOKEN_CACHE_PATH):
+            token_store = FileTokenStore()
+        self.token_store = token_store
+        self._load_from_store()
     
     @property
     def access_token(self) -> Optional[str]:
@@ -20,19 +58,145 @@ class TokenManager:
         if self._is_access_token_valid():
             return self._access_token
         
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 이미 발급받았으면 재사용
+            if not self._is_access_token_valid():
+                self._acquire_token_shared(lambda: not self._is_access_token_valid())
+        return self._access_token
+    
+    def _acquire_token_shared(self, needed: Callable[[], bool]) -> None:
+        """Acquire a token under the cache file lock if needed() still holds after re-reading the cache (caller holds the lock)"""
+        if self.token_store is None:
+            self._acquire_token()
+            return
+        # 다른 프로세스가 먼저 발급받아 캐시에 저장했을 수 있음
+        with self.token_store.lock():
+            self._load_from_store()
+            if needed():
+                self._acquire_token()
+    
+    def _acquire_token(self) -> None:
+        """Refresh the token if possible, otherwise request a new one (caller holds the lock)"""
         # Try to refresh the token
         if self._can_refresh_token():
             self._refresh_access_token()
-            return self._access_token
+            return
         
         # Get a new token
         self._request_new_token()
-        return self._access_token
     
     def get_token(self) -> str:
         """Get the current access token (alias for access_token property)"""
         return self.access_token
     
+    async def get_token_async(self) -> str:
+        """Get the current access token without blocking the event loop
+        
+        Concurrent callers share a single in-flight token request. When the token
+        is still valid but inside refresh_margin, the current token is returned
+        and a refresh is started in the background.
+        """
+        if self._is_access_token_valid():
+            if self._expires_soon():
+                self._start_async_refresh()
+            return self._access_token
+        
+        await asyncio.shield(self._start_async_refresh())
+        return self._access_token
+    
+    def _start_async_refresh(self) -> "asyncio.Task":
+        """Return the in-flight refresh task for the running loop, starting one if needed"""
+        task = self._async_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._acquire_token_async())
+            # 백그라운드 갱신은 아무도 await하지 않을 수 있으므로 실패를 여기서 확인하고 기록
+            task.add_done_callback(self._on_async_refresh_done)
+            self._async_task = task
+        return task
+    
+    @staticmethod
+    def _on_async_refresh_done(task: "asyncio.Task") -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning("Token refresh failed: %r", error)
+    
+    async def _acquire_token_async(self) -> None:
+        # 같은 루프의 코루틴은 _start_async_refresh()의 태스크 하나를 공유하므로 여기까지 하나만 들어옴
+        loop = asyncio.get_running_loop()
+        if self.token_store is None:
+            response = await self._request_token_async()
+            await loop.run_in_executor(None, self._apply_token_response, response)
+            return
+        # 파일 캐시를 쓰면 스레드 락과 파일 잠금을 실행기 스레드 한 곳에서 잡고 풀며, 그 사이의 발급 요청도
+        # 같은 스레드에서 동기 클라이언트로 보냄. 잠금을 await 너머로 들고 있지 않으므로, 이벤트 루프 스레드에서
+        # 동기 access_token을 호출해도 발급이 끝날 때까지 기다릴 뿐 교착되지 않음
+        await loop.run_in_executor(None, self._acquire_token_if_stale)
+    
+    def _acquire_token_if_stale(self) -> None:
+        """Acquire a token under both locks unless the cache already has a fresh one (runs in an executor)"""
+        with self._lock:
+            self._acquire_token_shared(lambda: not self._is_access_token_valid() or self._expires_soon())
+    
+    async def _request_token_async(self) -> Dict[str, Any]:
+        data = self._refresh_token_data() if self._can_refresh_token() else self._new_token_data()
+        return await make_request_async(
+            endpoint=TOKEN_URL,
+            method="POST",
+            data=data,
+            client=self.session.async_client if self.session else None,
+        )
+    
+    def _apply_token_response(self, response: Dict[str, Any]) -> None:
+        with self._lock:
+            self._update_token_info(response)
+    
+    def start_auto_refresh(self) -> None:
+        """Refresh the token in a daemon thread refresh_margin seconds before it expires"""
+        if self._auto_refresh_thread is not None and self._auto_refresh_thread.is_alive():
+            return
+        self._auto_refresh_stop.clear()
+        self._auto_refresh_thread = threading.Thread(
+            target=self._auto_refresh_loop, name="kiwoom-token-refresh", daemon=True
+        )
+        self._auto_refresh_thread.start()
+    
+    def stop_auto_refresh(self) -> None:
+        """Stop the background refresh thread"""
+        self._auto_refresh_stop.set()
+        if self._auto_refresh_thread is not None:
+            self._auto_refresh_thread.join(timeout=5)
+            self._auto_refresh_thread = None
+    
+    def _auto_refresh_loop(self) -> None:
+        while not self._auto_refresh_stop.is_set():
+            if self._token_expiry is None:
+                wait = 0.0
+            else:
+                refresh_at = self._token_expiry - timedelta(seconds=self.refresh_margin)
+                wait = max(0.0, (refresh_at - datetime.now()).total_seconds())
+            if wait > 0 and self._auto_refresh_stop.wait(wait):
+                return
+            try:
+                with self._lock:
+                    if self._token_expiry is None or self._expires_soon():
+                        # 다른 프로세스가 이미 갱신했으면 캐시의 토큰을 사용
+                        self._acquire_token_shared(lambda: self._token_expiry is None or self._expires_soon())
+                # 만료가 refresh_margin보다 짧은 토큰을 받은 경우 갱신이 연달아 돌지 않도록 함
+                if self._expires_soon() and self._auto_refresh_stop.wait(10):
+                    return
+            except Exception:
+                # 일시적인 실패는 잠시 후 재시도 (요청 경로에서도 만료 시 다시 발급받음)
+                if self._auto_refresh_stop.wait(10):
+                    return
+    
+    def _expires_soon(self) -> bool:
+        """Check if the token is inside the proactive refresh window"""
+        if not self._token_expiry:
+            return True
+        return datetime.now() >= self._token_expiry - timedelta(seconds=self.refresh_margin)
+    
     def _is_access_token_valid(self) -> bool:
         """Check if the current access token is valid"""
         if not self._access_token or not self._token_expiry:
@@ -48,16 +212,28 @@ class TokenManager:
         
         return datetime.now() < self._refresh_expiry - timedelta(seconds=30)
     
+    def _new_token_data(self) -> Dict[str, Any]:
+        return {
+            "grant_type": "client_credentials",
+            "appkey": get_api_key(),
+            "secretkey": get_api_secret(),
+        }
+    
+    def _refresh_token_data(self) -> Dict[str, Any]:
+        return {
+            "grant_type": "refresh_token",
+            "refresh_token": self._refresh_token,
+            "appkey": get_api_key(),
+            "appsecret": get_api_secret(),
+        }
+    
     def _request_new_token(self) -> None:
         """Request a new access token"""
         response = make_request(
             endpoint=TOKEN_URL,
             method="POST",
-            data={
-                "grant_type": "client_credentials",
-                "appkey": get_api_key(),
-                "secretkey": get_api_secret(),
-            },
+            data=self._new_token_data(),
+            client=self.session.client if self.session else None,
         )
         
         self._update_token_info(response)
@@ -67,12 +243,8 @@ class TokenManager:
         response = make_request(
             endpoint=TOKEN_URL,
             method="POST",
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": self._refresh_token,
-                "appkey": get_api_key(),
-                "appsecret": get_api_secret(),
-            },
+            data=self._refresh_token_data(),
+            client=self.session.client if self.session else None,
         )
         
         self._update_token_info(response)
@@ -95,6 +267,53 @@ class TokenManager:
             
             if "refresh_token_expires_in" in token_response:
                 self._refresh_expiry = datetime.now() + timedelta(seconds=token_response["refresh_token_expires_in"])
+        
+        self._save_to_store()
+    
+    def _cache_key(self) -> str:
+        return token_cache_key(get_base_url(), get_api_key())
+    
+    def _load_from_store(self) -> None:
+        """Adopt a cached token if it is valid and newer than the one in memory"""
+        if self.token_store is None:
+            return
+        entry = self.token_store.load(self._cache_key())
+        if not entry or not entry.get("token") or not entry.get("expires_dt"):
+            return
+        try:
+            expiry = datetime.strptime(entry["expires_dt"], self._EXPIRY_FORMAT)
+        except (TypeError, ValueError):
+            return
+        if self._token_expiry is not None and expiry <= self._token_expiry:
+            return
+        refresh_expiry = None
+        if entry.get("refresh_token") and entry.get("refresh_expires_dt"):
+            try:
+                refresh_expiry = datetime.strptime(entry["refresh_expires_dt"], self._EXPIRY_FORMAT)
+            except (TypeError, ValueError):
+                # 손상된 항목은 캐시에 없는 것으로 취급
+                return
+        self._access_token = entry["token"]
+        self._token_expiry = expiry
+        if refresh_expiry is not None:
+            self._refresh_token = entry["refresh_token"]
+            self._refresh_expiry = refresh_expiry
+    
+    def _save_to_store(self) -> None:
+        if self.token_store is None or not self._access_token or not self._token_expiry:
+            return
+        entry = {
+            "token": self._access_token,
+            "expires_dt": self._token_expiry.strftime(self._EXPIRY_FORMAT),
+        }
+        if self._refresh_token and self._refresh_expiry:
+            entry["refresh_token"] = self._refresh_token
+            entry["refresh_expires_dt"] = self._refresh_expiry.strftime(self._EXPIRY_FORMAT)
+        try:
+            self.token_store.save(self._cache_key(), entry)
+        except OSError:
+            # 캐시 저장 실패는 토큰 사용에 영향을 주지 않음
+            pass
 
 # Convenience functions
 def get_access_token() -> str:
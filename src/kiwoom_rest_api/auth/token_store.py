@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from kiwoom_rest_api.config import TOKEN_CACHE_PATH
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+def default_cache_path() -> str:
+    """Return the token cache path (KIWOOM_TOKEN_CACHE_PATH or ~/.cache/kiwoom_rest_api/tokens.json)"""
+    if TOKEN_CACHE_PATH:
+        return TOKEN_CACHE_PATH
+    return os.path.join(os.path.expanduser("~"), ".cache", "kiwoom_rest_api", "tokens.json")
+
+def token_cache_key(base_url: str, app_key: str) -> str:
+    """Cache key for one app key on one server; the key itself is never written to disk"""
+    return hashlib.sha256(f"{base_url}|{app_key}".encode("utf-8")).hexdigest()[:32]
+
+class FileTokenStore:
+    """File-backed token cache shared by every process on a host
+
+    토큰은 JSON 파일 하나에 (서버, 앱키)별로 저장되며, 쓰기는 임시 파일 + os.replace로
+    원자적으로 수행됩니다. lock()은 프로세스 간 배타 잠금으로, TokenManager가 토큰을
+    발급받는 동안 다른 프로세스가 중복 발급하지 않도록 합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_cache_path()
+        self.lock_path = f"{self.path}.lock"
+        self._thread_lock = threading.Lock()
+
+    def _ensure_dir(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _read_all(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached token entry for key, if any"""
+        return self._read_all().get(key)
+
+    def save(self, key: str, entry: Dict[str, Any]) -> None:
+        """Atomically write the token entry for key"""
+        with self._thread_lock:
+            self._ensure_dir()
+            data = self._read_all()
+            data[key] = entry
+            fd, tmp_path = tempfile.mkstemp(prefix=".tokens-", dir=os.path.dirname(os.path.abspath(self.path)))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if os.name != "nt":
+                    os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock on the cache"""
+        self._ensure_dir()
+        with open(self.lock_path, "a+b") as f:
+            if os.name == "nt":
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK은 약 10초 후 실패하므로 잠금을 얻을 때까지 재시도
+                        time.sleep(0.1)
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -13,10 +13,69 @@ API_SECRET = os.environ.get("KIWOOM_API_SECRET", "")
 # Authentication
 TOKEN_URL = "/oauth2/token"
 AUTH_URL = "/oauth2/authorize"
+TOKEN_REFRESH_MARGIN = float(os.environ.get("KIWOOM_TOKEN_REFRESH_MARGIN", "300"))  # seconds before expiry
+
+# 프로세스 간 토큰 공유 캐시 (파일)
+USE_TOKEN_CACHE = os.environ.get("KIWOOM_USE_TOKEN_CACHE", "false").lower() == "true"
+TOKEN_CACHE_PATH = os.environ.get("KIWOOM_TOKEN_CACHE_PATH", "")
+
+# 로컬 차트 히스토리 저장소 (data.history.HistoryStore)
+HISTORY_PATH = os.environ.get("KIWOOM_HISTORY_PATH", "")
+
+# 종목 마스터 파일 (data.symbols.SymbolMaster)
+SYMBOLS_PATH = os.environ.get("KIWOOM_SYMBOLS_PATH", "")
 
 # Timeouts
 DEFAULT_TIMEOUT = 30.0  # seconds
 
+# Connection pool
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("KIWOOM_MAX_CONNECTIONS", "100"))
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("KIWOOM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+DEFAULT_KEEPALIVE_EXPIRY = float(os.environ.get("KIWOOM_KEEPALIVE_EXPIRY", "30.0"))  # seconds
+USE_HTTP2 = os.environ.get("KIWOOM_USE_HTTP2", "false").lower() == "true"
+
+# Rate limiting (requests per second)
+RATE_LIMIT_PER_SECOND = float(os.environ.get("KIWOOM_RATE_LIMIT_PER_SECOND", "5"))
+ORDER_RATE_LIMIT_PER_SECOND = float(os.environ.get("KIWOOM_ORDER_RATE_LIMIT_PER_SECOND", "5"))
+# 응답이 크고 서버 부하가 큰 차트/순위 조회는 api-id별로 더 낮은 한도 적용 (core.rate_limit.RateLimiter 기본값)
+CHART_RATE_LIMIT_PER_SECOND = float(os.environ.get("KIWOOM_CHART_RATE_LIMIT_PER_SECOND", "3"))
+RANKING_RATE_LIMIT_PER_SECOND = float(os.environ.get("KIWOOM_RANKING_RATE_LIMIT_PER_SECOND", "2"))
+
+# 차트 API (/api/dostk/chart: 종목 틱/분/일/주/월/년봉, 투자자기관별 차트, 업종 차트)
+CHART_API_IDS = frozenset({
+    "ka10060", "ka10064", "ka10079", "ka10080", "ka10081", "ka10082", "ka10083", "ka10094",
+    "ka20004", "ka20005", "ka20006", "ka20007", "ka20008", "ka20019",
+})
+# 순위정보 API (/api/dostk/rkinfo)
+RANKING_API_IDS = frozenset({
+    "ka10020", "ka10021", "ka10022", "ka10023", "ka10027", "ka10029", "ka10030", "ka10031",
+    "ka10032", "ka10033", "ka10034", "ka10035", "ka10036", "ka10037", "ka10038", "ka10039",
+    "ka10040", "ka10042", "ka10053", "ka10062", "ka10065", "ka10069", "ka10098", "ka90009",
+})
+DEFAULT_API_ID_RATE_LIMITS = {
+    **{api_id: CHART_RATE_LIMIT_PER_SECOND for api_id in CHART_API_IDS},
+    **{api_id: RANKING_RATE_LIMIT_PER_SECOND for api_id in RANKING_API_IDS},
+}
+
+# 재시도 (첫 요청 이후 최대 재시도 횟수, 주문 API는 안전한 경우에만 재시도)
+MAX_RETRIES = int(os.environ.get("KIWOOM_MAX_RETRIES", "2"))
+
+# 응답 캐시 메모리 상한 (바이트, core.cache.ResponseCache)
+CACHE_MAX_BYTES = int(os.environ.get("KIWOOM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# 주문 API (주식 주문 kt10000~kt10003, 신용 주문 kt10006~kt10009)
+ORDER_API_IDS = frozenset({
+    "kt10000", "kt10001", "kt10002", "kt10003",
+    "kt10006", "kt10007", "kt10008", "kt10009",
+})
+ORDER_RESOURCE_URLS = ("/api/dostk/ordr", "/api/dostk/crdordr")
+
+# 계좌 API (계좌별 잔고/체결/주문내역 등. 같은 요청이라도 계정마다 응답이 다름)
+ACCOUNT_RESOURCE_URLS = ("/api/dostk/acnt",)
+
+# JSON 디코더 (auto, orjson, msgspec, json)
+JSON_BACKEND = os.environ.get("KIWOOM_JSON_BACKEND", "auto").lower()
+
 # Environment setting
 USE_SANDBOX = os.environ.get("KIWOOM_USE_SANDBOX", "false").lower() == "true"
 
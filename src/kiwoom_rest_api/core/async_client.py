@@ -2,7 +2,9 @@ from typing import Any, Dict, Optional
 
 import httpx
 
+from kiwoom_rest_api.config import DEFAULT_TIMEOUT
 from kiwoom_rest_api.core.base import prepare_request_params, process_response_async
+from kiwoom_rest_api.core.hooks import instrumentation_enabled, emit_request, emit_response
 
 async def make_request_async(
     endpoint: str,
@@ -12,6 +14,7 @@ async def make_request_async(
     headers: Optional[Dict[str, Any]] = None,
     access_token: Optional[str] = None,
     timeout: Optional[float] = None,
+    client: Optional[httpx.AsyncClient] = None,
     **kwargs  # Add **kwargs
 ) -> Dict[str, Any]:
     """Make an asynchronous HTTP request to the Kiwoom API"""
@@ -34,16 +37,35 @@ async def make_request_async(
         # Remove 'data' if 'json' is being used to avoid conflicts in httpx
         request_params.pop("data", None)
 
-    async with httpx.AsyncClient() as client:
-        # This should return an httpx.Response object
-        response: httpx.Response = await client.request(
-            method=request_params["method"],
-            url=request_params["url"],
-            params=request_params.get("params"),
-            json=request_params.get("json"),
-            data=request_params.get("data"),
-            headers=request_params["headers"],
-            timeout=request_params["timeout"],
-        )
-
-    return await process_response_async(response)
+    # 공유 클라이언트(KiwoomSession)가 주어지면 커넥션을 재사용하고,
+    # 없으면 요청마다 일회용 클라이언트를 생성
+    if client is not None:
+        return await _send_async(client, request_params)
+
+    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as one_off_client:
+        return await _send_async(one_off_client, request_params)
+
+async def _send_async(client: httpx.AsyncClient, request_params: Dict[str, Any]) -> Dict[str, Any]:
+    request = client.build_request(
+        method=request_params["method"],
+        url=request_params["url"],
+        params=request_params.get("params"),
+        json=request_params.get("json"),
+        data=request_params.get("data"),
+        headers=request_params["headers"],
+        timeout=request_params["timeout"],
+    )
+
+    if not instrumentation_enabled():
+        return await process_response_async(await client.send(request))
+
+    event = emit_request(request)
+    response = None
+    try:
+        response = await client.send(request)
+        result = await process_response_async(response)
+    except Exception as e:
+        emit_response(event, response, e)
+        raise
+    emit_response(event, response)
+    return result
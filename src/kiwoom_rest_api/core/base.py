@@ -1,17 +1,19 @@
 from typing import Any, Dict, Optional, Union
-import json
 from urllib.parse import urljoin
 import httpx
-import inspect # Import inspect
 
-from kiwoom_rest_api.config import get_base_url, get_headers, DEFAULT_TIMEOUT
+from kiwoom_rest_api.config import get_base_url, get_headers
+from kiwoom_rest_api.core.json_codec import decode_json
+from kiwoom_rest_api.core.hooks import logger
 
 class APIError(Exception):
     """Custom exception for API errors"""
-    def __init__(self, status_code: int, message: str, error_data: dict = None):
+    def __init__(self, status_code: int, message: str, error_data: dict = None, headers: dict = None):
         self.status_code = status_code
         self.message = message
         self.error_data = error_data or {}
+        # 재시도 판단용 응답 헤더 (Retry-After 등)
+        self.headers = dict(headers) if headers else {}
         super().__init__(f"API Error (HTTP {status_code}): {message}")
 
     def __str__(self):
@@ -25,49 +27,47 @@ def make_url(endpoint: str) -> str:
     # Ensure endpoint starts with a forward slash
     if not endpoint.startswith('/'):
         endpoint = f"/{endpoint}"
-        
-    print("\n\n##  full url  ##\n\n", urljoin(get_base_url(), endpoint))
     
     return urljoin(get_base_url(), endpoint)
 
+def apply_exposed_headers(response: Any, response_json: Any) -> None:
+    """Copy the headers listed in access-control-expose-headers (cont-yn, next-key, ...) into the body"""
+    access_control_expose_headers = response.headers.get("access-control-expose-headers")
+    if access_control_expose_headers and isinstance(response_json, dict):
+        for header in access_control_expose_headers.split(","):
+            response_json[header] = response.headers.get(header)
+
 def process_response(response: Any) -> Dict[str, Any]:
     """Process API response and handle errors"""
     if not hasattr(response, 'status_code'):
         raise ValueError(f"Invalid response object: {response}")
     
     if 200 <= response.status_code < 300:
-        if not response.text:
+        # 텍스트로 디코딩하지 않고 응답 바이트를 바로 JSON 파싱
+        content = response.content
+        if not content:
             return {}
         
         try:
-            response_json = response.json()
-            
-            access_control_expose_headers = response.headers.get("access-control-expose-headers")
-            if access_control_expose_headers:
-                access_control_expose_headers = access_control_expose_headers.split(",")
-                
-                for header in access_control_expose_headers:
-                    response_json[header] = response.headers.get(header)
-                
-                return response_json
-                
-            return response_json
-        
-        except json.JSONDecodeError:
+            response_json = decode_json(content)
+        except ValueError:
             return {"content": response.text}
+        
+        apply_exposed_headers(response, response_json)
+        return response_json
     
     # Handle error responses
     error_message = "Unknown error"
     error_data = None
     
     try:
-        error_data = response.json()
+        error_data = decode_json(response.content)
         error_message = error_data.get("message", "Unknown error")
-    except (json.JSONDecodeError, AttributeError):
+    except (ValueError, AttributeError):
         if response.text:
             error_message = response.text
     
-    raise APIError(response.status_code, error_message, error_data)
+    raise APIError(response.status_code, error_message, error_data, response.headers)
 
 def prepare_request_params(
     endpoint: str,
@@ -112,7 +112,8 @@ def prepare_request_params(
         "url": url,
         "method": method,
         "headers": merged_headers,
-        "timeout": timeout or DEFAULT_TIMEOUT,
+        # 호출자가 지정하지 않으면 클라이언트(KiwoomSession 등)에 설정된 타임아웃을 사용
+        "timeout": timeout or httpx.USE_CLIENT_DEFAULT,
     }
     
     # 쿼리 파라미터 추가
@@ -130,94 +131,50 @@ def prepare_request_params(
 
 async def process_response_async(response: httpx.Response) -> Dict[str, Any]:
     if not isinstance(response, httpx.Response):
-        print("ERROR: process_response_async did not receive an httpx.Response object!")
         raise TypeError(f"Expected httpx.Response, but got {type(response)}")
 
-    # --- 추가 디버깅 ---
-    json_method = getattr(response, 'json', None)
-    is_json_coro = inspect.iscoroutinefunction(json_method)
-    print(f"DEBUG: inspect.iscoroutinefunction(response.json) = {is_json_coro}")
-    # --- 추가 디버깅 끝 ---
-
     try:
         # 성공(200) 응답 처리
         if response.status_code == 200:
+            # httpx 응답 본문은 이미 읽힌 상태이므로 await 없이 바이트를 바로 디코딩
             try:
-                # 여기서 여전히 TypeError 발생 가능성 있음
-                json_data = await response.json()
-                
-                access_control_expose_headers = response.headers.get("access-control-expose-headers")
-                if access_control_expose_headers:
-                    access_control_expose_headers = access_control_expose_headers.split(",")
-                    
-                    for header in access_control_expose_headers:
-                        json_data[header] = response.headers.get(header)
-                
-                
-                if isinstance(json_data, dict) and str(json_data.get("return_code")) != "0":
-                     error_message = json_data.get("return_msg", "Unknown API error message")
-                     raise APIError(response.status_code, error_message, json_data)
-                return json_data
-            except json.JSONDecodeError:
-                 # 여기서도 TypeError 발생 가능성 있음
-                 raw_text_content = await response.text()
-                 error_message = f"Failed to decode JSON response. Content: {raw_text_content[:200]}"
-                 raise APIError(response.status_code, error_message, {"raw_content": raw_text_content})
-            except TypeError as te: # await 실패 시
-                 print(f"ERROR: TypeError on SUCCESS path await: {te}")
-                 # await 없이 직접 접근 시도 (진단용)
-                 try:
-                    json_data = response.json() # await 없이 호출
-                     
-                       
-                    access_control_expose_headers = response.headers.get("access-control-expose-headers")
-                    if access_control_expose_headers:
-                        access_control_expose_headers = access_control_expose_headers.split(",")
-                        
-                        for header in access_control_expose_headers:
-                            json_data[header] = response.headers.get(header)
-                            
-                    if isinstance(json_data, dict) and str(json_data.get("return_code")) != "0":
-                        error_message = json_data.get("return_msg", "Unknown API error message")
-                        raise APIError(response.status_code, error_message, json_data)
-                    return json_data # 성공하면 반환
-                 except Exception as direct_err:
-                     print(f"ERROR: Direct access failed after TypeError: {direct_err}")
-                     raw_text_content = getattr(response, 'text', 'N/A') # text 속성 접근 시도
-                     raise APIError(response.status_code, f"TypeError processing SUCCESS response: {te}. Raw content: {raw_text_content[:200]}", {"raw_content": raw_text_content})
+                json_data = decode_json(response.content)
+            except ValueError:
+                raw_text_content = response.text
+                error_message = f"Failed to decode JSON response. Content: {raw_text_content[:200]}"
+                raise APIError(response.status_code, error_message, {"raw_content": raw_text_content})
+            
+            apply_exposed_headers(response, json_data)
+            
+            if isinstance(json_data, dict) and str(json_data.get("return_code")) != "0":
+                error_message = json_data.get("return_msg", "Unknown API error message")
+                raise APIError(response.status_code, error_message, json_data, response.headers)
+            return json_data
 
 
         # HTTP 에러(400 등) 처리
         else:
             error_message = f"HTTP Error {response.status_code}"
             error_data = {"status_code": response.status_code}
-            raw_text_content = "Could not retrieve error content"
 
-            # --- 진단: await 없이 text 속성 직접 접근 시도 ---
-            try:
-                if hasattr(response, 'text') and isinstance(response.text, str):
-                    print("DEBUG: Accessing response.text directly as attribute.")
-                    raw_text_content = response.text
-                    error_data["raw_content"] = raw_text_content
-                    error_message += f". Content: {raw_text_content[:500]}" # 내용 조금 더 보기
+            raw_text_content = response.text
+            if raw_text_content:
+                error_data["raw_content"] = raw_text_content
+                error_message += f". Content: {raw_text_content[:500]}" # 내용 조금 더 보기
 
-                    # 텍스트 내용으로 JSON 파싱 시도
-                    try:
-                        error_json = json.loads(raw_text_content)
+                # 본문이 JSON이면 msg1으로 에러 메시지 개선
+                try:
+                    error_json = decode_json(response.content)
+                except ValueError:
+                    logger.debug("Error response body is not JSON (HTTP %s)", response.status_code)
+                else:
+                    if isinstance(error_json, dict):
                         error_msg1 = error_json.get("msg1", "No msg1 found in error JSON")
-                        error_message = f"HTTP Error {response.status_code}: {error_msg1}" # 에러 메시지 개선
+                        error_message = f"HTTP Error {response.status_code}: {error_msg1}"
                         error_data.update(error_json)
-                    except json.JSONDecodeError:
-                        print("DEBUG: Error response body is not JSON.")
-                else:
-                     print("DEBUG: response.text is not a direct string attribute.")
-                     # 여기서 await response.text()를 시도하면 TypeError 발생 가능성 높음
-            except Exception as e_diag:
-                print(f"ERROR: Exception during diagnostic access of response text: {e_diag}")
-            # --- 진단 끝 ---
 
             # 최종 에러 발생
-            raise APIError(response.status_code, error_message, error_data)
+            raise APIError(response.status_code, error_message, error_data, response.headers)
 
     except httpx.RequestError as e:
         # 네트워크 관련 에러
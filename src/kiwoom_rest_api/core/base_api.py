@@ -1,6 +1,30 @@
-from typing import Optional
+import itertools
+import weakref
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
 from kiwoom_rest_api.core.sync_client import make_request
 from kiwoom_rest_api.core.async_client import make_request_async
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.core.pagination import PageWalker, iterate_pages, aiterate_pages
+from kiwoom_rest_api.core.retry import call_with_retry, call_with_retry_async
+
+# 토큰 관리자(인증 주체)별 고유 식별자. 세션을 공유하는 여러 계정이 서로의 응답을 받지 않도록
+# 요청 병합/응답 캐시 키에 포함됨 (id()는 객체가 사라지면 재사용될 수 있어 별도 번호를 부여)
+_auth_scopes: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+_scope_numbers = itertools.count(1)
+
+def auth_scope(token_manager: Any) -> str:
+    """Return a stable identifier for the credentials a token manager represents"""
+    if token_manager is None:
+        return ""
+    try:
+        scope = _auth_scopes.get(token_manager)
+        if scope is None:
+            scope = _auth_scopes.setdefault(token_manager, f"auth-{next(_scope_numbers)}")
+        return scope
+    except TypeError:
+        # weakref를 지원하지 않는 객체
+        return f"auth-id-{id(token_manager)}"
 
 class KiwoomBaseAPI:
     def __init__(
@@ -8,13 +32,39 @@ class KiwoomBaseAPI:
         base_url: str = None,
         token_manager=None,
         use_async: bool = False,
-        resource_url: str = ""
+        resource_url: str = "",
+        session: Optional[KiwoomSession] = None
     ):
         self.base_url = base_url
         self.token_manager = token_manager
         self.use_async = use_async
         self.resource_url = resource_url
         self._request_func = make_request_async if use_async else make_request
+        # 세션이 주어지지 않으면 인스턴스 전용 세션을 만들고 close() 시 함께 닫음
+        self._owns_session = session is None
+        self.session = session if session is not None else KiwoomSession()
+
+    def close(self) -> None:
+        """Close the connection pool if this instance owns it"""
+        if self._owns_session:
+            self.session.close()
+
+    async def aclose(self) -> None:
+        """Close the connection pool (async clients included) if this instance owns it"""
+        if self._owns_session:
+            await self.session.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     def _get_access_token(self) -> Optional[str]:
         if self.token_manager:
@@ -29,18 +79,65 @@ class KiwoomBaseAPI:
     def _make_request(self, method: str, url: str, **kwargs):
         headers = kwargs.pop("headers", {})
         headers["content-type"] = "application/json;charset=UTF-8"
-        if self.token_manager:
-            access_token = self._get_access_token()
-            headers["Authorization"] = f"Bearer {access_token}"
-        return make_request(endpoint=url, method=method, headers=headers, **kwargs)
+        api_id = headers.get("api-id")
+
+        def send():
+            # 재시도마다 요청 한도와 토큰을 다시 확인
+            if self.session.rate_limiter is not None:
+                self.session.rate_limiter.acquire(api_id, url)
+            if self.token_manager:
+                access_token = self._get_access_token()
+                headers["Authorization"] = f"Bearer {access_token}"
+            return make_request(endpoint=url, method=method, headers=headers, client=self.session.client, **kwargs)
+
+        breaker = self.session.circuit_breaker
+        if breaker is not None:
+            # 회로가 열려 있으면 요청 한도/토큰 확인 없이 즉시 CircuitOpenError
+            send = partial(breaker.call, api_id, url, send)
+        fetch = partial(call_with_retry, self.session.retry_policy, send, api_id, url)
+        cache = self.session.response_cache
+        if cache is not None and cache.ttl_for(api_id) > 0:
+            key = cache.make_key(
+                api_id, kwargs.get("json"), headers.get("cont-yn"), headers.get("next-key"), auth_scope(self.token_manager),
+            )
+            return cache.get_or_fetch(key, fetch)
+        return fetch()
 
     async def _make_request_async(self, method: str, url: str, **kwargs):
         headers = kwargs.pop("headers", {})
         headers["content-type"] = "application/json;charset=UTF-8"
-        if self.token_manager:
-            access_token = await self._get_access_token_async()
-            headers["Authorization"] = f"Bearer {access_token}"
-        return await make_request_async(endpoint=url, method=method, headers=headers, **kwargs)
+        api_id = headers.get("api-id")
+
+        async def send():
+            if self.session.rate_limiter is not None:
+                await self.session.rate_limiter.acquire_async(api_id, url)
+            if self.token_manager:
+                access_token = await self._get_access_token_async()
+                headers["Authorization"] = f"Bearer {access_token}"
+            return await make_request_async(
+                endpoint=url, method=method, headers=headers, client=self.session.async_client, **kwargs
+            )
+
+        breaker = self.session.circuit_breaker
+        if breaker is not None:
+            send = partial(breaker.call_async, api_id, url, send)
+        fetch = partial(call_with_retry_async, self.session.retry_policy, send, api_id, url)
+        coalescer = self.session.coalescer
+        if coalescer is not None and coalescer.applies_to(api_id, url):
+            # 동일한 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 사용
+            coalesce_key = coalescer.make_key(
+                api_id, url, kwargs.get("json"), headers.get("cont-yn"), headers.get("next-key"),
+                auth_scope(self.token_manager),
+            )
+            fetch = partial(coalescer.run, coalesce_key, fetch)
+
+        cache = self.session.response_cache
+        if cache is not None and cache.ttl_for(api_id) > 0:
+            key = cache.make_key(
+                api_id, kwargs.get("json"), headers.get("cont-yn"), headers.get("next-key"), auth_scope(self.token_manager),
+            )
+            return await cache.get_or_fetch_async(key, fetch)
+        return await fetch()
 
     def _execute_request(self, method: str, resource_url: str = None, **kwargs):
         # resource_url이 제공되면 임시로 사용, 아니면 기본값 사용
@@ -49,3 +146,62 @@ class KiwoomBaseAPI:
         if self.use_async:
             return self._make_request_async(method, url, **kwargs)
         return self._make_request(method, url, **kwargs)
+
+    def paginate(
+        self,
+        request_method: Callable[..., Any],
+        *args,
+        list_key: Optional[str] = None,
+        rows: bool = False,
+        max_pages: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        stop_date: Optional[str] = None,
+        date_key: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """연속조회(cont-yn/next-key)를 따라가며 페이지 또는 행을 순회합니다.
+
+        Args:
+            request_method: 이 인스턴스의 API 메서드 (예: chart.stock_daily_chart_request_ka10081)
+            *args, **kwargs: request_method에 전달할 인자
+            list_key (str, optional): 행 리스트 필드명 (예: "stk_dt_pole_chart_qry"). 생략 시 자동 탐지
+            rows (bool): True이면 페이지 대신 리스트의 행을 하나씩 반환
+            max_pages (int, optional): 최대 요청 페이지 수
+            max_rows (int, optional): 최대 반환 행 수
+            stop_date (str, optional): 이 날짜(YYYYMMDD...)보다 오래된 행이 나오면 중단
+            date_key (str, optional): 날짜 필드명. 생략 시 dt, cntr_tm 등에서 자동 탐지
+
+        Example:
+            >>> for row in chart.paginate(chart.stock_daily_chart_request_ka10081,
+            ...                           stk_cd="005930", base_dt="20250101", upd_stkpc_tp="1",
+            ...                           rows=True, stop_date="20240101"):
+            ...     print(row["dt"], row["cur_prc"])
+        """
+        if self.use_async:
+            raise RuntimeError("use_async=True 인스턴스에서는 paginate_async()를 사용하세요")
+        walker = PageWalker(list_key, max_pages, max_rows, stop_date, date_key)
+        return iterate_pages(request_method, args, kwargs, walker, rows=rows)
+
+    def paginate_async(
+        self,
+        request_method: Callable[..., Any],
+        *args,
+        list_key: Optional[str] = None,
+        rows: bool = False,
+        max_pages: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        stop_date: Optional[str] = None,
+        date_key: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """paginate()의 비동기 버전 (use_async=True 인스턴스 전용)
+
+        Example:
+            >>> async for page in chart.paginate_async(chart.stock_daily_chart_request_ka10081,
+            ...                                        "005930", "20250101", "1", max_pages=3):
+            ...     print(len(page["stk_dt_pole_chart_qry"]))
+        """
+        if not self.use_async:
+            raise RuntimeError("paginate_async()는 use_async=True 인스턴스에서만 사용할 수 있습니다")
+        walker = PageWalker(list_key, max_pages, max_rows, stop_date, date_key)
+        return aiterate_pages(request_method, args, kwargs, walker, rows=rows)
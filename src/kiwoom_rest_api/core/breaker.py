@@ -0,0 +1,282 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.hooks import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 장애로 보는 HTTP 상태 (429는 요청 한도 초과이므로 서버 장애로 보지 않음)
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+CircuitKey = Tuple[str, str]
+StateListener = Callable[[str, str, str], Any]
+
+class CircuitOpenError(Exception):
+    """Raised without sending the request while a circuit is open
+
+    retry_after는 다음 시험(half-open) 요청이 허용되기까지 남은 초입니다.
+    """
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open for {key}; retry in {retry_after:.1f}s")
+
+# 요청 하나의 실패로 보고, 여러 요청을 모으는 호출자가 그 요청만 건너뛸 수 있는 오류
+REQUEST_ERRORS = (APIError, CircuitOpenError, httpx.TransportError)
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "probes", "probe_successes", "trips")
+
+    def __init__(self):
+        self.state = CLOSED
+        # (시각, 실패 여부). window 초보다 오래된 항목은 기록할 때마다 버림
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.trips = 0
+
+class CircuitBreaker:
+    """Fail fast on resource URLs (optionally per api-id) that keep failing
+
+    window초 동안 min_requests개 이상의 요청 중 실패 비율이 failure_rate 이상이면 회로를 엽니다(open).
+    열린 동안에는 요청을 보내지 않고 즉시 CircuitOpenError를 발생시키며, open_duration초가 지나면
+    half_open 상태에서 최대 half_open_max_calls개의 시험 요청만 보냅니다. 시험 요청이
+    success_threshold번 성공하면 다시 닫히고(closed), 하나라도 실패하면 다시 열립니다.
+
+    실패로 보는 결과: 네트워크 오류/타임아웃(httpx.TransportError)과 HTTP 500/502/503/504.
+    요청 한도 초과(429)나 return_code 거절은 서버가 응답한 것이므로 성공으로 봅니다.
+    응답 없이 멈춘 요청은 KiwoomSession의 timeout이 지나야 실패로 집계되므로 세션 timeout을 짧게 두세요.
+
+    Args:
+        per_api_id: True이면 resource_url과 api-id 조합마다 별도 회로 (예: /api/dostk/rkinfo의 ka10027만 차단)
+        exclude_resource_urls: 차단하지 않을 경로 (예: 주문 경로를 항상 통과시키려면 ORDER_RESOURCE_URLS)
+        on_state_change: 상태가 바뀔 때 (key, 이전 상태, 새 상태)로 호출
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_rate=0.5, min_requests=10, open_duration=15.0)
+        >>> session = KiwoomSession(circuit_breaker=breaker, timeout=5.0)
+        >>> breaker.states()
+        {'/api/dostk/rkinfo': {'state': 'open', 'retry_after': 12.3, ...}}
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 30.0,
+        open_duration: float = 15.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        per_api_id: bool = False,
+        failure_status_codes: Iterable[int] = FAILURE_STATUS_CODES,
+        exclude_resource_urls: Iterable[str] = (),
+        on_state_change: Optional[StateListener] = None,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        self.failure_rate = failure_rate
+        self.min_requests = max(1, min_requests)
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.success_threshold = max(1, success_threshold)
+        self.per_api_id = per_api_id
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self.exclude_resource_urls = tuple(exclude_resource_urls)
+        self.on_state_change = on_state_change
+        self._circuits: Dict[CircuitKey, _Circuit] = {}
+        self._paths: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def key_for(self, api_id: Optional[str], url: str) -> Optional[CircuitKey]:
+        """Return the circuit key for a request, or None if it bypasses the breaker"""
+        path = self._paths.get(url)
+        if path is None:
+            path = urlsplit(url).path or url
+            self._paths[url] = path
+        if self.exclude_resource_urls and path.endswith(self.exclude_resource_urls):
+            return None
+        return (path, (api_id or "") if self.per_api_id else "")
+
+    def is_failure(self, error: Optional[BaseException]) -> bool:
+        if error is None:
+            return False
+        if isinstance(error, httpx.TransportError):
+            return True
+        return isinstance(error, APIError) and error.status_code in self.failure_status_codes
+
+    def _transition(self, key: CircuitKey, circuit: _Circuit, state: str, now: float) -> Optional[Tuple[str, str, str]]:
+        # 호출자가 self._lock을 잡고 있음. 알림은 잠금 밖에서 보내도록 (key, 이전, 새 상태)를 반환
+        previous = circuit.state
+        if previous == state:
+            return None
+        circuit.state = state
+        circuit.probes = 0
+        circuit.probe_successes = 0
+        if state == OPEN:
+            circuit.opened_at = now
+            circuit.trips += 1
+        elif state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = 0
+        return _format_key(key), previous, state
+
+    def _notify(self, change: Optional[Tuple[str, str, str]]) -> None:
+        if change is None:
+            return
+        key, previous, state = change
+        log = logger.warning if state == OPEN else logger.info
+        log("Circuit %s: %s -> %s", key, previous, state)
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(key, previous, state)
+            except Exception:
+                logger.exception("Circuit breaker listener %r failed", self.on_state_change)
+
+    def before(self, api_id: Optional[str], url: str) -> Optional[CircuitKey]:
+        """Admit a request or raise CircuitOpenError; returns the key to pass to record()"""
+        key = self.key_for(api_id, url)
+        if key is None:
+            return None
+        change = None
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+            if circuit.state != CLOSED:
+                now = time.monotonic()
+                if circuit.state == OPEN:
+                    remaining = circuit.opened_at + self.open_duration - now
+                    if remaining > 0:
+                        raise CircuitOpenError(_format_key(key), remaining)
+                    change = self._transition(key, circuit, HALF_OPEN, now)
+                if circuit.probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(_format_key(key), 0.0)
+                circuit.probes += 1
+        self._notify(change)
+        return key
+
+    def record(self, key: Optional[CircuitKey], error: Optional[BaseException] = None, completed: bool = True) -> None:
+        """Record the outcome of an admitted request
+
+        completed=False(취소 등)이면 결과를 세지 않고 half-open 시험 슬롯만 반환합니다.
+        """
+        if key is None:
+            return
+        failed = self.is_failure(error)
+        now = time.monotonic()
+        change = None
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                # 요청 도중 reset()된 회로
+                return
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if not completed:
+                    return
+                if failed:
+                    change = self._transition(key, circuit, OPEN, now)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.success_threshold:
+                        change = self._transition(key, circuit, CLOSED, now)
+            elif circuit.state == CLOSED and completed:
+                outcomes = circuit.outcomes
+                outcomes.append((now, failed))
+                circuit.failures += failed
+                cutoff = now - self.window
+                while outcomes and outcomes[0][0] < cutoff:
+                    circuit.failures -= outcomes.popleft()[1]
+                if (
+                    failed
+                    and len(outcomes) >= self.min_requests
+                    and circuit.failures >= self.failure_rate * len(outcomes)
+                ):
+                    change = self._transition(key, circuit, OPEN, now)
+        self._notify(change)
+
+    def call(self, api_id: Optional[str], url: str, send: Callable[[], Any]) -> Any:
+        """Run send() through the breaker"""
+        key = self.before(api_id, url)
+        try:
+            result = send()
+        except Exception as e:
+            self.record(key, e)
+            raise
+        except BaseException:
+            self.record(key, completed=False)
+            raise
+        self.record(key)
+        return result
+
+    async def call_async(self, api_id: Optional[str], url: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of call(); a cancelled request is not counted as a failure"""
+        key = self.before(api_id, url)
+        try:
+            result = await send()
+        except Exception as e:
+            self.record(key, e)
+            raise
+        except BaseException:
+            self.record(key, completed=False)
+            raise
+        self.record(key)
+        return result
+
+    def state(self, resource_url: str, api_id: Optional[str] = None) -> str:
+        """Return "closed", "open" or "half_open" for a resource URL (and api-id when per_api_id)"""
+        key = self.key_for(api_id, resource_url)
+        with self._lock:
+            circuit = self._circuits.get(key) if key is not None else None
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() >= circuit.opened_at + self.open_duration:
+                # 다음 요청이 시험 요청으로 허용됨
+                return HALF_OPEN
+            return circuit.state
+
+    def states(self) -> Dict[str, Dict[str, Any]]:
+        """Return a snapshot of every circuit that has seen traffic"""
+        now = time.monotonic()
+        result = {}
+        with self._lock:
+            for key, circuit in sorted(self._circuits.items()):
+                cutoff = now - self.window
+                recent = [failed for at, failed in circuit.outcomes if at >= cutoff]
+                retry_after = 0.0
+                if circuit.state == OPEN:
+                    retry_after = max(0.0, circuit.opened_at + self.open_duration - now)
+                result[_format_key(key)] = {
+                    "state": circuit.state,
+                    "requests": len(recent),
+                    "failures": sum(recent),
+                    "failure_rate": sum(recent) / len(recent) if recent else 0.0,
+                    "retry_after": retry_after,
+                    "trips": circuit.trips,
+                }
+        return result
+
+    def reset(self, resource_url: Optional[str] = None, api_id: Optional[str] = None) -> None:
+        """Close one circuit (or all of them) and forget its history"""
+        with self._lock:
+            if resource_url is None:
+                self._circuits.clear()
+                return
+            key = self.key_for(api_id, resource_url)
+            self._circuits.pop(key, None)
+
+def _format_key(key: CircuitKey) -> str:
+    path, api_id = key
+    return f"{path} {api_id}" if api_id else path
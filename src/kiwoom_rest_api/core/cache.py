@@ -0,0 +1,212 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from kiwoom_rest_api.config import CACHE_MAX_BYTES
+from kiwoom_rest_api.core.hooks import logger
+from kiwoom_rest_api.core.json_codec import decode_json, encode_json
+
+# api-id별 기본 TTL(초). 자주 바뀌지 않는 목록/기본정보 조회
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "ka10099": 3600.0,   # 종목정보 리스트
+    "ka10100": 3600.0,   # 종목정보 조회
+    "ka10101": 86400.0,  # 업종코드 리스트
+    "ka10102": 86400.0,  # 회원사 리스트
+    "ka90001": 300.0,    # 테마그룹별
+    "ka90002": 300.0,    # 테마구성종목
+}
+
+CacheKey = Tuple[str, str, str, str, str]
+
+class _Entry:
+    __slots__ = ("data", "fresh_until", "stale_until", "refreshing")
+
+    def __init__(self, data: bytes, fresh_until: float, stale_until: float):
+        self.data = data
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.refreshing = False
+
+class ResponseCache:
+    """In-process LRU cache of API responses keyed by (api-id, request body, cont-yn, next-key, auth scope)
+
+    TTL이 지정된 api-id만 캐시합니다. 같은 세션을 여러 계정(토큰 관리자)이 공유해도 인증 범위(scope)가
+    키에 포함되므로 한 계정의 응답이 다른 계정에 반환되지 않습니다. 응답은 JSON 바이트로 저장되어 메모리 사용량을 정확히 셀 수 있고,
+    꺼낼 때마다 새 dict로 디코딩되므로 호출자가 결과를 수정해도 캐시가 오염되지 않습니다.
+
+    TTL이 지난 뒤 stale_ttl 동안은 만료된 응답을 즉시 반환하면서 백그라운드에서 한 번만 갱신합니다
+    (stale-while-revalidate). 그 이후에는 일반 미스처럼 요청이 끝날 때까지 기다립니다.
+
+    Args:
+        ttls: api-id → TTL(초). 기본값 DEFAULT_CACHE_TTLS
+        default_ttl: ttls에 없는 api-id의 TTL. 0이면 캐시하지 않음
+        stale_ttl: TTL 이후 만료된 응답을 제공할 수 있는 시간(초)
+        max_bytes: 저장된 응답 바이트 합계 상한. 넘으면 가장 오래 사용되지 않은 항목부터 제거
+        max_entries: 항목 수 상한 (선택)
+
+    Example:
+        >>> session = KiwoomSession(response_cache=ResponseCache(ttls={**DEFAULT_CACHE_TTLS, "ka10001": 5}))
+        >>> session.response_cache.stats()
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        stale_ttl: float = 60.0,
+        max_bytes: int = CACHE_MAX_BYTES,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._tasks: set = set()
+        self.size_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+
+    def ttl_for(self, api_id: Optional[str]) -> float:
+        return self.ttls.get(api_id or "", self.default_ttl)
+
+    @staticmethod
+    def make_key(
+        api_id: str, body: Any, cont_yn: Optional[str] = "N", next_key: Optional[str] = "", scope: str = "",
+    ) -> CacheKey:
+        body_key = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+        return (api_id, body_key, cont_yn or "N", next_key or "", scope)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current memory use"""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "entries": len(self._entries),
+            "bytes": self.size_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def invalidate(self, api_id: Optional[str] = None) -> None:
+        """Drop every entry of one api-id, or everything when api_id is None"""
+        if api_id is None:
+            self.clear()
+            return
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == api_id]:
+                self.size_bytes -= len(self._entries.pop(key).data)
+
+    def _lookup(self, key: CacheKey) -> Tuple[Optional[bytes], bool]:
+        """Return (data or None, whether the caller should start a background refresh)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self.hits += 1
+                return entry.data, False
+            self.stale_hits += 1
+            # 갱신은 항목당 하나만 진행
+            if entry.refreshing:
+                return entry.data, False
+            entry.refreshing = True
+            return entry.data, True
+
+    def _store(self, key: CacheKey, result: Any, ttl: float) -> None:
+        # 오류 응답(return_code != 0)은 캐시하지 않음
+        if not isinstance(result, dict) or str(result.get("return_code", 0)) != "0":
+            self._release(key)
+            return
+        data = encode_json(result)
+        if len(data) > self.max_bytes:
+            self._release(key)
+            return
+        now = time.monotonic()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= len(previous.data)
+            self._entries[key] = _Entry(data, now + ttl, now + ttl + self.stale_ttl)
+            self.size_bytes += len(data)
+            while self._entries and (
+                self.size_bytes > self.max_bytes
+                or (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted.data)
+                self.evictions += 1
+
+    def _release(self, key: CacheKey) -> None:
+        # 갱신 실패 시 다음 조회에서 다시 갱신을 시도할 수 있도록 표시 해제
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    def get_or_fetch(self, key: CacheKey, fetch: Callable[[], Any]) -> Any:
+        """Return the cached response for key, calling fetch() on a miss"""
+        ttl = self.ttl_for(key[0])
+        data, refresh = self._lookup(key)
+        if refresh:
+            thread = threading.Thread(target=self._refresh, args=(key, fetch, ttl), daemon=True)
+            thread.start()
+        if data is not None:
+            return decode_json(data)
+        result = fetch()
+        self._store(key, result, ttl)
+        return result
+
+    def _refresh(self, key: CacheKey, fetch: Callable[[], Any], ttl: float) -> None:
+        try:
+            result = fetch()
+        except Exception as e:
+            logger.debug("Background cache refresh for %s failed: %r", key[0], e)
+            self._release(key)
+            return
+        self.refreshes += 1
+        self._store(key, result, ttl)
+
+    async def get_or_fetch_async(self, key: CacheKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of get_or_fetch; stale entries are refreshed in a background task"""
+        ttl = self.ttl_for(key[0])
+        data, refresh = self._lookup(key)
+        if refresh:
+            task = asyncio.ensure_future(self._refresh_async(key, fetch, ttl))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if data is not None:
+            return decode_json(data)
+        result = await fetch()
+        self._store(key, result, ttl)
+        return result
+
+    async def _refresh_async(self, key: CacheKey, fetch: Callable[[], Awaitable[Any]], ttl: float) -> None:
+        try:
+            result = await fetch()
+        except Exception as e:
+            logger.debug("Background cache refresh for %s failed: %r", key[0], e)
+            self._release(key)
+            return
+        self.refreshes += 1
+        self._store(key, result, ttl)
@@ -0,0 +1,252 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import IO, Any, ContextManager, Deque, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.core.hooks import ResponseEvent, add_response_hook, logger, remove_response_hook
+from kiwoom_rest_api.core.json_codec import decode_json, encode_json
+from kiwoom_rest_api.core.session import KiwoomSession
+
+# 토큰 발급/폐기 요청은 앱키·시크릿과 토큰이 담겨 있으므로 기록하지 않고, 재생 시에는 가짜 토큰으로 응답
+AUTH_PATH_PREFIX = "/oauth2/"
+
+# 재생에 필요 없는 전송 계층 응답 헤더 (본문은 디코딩된 상태로 저장되므로 길이/인코딩도 제외)
+_DROP_HEADERS = frozenset({
+    "date", "server", "connection", "keep-alive", "transfer-encoding", "content-length", "content-encoding",
+    "set-cookie", "strict-transport-security",
+})
+
+CassetteKey = Tuple[str, str, str, str, str, str]
+
+class CassetteMiss(LookupError):
+    """Raised when replay finds no (remaining) recorded response for a request"""
+
+def _open(path: str, mode: str) -> IO[bytes]:
+    # .gz 경로는 gzip 멤버를 이어 붙이는 방식으로 추가 기록 (gzip.open은 여러 멤버를 연속으로 읽음)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+def _canonical_body(body: Any) -> str:
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    if not body:
+        return ""
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    except ValueError:
+        return body
+
+def make_key(method: str, path: str, api_id: Optional[str], body: Any, cont_yn: Optional[str], next_key: Optional[str]) -> CassetteKey:
+    """Match key: host and access token are ignored so recordings replay against any base URL"""
+    return (method.upper(), path, api_id or "", _canonical_body(body), cont_yn or "", next_key or "")
+
+def read_cassette(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield recorded entries in order, skipping a truncated trailing line"""
+    with _open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield decode_json(line)
+            except ValueError:
+                # 기록 중 프로세스가 종료되어 마지막 줄이 잘린 경우
+                logger.warning("Skipping unreadable cassette entry in %s", path)
+
+class CassetteRecorder:
+    """Append every request/response pair passing through make_request(_async) to a cassette file
+
+    응답 훅으로 동작하므로 세션 공유 여부, 동기/비동기와 관계없이 모든 호출이 기록됩니다.
+    한 줄에 하나의 JSON 항목(api-id, 요청 본문, cont-yn/next-key, 상태 코드, 응답 헤더/본문, 요청 시각, 지연)을
+    추가만 하므로 기록 도중 종료되어도 앞선 항목은 그대로 남습니다. 경로가 .gz로 끝나면 gzip으로 압축합니다
+    (gzip은 close() 시점에 디스크에 반영됨).
+
+    Example:
+        >>> with CassetteRecorder("20250110.jsonl.gz"):
+        ...     run_strategy(chart, account)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> "CassetteRecorder":
+        with self._lock:
+            if self._file is None:
+                self._file = _open(self.path, "ab")
+                add_response_hook(self.record)
+        return self
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                remove_response_hook(self.record)
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "CassetteRecorder":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def record(self, event: ResponseEvent) -> None:
+        request = event.request.http_request
+        response = event.http_response
+        if request is None or response is None or request.url.path.startswith(AUTH_PATH_PREFIX):
+            return
+        entry = {
+            "time": event.request.start_time,
+            "latency": round(event.latency, 6),
+            "method": request.method,
+            "path": request.url.path,
+            "api_id": request.headers.get("api-id", ""),
+            "cont_yn": request.headers.get("cont-yn", ""),
+            "next_key": request.headers.get("next-key", ""),
+            "request": request.content.decode("utf-8", "replace"),
+            "status": response.status_code,
+            "headers": {key: value for key, value in response.headers.items() if key.lower() not in _DROP_HEADERS},
+            "response": response.content.decode("utf-8", "replace"),
+        }
+        line = encode_json(entry) + b"\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            if not self.path.endswith(".gz"):
+                self._file.flush()
+            self.records += 1
+
+class CassettePlayer:
+    """Serve recorded responses back through an httpx transport, with no network
+
+    요청은 (메서드, 경로, api-id, 본문, cont-yn, next-key)로 매칭되며, 같은 요청이 여러 번 기록되어 있으면
+    (장중 반복 조회 등) 기록된 순서대로 하나씩 돌려줍니다. 남은 응답이 없으면 CassetteMiss를 발생시키고,
+    repeat=True이면 마지막 응답을 계속 돌려줍니다.
+
+    Args:
+        path: CassetteRecorder로 기록한 파일
+        speed: None이면 기다리지 않고 즉시 응답(최대 속도). 1.0이면 기록 당시의 요청 간격과 지연을 재현하고,
+            10.0이면 10배 빠르게 재현
+        repeat: 소진된 요청에 마지막 응답을 다시 돌려줄지 여부
+
+    토큰 발급 요청도 재생 세션으로 보내야 네트워크에 나가지 않으므로, TokenManager는 token_manager()로 만들거나
+    같은 세션을 넘겨 만들어야 합니다 (세션 없이 만든 TokenManager는 실제 서버에서 토큰을 발급받습니다).
+
+    Example:
+        >>> player = CassettePlayer("20250110.jsonl.gz")
+        >>> session = player.session()
+        >>> chart = Chart(base_url="https://api.kiwoom.com", token_manager=player.token_manager(session), session=session)
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = None, repeat: bool = False):
+        self.path = path
+        self.speed = speed
+        self.repeat = repeat
+        self._entries: Dict[CassetteKey, Deque[Dict[str, Any]]] = {}
+        self._last: Dict[CassetteKey, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._first_time: Optional[float] = None
+        self._origin: Optional[float] = None
+        self.served = 0
+        self.total = 0
+        for entry in read_cassette(path):
+            key = make_key(entry["method"], entry["path"], entry["api_id"], entry["request"], entry["cont_yn"], entry["next_key"])
+            self._entries.setdefault(key, deque()).append(entry)
+            if self._first_time is None or entry["time"] < self._first_time:
+                self._first_time = entry["time"]
+            self.total += 1
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return sum(len(queue) for queue in self._entries.values())
+
+    def _next(self, request: httpx.Request) -> Tuple[httpx.Response, float]:
+        # (응답, 응답을 내보낼 monotonic 시각)
+        if request.url.path.startswith(AUTH_PATH_PREFIX):
+            return _token_response(), 0.0
+        key = make_key(
+            request.method, request.url.path, request.headers.get("api-id"), request.content,
+            request.headers.get("cont-yn"), request.headers.get("next-key"),
+        )
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                entry = queue.popleft()
+                self._last[key] = entry
+                self.served += 1
+            elif self.repeat and key in self._last:
+                entry = self._last[key]
+            else:
+                raise CassetteMiss(f"No recorded response for {key[0]} {key[1]} api-id={key[2]} body={key[3]}")
+            if self._origin is None:
+                self._origin = time.monotonic()
+        response = httpx.Response(entry["status"], headers=entry["headers"], content=entry["response"].encode("utf-8"))
+        if not self.speed:
+            return response, 0.0
+        offset = (entry["time"] - (self._first_time or entry["time"]) + entry["latency"]) / self.speed
+        return response, self._origin + offset
+
+    def transport(self) -> httpx.MockTransport:
+        """Sync replay transport for KiwoomSession(transport=...)"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            response, due = self._next(request)
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            return response
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Async replay transport for KiwoomSession(async_transport=...)"""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            response, due = self._next(request)
+            wait = due - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return response
+
+        return httpx.MockTransport(handler)
+
+    def session(self, **kwargs: Any) -> KiwoomSession:
+        """Return a KiwoomSession whose sync and async clients replay this cassette"""
+        return KiwoomSession(transport=self.transport(), async_transport=self.async_transport(), **kwargs)
+
+    def token_manager(self, session: Optional[KiwoomSession] = None) -> TokenManager:
+        """Return a TokenManager that gets fake replay tokens through session (a new player session if omitted)"""
+        # 가짜 토큰이 공유 토큰 캐시(KIWOOM_USE_TOKEN_CACHE)에 저장되거나 캐시의 실제 토큰이 쓰이지 않도록 캐시를 끔
+        return TokenManager(session=session or self.session(), token_store=_ReplayTokenStore())
+
+class _ReplayTokenStore:
+    """Token store that never reads or writes the shared cache"""
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    def save(self, key: str, entry: Dict[str, Any]) -> None:
+        pass
+
+    def lock(self) -> ContextManager[None]:
+        return nullcontext()
+
+def _token_response() -> httpx.Response:
+    expires_dt = (datetime.now() + timedelta(hours=24)).strftime("%Y%m%d%H%M%S")
+    return httpx.Response(
+        200,
+        json={"expires_dt": expires_dt, "token_type": "bearer", "token": "cassette-replay", "return_code": 0,
+              "return_msg": "정상적으로 처리되었습니다"},
+    )
@@ -0,0 +1,82 @@
+import asyncio
+import copy
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from kiwoom_rest_api.config import ACCOUNT_RESOURCE_URLS, ORDER_API_IDS, ORDER_RESOURCE_URLS
+
+CoalesceKey = Tuple[int, str, str, str, str, str, str]
+
+class RequestCoalescer:
+    """Share one in-flight async request among identical concurrent callers
+
+    같은 이벤트 루프에서 인증 주체(scope), api-id, URL, JSON 본문, cont-yn/next-key가 모두 같은 요청이 진행 중이면
+    새 요청을 보내지 않고 진행 중인 요청의 결과를 함께 받습니다. 여러 호출자가 합쳐진 결과는 호출자마다
+    깊은 복사본(행 리스트 포함)이 반환되고, 혼자 보낸 요청은 복사 없이 그대로 반환됩니다. 주문 API는 같은 내용이라도 별개의 주문이므로, 계좌 API는 계정별 데이터이므로 기본적으로 합치지 않습니다.
+
+    공유 요청은 별도 태스크로 실행되므로, 기다리던 호출자 하나가 취소되어도 나머지는 영향을 받지 않습니다.
+    """
+
+    def __init__(
+        self,
+        exclude_api_ids: Iterable[str] = ORDER_API_IDS,
+        exclude_resource_urls: Iterable[str] = ORDER_RESOURCE_URLS + ACCOUNT_RESOURCE_URLS,
+    ):
+        self.exclude_api_ids = frozenset(exclude_api_ids)
+        self.exclude_resource_urls = tuple(exclude_resource_urls)
+        # 키 → [공유 태스크, 기다리는 호출자 수]
+        self._in_flight: Dict[CoalesceKey, List[Any]] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def applies_to(self, api_id: Optional[str], url: str) -> bool:
+        if api_id in self.exclude_api_ids:
+            return False
+        return not url.rstrip("/").endswith(self.exclude_resource_urls)
+
+    @staticmethod
+    def make_key(
+        api_id: Optional[str],
+        url: str,
+        body: Any,
+        cont_yn: Optional[str] = "N",
+        next_key: Optional[str] = "",
+        scope: str = "",
+    ) -> CoalesceKey:
+        """scope는 인증 주체(토큰 관리자) 식별자로, 다른 계정의 요청끼리는 합쳐지지 않게 합니다"""
+        body_key = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+        loop_id = id(asyncio.get_running_loop())
+        return (loop_id, scope, api_id or "", url, body_key, cont_yn or "N", next_key or "")
+
+    async def run(self, key: CoalesceKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fetch() or join the identical request already in flight"""
+        self.requests += 1
+        entry = self._in_flight.get(key)
+        # 이미 끝난 태스크에는 합류하지 않으므로, 태스크가 끝난 뒤에는 호출자 수가 바뀌지 않음
+        if entry is None or entry[0].done():
+            task = asyncio.ensure_future(fetch())
+            entry = [task, 1]
+            self._in_flight[key] = entry
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            entry[1] += 1
+            self.coalesced += 1
+        result = await asyncio.shield(entry[0])
+        if entry[1] > 1:
+            # 중첩된 행 리스트까지 복사해, 호출자 중 누가 결과를 수정해도 다른 호출자에게 보이지 않게 함
+            return copy.deepcopy(result)
+        return result
+
+    def _finish(self, key: CoalesceKey, task: "asyncio.Future[Any]") -> None:
+        entry = self._in_flight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._in_flight[key]
+        # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
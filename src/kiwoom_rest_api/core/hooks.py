@@ -0,0 +1,195 @@
+import logging
+import time
+from typing import Any, Callable, List, Optional
+
+import httpx
+
+logger = logging.getLogger("kiwoom_rest_api")
+
+class RequestEvent:
+    """Emitted before a request is sent
+
+    http_request는 전송될 httpx.Request 원본입니다 (본문/헤더가 필요한 기록기용).
+    """
+
+    __slots__ = ("method", "url", "api_id", "start_time", "bytes_out", "http_request", "_start_perf")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        api_id: Optional[str],
+        bytes_out: int,
+        http_request: Optional[httpx.Request] = None,
+    ):
+        self.method = method
+        self.url = url
+        self.api_id = api_id
+        self.start_time = time.time()
+        self.bytes_out = bytes_out
+        self.http_request = http_request
+        self._start_perf = time.perf_counter()
+
+class ResponseEvent:
+    """Emitted after a response was processed or the request failed
+
+    error는 네트워크 오류나 APIError 등 요청 처리 중 발생한 예외이며, 성공 시 None입니다.
+    http_response는 수신한 httpx.Response 원본이며, 응답을 받지 못한 경우 None입니다.
+    """
+
+    __slots__ = ("request", "status_code", "bytes_in", "latency", "error", "http_response")
+
+    def __init__(
+        self,
+        request: RequestEvent,
+        status_code: Optional[int],
+        bytes_in: int,
+        latency: float,
+        error: Optional[BaseException] = None,
+        http_response: Optional[httpx.Response] = None,
+    ):
+        self.request = request
+        self.status_code = status_code
+        self.bytes_in = bytes_in
+        self.latency = latency
+        self.error = error
+        self.http_response = http_response
+
+class RetryEvent:
+    """Emitted when a request is about to be retried
+
+    attempt는 1부터 시작하는 재시도 번호, reason은 원인 예외 또는 응답의 return_msg입니다.
+    """
+
+    __slots__ = ("api_id", "url", "attempt", "delay", "reason")
+
+    def __init__(self, api_id: Optional[str], url: str, attempt: int, delay: float, reason: Any):
+        self.api_id = api_id
+        self.url = url
+        self.attempt = attempt
+        self.delay = delay
+        self.reason = reason
+
+class PaginationEvent:
+    """Emitted when a paginate()/paginate_async() walk finishes"""
+
+    __slots__ = ("api_id", "resource_url", "pages", "rows")
+
+    def __init__(self, api_id: Optional[str], resource_url: str, pages: int, rows: int):
+        self.api_id = api_id
+        self.resource_url = resource_url
+        self.pages = pages
+        self.rows = rows
+
+RequestHook = Callable[[RequestEvent], Any]
+ResponseHook = Callable[[ResponseEvent], Any]
+RetryHook = Callable[[RetryEvent], Any]
+PaginationHook = Callable[[PaginationEvent], Any]
+
+_request_hooks: List[RequestHook] = []
+_response_hooks: List[ResponseHook] = []
+_retry_hooks: List[RetryHook] = []
+_pagination_hooks: List[PaginationHook] = []
+
+def add_request_hook(hook: RequestHook) -> None:
+    """Register a callable invoked with a RequestEvent before each request"""
+    _request_hooks.append(hook)
+
+def add_response_hook(hook: ResponseHook) -> None:
+    """Register a callable invoked with a ResponseEvent after each request"""
+    _response_hooks.append(hook)
+
+def add_retry_hook(hook: RetryHook) -> None:
+    """Register a callable invoked with a RetryEvent before each retry"""
+    _retry_hooks.append(hook)
+
+def add_pagination_hook(hook: PaginationHook) -> None:
+    """Register a callable invoked with a PaginationEvent after each pagination walk"""
+    _pagination_hooks.append(hook)
+
+def remove_request_hook(hook: RequestHook) -> None:
+    if hook in _request_hooks:
+        _request_hooks.remove(hook)
+
+def remove_response_hook(hook: ResponseHook) -> None:
+    if hook in _response_hooks:
+        _response_hooks.remove(hook)
+
+def remove_retry_hook(hook: RetryHook) -> None:
+    if hook in _retry_hooks:
+        _retry_hooks.remove(hook)
+
+def remove_pagination_hook(hook: PaginationHook) -> None:
+    if hook in _pagination_hooks:
+        _pagination_hooks.remove(hook)
+
+def clear_hooks() -> None:
+    _request_hooks.clear()
+    _response_hooks.clear()
+    _retry_hooks.clear()
+    _pagination_hooks.clear()
+
+def instrumentation_enabled() -> bool:
+    """True when any hook is registered or DEBUG logging is on
+
+    비활성 상태에서는 요청 경로가 이벤트 객체를 만들지 않으므로 추가 비용이 없습니다.
+    """
+    return bool(_request_hooks or _response_hooks) or logger.isEnabledFor(logging.DEBUG)
+
+def emit_request(request: httpx.Request) -> RequestEvent:
+    event = RequestEvent(
+        method=request.method,
+        url=str(request.url),
+        api_id=request.headers.get("api-id"),
+        bytes_out=len(request.content),
+        http_request=request,
+    )
+    for hook in _request_hooks:
+        _call(hook, event)
+    return event
+
+def emit_response(
+    request_event: RequestEvent,
+    response: Optional[httpx.Response],
+    error: Optional[BaseException] = None,
+) -> ResponseEvent:
+    latency = time.perf_counter() - request_event._start_perf
+    status_code = response.status_code if response is not None else None
+    bytes_in = len(response.content) if response is not None else 0
+    event = ResponseEvent(request_event, status_code, bytes_in, latency, error, response)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "%s %s api-id=%s status=%s bytes_out=%d bytes_in=%d latency=%.1fms%s",
+            request_event.method,
+            request_event.url,
+            request_event.api_id,
+            status_code,
+            request_event.bytes_out,
+            bytes_in,
+            latency * 1000,
+            f" error={error!r}" if error is not None else "",
+        )
+    for hook in _response_hooks:
+        _call(hook, event)
+    return event
+
+def emit_retry(api_id: Optional[str], url: str, attempt: int, delay: float, reason: Any) -> None:
+    if not _retry_hooks:
+        return
+    event = RetryEvent(api_id, url, attempt, delay, reason)
+    for hook in _retry_hooks:
+        _call(hook, event)
+
+def emit_pagination(api_id: Optional[str], resource_url: str, pages: int, rows: int) -> None:
+    if not _pagination_hooks:
+        return
+    event = PaginationEvent(api_id, resource_url, pages, rows)
+    for hook in _pagination_hooks:
+        _call(hook, event)
+
+def _call(hook: Callable[[Any], Any], event: Any) -> None:
+    # 훅 오류가 실제 API 호출을 깨뜨리지 않도록 기록만 함
+    try:
+        hook(event)
+    except Exception:
+        logger.exception("kiwoom_rest_api hook %r failed", hook)
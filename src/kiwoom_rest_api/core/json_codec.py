@@ -0,0 +1,111 @@
+import json
+from typing import Any, Callable, Dict, Optional
+
+from kiwoom_rest_api.config import JSON_BACKEND
+from kiwoom_rest_api.core.hooks import logger
+
+# 우선순위: orjson > msgspec > 표준 라이브러리 json
+_AUTO_ORDER = ("orjson", "msgspec", "json")
+
+def _orjson_decoder() -> Callable[[bytes], Any]:
+    import orjson
+
+    return orjson.loads
+
+def _msgspec_decoder() -> Callable[[bytes], Any]:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+
+    def loads(data: bytes) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            # 다른 백엔드와 동일하게 ValueError 계열로 통일
+            raise ValueError(str(e)) from e
+
+    return loads
+
+def _stdlib_decoder() -> Callable[[bytes], Any]:
+    return json.loads
+
+_FACTORIES: Dict[str, Callable[[], Callable[[bytes], Any]]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+def _orjson_encoder() -> Callable[[Any], bytes]:
+    import orjson
+
+    return orjson.dumps
+
+def _msgspec_encoder() -> Callable[[Any], bytes]:
+    import msgspec
+
+    return msgspec.json.Encoder().encode
+
+def _stdlib_encoder() -> Callable[[Any], bytes]:
+    return lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+_ENCODER_FACTORIES: Dict[str, Callable[[], Callable[[Any], bytes]]] = {
+    "orjson": _orjson_encoder,
+    "msgspec": _msgspec_encoder,
+    "json": _stdlib_encoder,
+}
+
+_backend_name = "json"
+_decode: Callable[[bytes], Any] = json.loads
+_encode: Callable[[Any], bytes] = _stdlib_encoder()
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """Select the JSON decoder used by process_response
+
+    Args:
+        name: "orjson", "msgspec", "json" 또는 None/"auto" (설치된 가장 빠른 백엔드)
+
+    Returns:
+        실제로 선택된 백엔드 이름
+    """
+    global _backend_name, _decode, _encode
+    if name in (None, "", "auto"):
+        for candidate in _AUTO_ORDER:
+            try:
+                _decode = _FACTORIES[candidate]()
+            except ImportError:
+                continue
+            _encode = _ENCODER_FACTORIES[candidate]()
+            _backend_name = candidate
+            return _backend_name
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend: {name!r} (choose from {', '.join(_FACTORIES)})")
+    _decode = _FACTORIES[name]()
+    _encode = _ENCODER_FACTORIES[name]()
+    _backend_name = name
+    return _backend_name
+
+def get_json_backend() -> str:
+    """Return the name of the active JSON backend"""
+    return _backend_name
+
+def decode_json(data: bytes) -> Any:
+    """Decode a JSON document directly from response bytes
+
+    Raises:
+        ValueError: 올바른 JSON이 아닌 경우 (json.JSONDecodeError 포함)
+    """
+    return _decode(data)
+
+def encode_json(obj: Any) -> bytes:
+    """Encode an object to UTF-8 JSON bytes with the active backend"""
+    return _encode(obj)
+
+def _select_default_backend(name: Optional[str]) -> str:
+    # 설정(KIWOOM_JSON_BACKEND)된 백엔드가 설치되어 있지 않거나 잘못되어도 import는 실패하지 않도록 표준 json으로 대체
+    try:
+        return set_json_backend(name)
+    except (ImportError, ValueError) as e:
+        logger.warning("JSON backend %r is unavailable (%s); falling back to the standard json module", name, e)
+        return set_json_backend("json")
+
+_select_default_backend(JSON_BACKEND)
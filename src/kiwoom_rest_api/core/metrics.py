@@ -0,0 +1,302 @@
+import bisect
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.hooks import (
+    PaginationEvent,
+    ResponseEvent,
+    RetryEvent,
+    add_pagination_hook,
+    add_response_hook,
+    add_retry_hook,
+    remove_pagination_hook,
+    remove_response_hook,
+    remove_retry_hook,
+)
+
+# 지연 시간 히스토그램 경계(초)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 연속조회 페이지 수 히스토그램 경계
+DEFAULT_PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# 정상(200) 응답 본문의 return_code. 키움은 보통 본문 끝에 두므로 끝부분부터 찾음
+_RETURN_CODE = re.compile(rb'"return_code"\s*:\s*"?(-?\d+)')
+_TAIL_BYTES = 256
+
+SeriesKey = Tuple[str, str]
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result, total = [], 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else _format(bound), total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by linear interpolation inside the matching bucket"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.bounds[-1] if self.bounds else None
+
+class _Series:
+    __slots__ = ("calls", "errors", "bytes_out", "bytes_in", "retries", "rows", "latency", "pages")
+
+    def __init__(self, latency_buckets: Sequence[float], page_buckets: Sequence[float]):
+        self.calls = 0
+        # (종류, 코드) → 횟수. 종류: http(HTTP 상태), return_code(키움 응답 코드), exception(네트워크 예외 등)
+        self.errors: Counter = Counter()
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.retries = 0
+        self.rows = 0
+        self.latency = _Histogram(latency_buckets)
+        self.pages = _Histogram(page_buckets)
+
+class MetricsRegistry:
+    """Per (api-id, resource_url) request metrics fed by the core request hooks
+
+    install() 후에는 make_request/make_request_async를 거치는 모든 요청의 호출 수, 지연 히스토그램,
+    송수신 바이트, 오류 코드와 재시도 횟수, paginate()의 페이지 수(연속조회 깊이)를 집계합니다.
+    snapshot()으로 프로세스 안에서 조회하거나 to_prometheus()/serve()로 Prometheus 텍스트 형식으로 내보냅니다.
+
+    Example:
+        >>> metrics = MetricsRegistry().install()
+        >>> chart.stock_daily_chart_request_ka10081("005930", "20250110", "1")
+        >>> metrics.snapshot()["ka10081 /api/dostk/chart"]["latency"]["p99"]
+        >>> server = metrics.serve(port=9464)  # GET /metrics
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        page_buckets: Sequence[float] = DEFAULT_PAGE_BUCKETS,
+        namespace: str = "kiwoom",
+    ):
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.page_buckets = tuple(sorted(page_buckets))
+        self.namespace = namespace
+        self._series: Dict[SeriesKey, _Series] = {}
+        self._paths: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._installed = False
+
+    def install(self) -> "MetricsRegistry":
+        """Start collecting from the global request, retry and pagination hooks"""
+        with self._lock:
+            if not self._installed:
+                add_response_hook(self.observe_response)
+                add_retry_hook(self.observe_retry)
+                add_pagination_hook(self.observe_pagination)
+                self._installed = True
+        return self
+
+    def uninstall(self) -> None:
+        with self._lock:
+            if self._installed:
+                remove_response_hook(self.observe_response)
+                remove_retry_hook(self.observe_retry)
+                remove_pagination_hook(self.observe_pagination)
+                self._installed = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _path(self, url: str) -> str:
+        path = self._paths.get(url)
+        if path is None:
+            path = urlsplit(url).path
+            self._paths[url] = path
+        return path
+
+    def _get(self, api_id: Optional[str], resource_url: str) -> _Series:
+        # 호출자가 self._lock을 잡고 있음
+        key = (api_id or "", resource_url)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self.latency_buckets, self.page_buckets)
+        return series
+
+    def observe_response(self, event: ResponseEvent) -> None:
+        request = event.request
+        error = _error_label(event)
+        with self._lock:
+            series = self._get(request.api_id, self._path(request.url))
+            series.calls += 1
+            series.bytes_out += request.bytes_out
+            series.bytes_in += event.bytes_in
+            series.latency.observe(event.latency)
+            if error is not None:
+                series.errors[error] += 1
+
+    def observe_retry(self, event: RetryEvent) -> None:
+        with self._lock:
+            self._get(event.api_id, self._path(event.url)).retries += 1
+
+    def observe_pagination(self, event: PaginationEvent) -> None:
+        with self._lock:
+            series = self._get(event.api_id, event.resource_url)
+            series.pages.observe(event.pages)
+            series.rows += event.rows
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return plain-dict metrics keyed by "<api-id> <resource_url>" """
+        with self._lock:
+            result = {}
+            for (api_id, resource_url), series in sorted(self._series.items()):
+                latency = series.latency
+                result[f"{api_id} {resource_url}"] = {
+                    "api_id": api_id,
+                    "resource_url": resource_url,
+                    "calls": series.calls,
+                    "errors": sum(series.errors.values()),
+                    "error_codes": {f"{kind}:{code}": count for (kind, code), count in sorted(series.errors.items())},
+                    "bytes_out": series.bytes_out,
+                    "bytes_in": series.bytes_in,
+                    "retries": series.retries,
+                    "latency": {
+                        "count": latency.count,
+                        "sum": latency.sum,
+                        "mean": latency.sum / latency.count if latency.count else None,
+                        "p50": latency.quantile(0.5),
+                        "p90": latency.quantile(0.9),
+                        "p99": latency.quantile(0.99),
+                    },
+                    "pagination": {
+                        "walks": series.pages.count,
+                        "pages": int(series.pages.sum),
+                        "mean_pages": series.pages.sum / series.pages.count if series.pages.count else None,
+                        "rows": series.rows,
+                    },
+                }
+            return result
+
+    def to_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format (version 0.0.4)"""
+        ns = self.namespace
+        lines: List[str] = []
+
+        def header(name: str, kind: str, text: str) -> None:
+            lines.append(f"# HELP {ns}_{name} {text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+
+        with self._lock:
+            items = sorted(self._series.items())
+            header("requests_total", "counter", "Requests sent, by api-id and resource URL")
+            for key, series in items:
+                lines.append(f"{ns}_requests_total{_labels(key)} {series.calls}")
+            header("request_errors_total", "counter", "Failed requests by error kind and code")
+            for key, series in items:
+                for (kind, code), count in sorted(series.errors.items()):
+                    lines.append(f"{ns}_request_errors_total{_labels(key, kind=kind, code=code)} {count}")
+            header("request_retries_total", "counter", "Retries scheduled by the retry policy")
+            for key, series in items:
+                lines.append(f"{ns}_request_retries_total{_labels(key)} {series.retries}")
+            header("request_bytes_total", "counter", "Request body bytes sent")
+            for key, series in items:
+                lines.append(f"{ns}_request_bytes_total{_labels(key)} {series.bytes_out}")
+            header("response_bytes_total", "counter", "Response body bytes received")
+            for key, series in items:
+                lines.append(f"{ns}_response_bytes_total{_labels(key)} {series.bytes_in}")
+            header("request_duration_seconds", "histogram", "Request latency including response processing")
+            for key, series in items:
+                _histogram_lines(lines, f"{ns}_request_duration_seconds", key, series.latency)
+            header("pagination_pages", "histogram", "Pages fetched per paginate() walk (continuation depth)")
+            for key, series in items:
+                if series.pages.count:
+                    _histogram_lines(lines, f"{ns}_pagination_pages", key, series.pages)
+            header("pagination_rows_total", "counter", "Rows returned by paginate() walks")
+            for key, series in items:
+                if series.pages.count:
+                    lines.append(f"{ns}_pagination_rows_total{_labels(key)} {series.rows}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+        """Serve GET /metrics from a background thread; call shutdown() on the result to stop"""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("content-type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="kiwoom-metrics", daemon=True).start()
+        return server
+
+def _error_label(event: ResponseEvent) -> Optional[Tuple[str, str]]:
+    error = event.error
+    if isinstance(error, APIError):
+        # HTTP 오류는 상태 코드로, 200 응답의 거절(비동기 경로)은 return_code로 구분
+        return_code = error.error_data.get("return_code") if isinstance(error.error_data, dict) else None
+        if error.status_code < 400 and return_code not in (None, 0, "0"):
+            return "return_code", str(return_code)
+        return "http", str(error.status_code)
+    if error is not None:
+        return "exception", type(error).__name__
+    if event.status_code is not None and event.status_code >= 400:
+        return "http", str(event.status_code)
+    # 동기 경로는 return_code가 0이 아니어도 예외 없이 응답을 반환하므로 본문에서 확인
+    response = event.http_response
+    if response is None:
+        return None
+    content = response.content
+    match = _RETURN_CODE.search(content, max(0, len(content) - _TAIL_BYTES)) or _RETURN_CODE.search(content)
+    if match and int(match.group(1)) != 0:
+        return "return_code", match.group(1).decode()
+    return None
+
+def _format(value: float) -> str:
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(key: SeriesKey, **extra: str) -> str:
+    api_id, resource_url = key
+    pairs = [("api_id", api_id), ("resource_url", resource_url), *extra.items()]
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _histogram_lines(lines: List[str], name: str, key: SeriesKey, histogram: _Histogram) -> None:
+    for bound, count in histogram.cumulative():
+        lines.append(f"{name}_bucket{_labels(key, le=bound)} {count}")
+    lines.append(f"{name}_sum{_labels(key)} {histogram.sum!r}")
+    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
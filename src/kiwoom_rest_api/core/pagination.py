@@ -0,0 +1,136 @@
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from kiwoom_rest_api.core.hooks import emit_pagination
+
+# 연속조회 응답 행에서 날짜(시각)를 담는 필드 후보 (우선순위 순)
+DATE_KEYS = ("dt", "cntr_tm", "date", "trde_dt", "cntr_dt", "ord_dt")
+
+def find_list_key(page: Dict[str, Any]) -> Optional[str]:
+    """Return the key of the first list-of-dicts field in a response page"""
+    for key, value in page.items():
+        if isinstance(value, list) and (not value or isinstance(value[0], dict)):
+            return key
+    return None
+
+def api_id_of(request_method: Callable[..., Any]) -> str:
+    """Extract the api-id from an API method name (stock_daily_chart_request_ka10081 → ka10081)"""
+    return getattr(request_method, "__name__", "").rsplit("_", 1)[-1]
+
+def _emit(request_method: Callable[..., Any], walker: "PageWalker") -> None:
+    resource_url = getattr(getattr(request_method, "__self__", None), "resource_url", "")
+    emit_pagination(api_id_of(request_method), resource_url, walker.pages, walker.rows)
+
+def next_page_key(page: Dict[str, Any]) -> Optional[str]:
+    """Return the next-key header value if the server reports more pages (cont-yn=Y)"""
+    if str(page.get("cont-yn", "N")).upper() != "Y":
+        return None
+    return page.get("next-key") or None
+
+class PageWalker:
+    """Bookkeeping for one pagination run
+
+    Trims each page to the requested limits and decides when to stop.
+    Rows are assumed to arrive newest first, as Kiwoom's chart and history
+    endpoints return them, so stop_date ends the walk at the first older row.
+    """
+
+    def __init__(
+        self,
+        list_key: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        stop_date: Optional[str] = None,
+        date_key: Optional[str] = None,
+    ):
+        self.list_key = list_key
+        self.max_pages = max_pages
+        self.max_rows = max_rows
+        self.stop_date = stop_date
+        self.date_key = date_key
+        self.pages = 0
+        self.rows = 0
+        self.done = False
+
+    def accept(self, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Register a page and return its rows, trimmed to the stop conditions"""
+        self.pages += 1
+        if self.list_key is None:
+            self.list_key = find_list_key(page)
+        rows = (page.get(self.list_key) or []) if self.list_key else []
+
+        if self.stop_date and rows:
+            if self.date_key is None:
+                self.date_key = next((key for key in DATE_KEYS if key in rows[0]), None)
+            if self.date_key is not None:
+                cutoff = len(self.stop_date)
+                for index, row in enumerate(rows):
+                    value = str(row.get(self.date_key, ""))[:cutoff]
+                    if value and value < self.stop_date:
+                        rows = rows[:index]
+                        self.done = True
+                        break
+
+        if self.max_rows is not None and self.rows + len(rows) >= self.max_rows:
+            rows = rows[: self.max_rows - self.rows]
+            self.done = True
+
+        if self.max_pages is not None and self.pages >= self.max_pages:
+            self.done = True
+
+        self.rows += len(rows)
+        if self.list_key:
+            page[self.list_key] = rows
+        return rows
+
+    def next_kwargs(self, page: Dict[str, Any], kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the keyword arguments for the next request, or None when finished"""
+        if self.done:
+            return None
+        next_key = next_page_key(page)
+        if next_key is None:
+            return None
+        return {**kwargs, "cont_yn": "Y", "next_key": next_key}
+
+def iterate_pages(
+    request_method: Callable[..., Dict[str, Any]],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    walker: PageWalker,
+    rows: bool = False,
+) -> Iterator[Any]:
+    """Call request_method repeatedly, following cont-yn/next-key"""
+    call_kwargs: Optional[Dict[str, Any]] = kwargs
+    try:
+        while call_kwargs is not None:
+            page = request_method(*args, **call_kwargs)
+            page_rows = walker.accept(page)
+            if rows:
+                yield from page_rows
+            else:
+                yield page
+            call_kwargs = walker.next_kwargs(page, kwargs)
+    finally:
+        # 소비자가 중간에 멈춘 경우에도 실제로 가져온 페이지 수를 알림
+        _emit(request_method, walker)
+
+async def aiterate_pages(
+    request_method: Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    walker: PageWalker,
+    rows: bool = False,
+) -> AsyncIterator[Any]:
+    """Async counterpart of iterate_pages for use_async=True API instances"""
+    call_kwargs: Optional[Dict[str, Any]] = kwargs
+    try:
+        while call_kwargs is not None:
+            page = await request_method(*args, **call_kwargs)
+            page_rows = walker.accept(page)
+            if rows:
+                for row in page_rows:
+                    yield row
+            else:
+                yield page
+            call_kwargs = walker.next_kwargs(page, kwargs)
+    finally:
+        _emit(request_method, walker)
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from kiwoom_rest_api.config import (
+    DEFAULT_API_ID_RATE_LIMITS,
+    RATE_LIMIT_PER_SECOND,
+    ORDER_RATE_LIMIT_PER_SECOND,
+    ORDER_RESOURCE_URLS,
+)
+
+# 초당 요청 수 또는 (초당 요청 수, 버스트 용량)
+Limit = Union[float, Tuple[float, float]]
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    Requests reserve a token up front; when the bucket is empty the level goes
+    negative and the caller is told how long to wait, so concurrent callers are
+    queued in arrival order instead of being rejected.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Reserve tokens and return the number of seconds to wait before using them"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until the tokens are available; returns the time waited"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Wait without blocking the event loop until the tokens are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    @property
+    def level(self) -> float:
+        """Current number of tokens (negative when requests are queued)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+def _make_bucket(limit: Limit) -> TokenBucket:
+    if isinstance(limit, tuple):
+        return TokenBucket(*limit)
+    return TokenBucket(limit)
+
+class RateLimiter:
+    """Client-side rate limiter keyed by api-id and endpoint family
+
+    버킷 선택 순서:
+        1. api_id_limits에 등록된 api-id (예: "ka10081")
+        2. family_limits에 등록된 리소스 경로 (예: "/api/dostk/ordr")
+        3. 기본 버킷
+    키움은 앱키 단위로 요청 수를 제한하므로, 모든 요청은 위 버킷과 함께 앱키 단위 전역 버킷(global_limit,
+    생략 시 RATE_LIMIT_PER_SECOND)도 통과해야 합니다. 여러 차트·순위 api-id를 동시에 호출해도 합계가 전역 한도를
+    넘지 않습니다. 한 RateLimiter(와 그것을 쓰는 KiwoomSession)는 하나의 앱키에만 사용하세요.
+
+    api_id_limits를 생략하면 DEFAULT_API_ID_RATE_LIMITS(차트·순위 조회는 api-id마다 초당 3건/2건,
+    KIWOOM_CHART_RATE_LIMIT_PER_SECOND / KIWOOM_RANKING_RATE_LIMIT_PER_SECOND로 변경)를 사용하며,
+    빈 dict를 주면 api-id별 한도 없이 기본 버킷만 사용합니다.
+
+    Example:
+        >>> limiter = RateLimiter(api_id_limits={"ka10081": (2, 4)}, global_limit=10)
+        >>> session = KiwoomSession(rate_limiter=limiter)
+        >>> limiter.levels()
+        {'default': 5.0, 'global': 10.0, 'family:/api/dostk/ordr': 5.0, ...}
+    """
+
+    def __init__(
+        self,
+        default_limit: Limit = RATE_LIMIT_PER_SECOND,
+        api_id_limits: Optional[Dict[str, Limit]] = None,
+        family_limits: Optional[Dict[str, Limit]] = None,
+        global_limit: Optional[Limit] = None,
+    ):
+        if api_id_limits is None:
+            api_id_limits = DEFAULT_API_ID_RATE_LIMITS
+        if family_limits is None:
+            family_limits = {url: ORDER_RATE_LIMIT_PER_SECOND for url in ORDER_RESOURCE_URLS}
+        self._default = _make_bucket(default_limit)
+        self._global = _make_bucket(global_limit if global_limit is not None else RATE_LIMIT_PER_SECOND)
+        self._api_ids = {api_id: _make_bucket(limit) for api_id, limit in api_id_limits.items()}
+        self._families = {path: _make_bucket(limit) for path, limit in family_limits.items()}
+
+    def _buckets_for(self, api_id: Optional[str], url: str = ""):
+        bucket = self._api_ids.get(api_id)
+        if bucket is None:
+            bucket = self._default
+            for path, family_bucket in self._families.items():
+                if url.endswith(path):
+                    bucket = family_bucket
+                    break
+        return (bucket, self._global)
+
+    def acquire(self, api_id: Optional[str], url: str = "") -> float:
+        """Block until a request for api_id/url may be sent"""
+        wait = max(bucket.reserve() for bucket in self._buckets_for(api_id, url))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, api_id: Optional[str], url: str = "") -> float:
+        """Await until a request for api_id/url may be sent"""
+        wait = max(bucket.reserve() for bucket in self._buckets_for(api_id, url))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def levels(self) -> Dict[str, float]:
+        """Return the current token level of every bucket
+
+        음수 값은 대기열에 쌓인 요청 수를 의미하므로 스케줄러가 호출 시점을 조정할 수 있습니다.
+        """
+        levels = {"default": self._default.level, "global": self._global.level}
+        for path, bucket in self._families.items():
+            levels[f"family:{path}"] = bucket.level
+        for api_id, bucket in self._api_ids.items():
+            levels[f"api:{api_id}"] = bucket.level
+        return levels
+
+    def level(self, api_id: Optional[str], url: str = "") -> float:
+        """Return the lowest token level among the buckets a request would use"""
+        return min(bucket.level for bucket in self._buckets_for(api_id, url))
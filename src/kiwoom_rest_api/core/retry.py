@@ -0,0 +1,198 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import httpx
+
+from kiwoom_rest_api.config import MAX_RETRIES, ORDER_API_IDS, ORDER_RESOURCE_URLS
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.hooks import emit_retry, logger
+
+# 일시적 오류로 보고 재시도하는 HTTP 상태 코드
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# 키움 return_code 1700: 허용된 요청 개수 초과
+RATE_LIMIT_RETURN_CODE = 1700
+RETRY_RETURN_CODES = frozenset({RATE_LIMIT_RETURN_CODE})
+# 요청이 서버에 도달하지 않았음이 확실한 오류 (주문도 재시도 가능)
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+def _return_code(data: Any) -> Optional[int]:
+    if not isinstance(data, dict):
+        return None
+    try:
+        return int(data.get("return_code"))
+    except (TypeError, ValueError):
+        return None
+
+class RetryPolicy:
+    """Decides whether and when a failed Kiwoom request is sent again
+
+    조회 API(ka*)는 네트워크 오류, 재시도 대상 HTTP 상태(429/5xx), 재시도 대상 return_code에 대해
+    자동으로 재시도합니다. 주문 API(ORDER_API_IDS 또는 주문 resource_url)는 중복 주문을 막기 위해
+    요청이 서버에 도달하지 않은 연결 오류와 명시적인 요청 한도 거절(429, return_code 1700)만 재시도합니다.
+
+    대기 시간은 backoff * 2^(시도-1)을 max_backoff로 제한한 값에 jitter(50~100%)를 적용하며,
+    서버가 Retry-After를 보내면 그 값(최대 max_retry_after)을 우선합니다.
+
+    Args:
+        max_retries: 첫 요청 이후 최대 재시도 횟수 (0이면 재시도 안 함)
+        backoff: 첫 재시도 대기 시간(초)
+        max_backoff: 재시도 대기 시간 상한(초)
+        jitter: 대기 시간을 무작위로 분산해 여러 클라이언트가 동시에 재시도하지 않도록 함
+        retry_status_codes: 재시도할 HTTP 상태 코드
+        retry_return_codes: 재시도할 키움 return_code
+        respect_retry_after: Retry-After 헤더를 따를지 여부
+        max_retry_after: Retry-After 대기 시간 상한(초)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        jitter: bool = True,
+        retry_status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        retry_return_codes: Iterable[int] = RETRY_RETURN_CODES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 30.0,
+        order_api_ids: Iterable[str] = ORDER_API_IDS,
+        order_resource_urls: Iterable[str] = ORDER_RESOURCE_URLS,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_return_codes = frozenset(retry_return_codes)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.order_api_ids = frozenset(order_api_ids)
+        self.order_resource_urls = tuple(order_resource_urls)
+
+    def is_order(self, api_id: Optional[str], url: str = "") -> bool:
+        """True for order api-ids and order resource URLs, which must not be retried blindly"""
+        if api_id in self.order_api_ids:
+            return True
+        return bool(url) and url.rstrip("/").endswith(self.order_resource_urls)
+
+    def classify(self, error: Optional[BaseException] = None, result: Any = None) -> Optional[str]:
+        """Return why the outcome is retryable, or None
+
+        Returns:
+            "unsent": 연결 단계 오류 (요청이 전송되지 않음)
+            "rate_limited": HTTP 429 또는 요청 한도 return_code
+            "network": 그 밖의 네트워크 오류 (읽기 타임아웃 등, 서버가 처리했을 수 있음)
+            "server": 재시도 대상 HTTP 상태 / return_code
+        """
+        if error is None:
+            return self._classify_return_code(_return_code(result))
+        if isinstance(error, _UNSENT_ERRORS):
+            return "unsent"
+        if isinstance(error, httpx.TransportError):
+            return "network"
+        if isinstance(error, APIError):
+            if error.status_code == 429:
+                return "rate_limited"
+            reason = self._classify_return_code(_return_code(error.error_data))
+            if reason is not None:
+                return reason
+            if error.status_code in self.retry_status_codes:
+                return "server"
+        return None
+
+    def _classify_return_code(self, code: Optional[int]) -> Optional[str]:
+        if code not in self.retry_return_codes:
+            return None
+        return "rate_limited" if code == RATE_LIMIT_RETURN_CODE else "server"
+
+    def retry_after(self, error: Optional[BaseException]) -> Optional[float]:
+        """Seconds requested by the server's Retry-After header, if any"""
+        headers = getattr(error, "headers", None)
+        if not self.respect_retry_after or not headers:
+            return None
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff for the given attempt number (1 = first retry)"""
+        delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay *= random.uniform(0.5, 1.0)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        api_id: Optional[str],
+        url: str,
+        error: Optional[BaseException] = None,
+        result: Any = None,
+    ) -> Optional[float]:
+        """Seconds to wait before retry number `attempt`, or None to give up"""
+        if attempt > self.max_retries:
+            return None
+        reason = self.classify(error, result)
+        if reason is None:
+            return None
+        if self.is_order(api_id, url) and reason not in ("unsent", "rate_limited"):
+            return None
+        retry_after = self.retry_after(error)
+        return retry_after if retry_after is not None else self.backoff_delay(attempt)
+
+def call_with_retry(policy: Optional[RetryPolicy], send: Callable[[], Any], api_id: Optional[str], url: str) -> Any:
+    """Call send() and retry it according to the policy
+
+    재시도 대상 return_code를 담은 정상(200) 응답이 재시도 한도를 넘기면 그 응답을 그대로 반환합니다.
+    """
+    attempt = 0
+    while True:
+        try:
+            result = send()
+        except Exception as e:
+            delay = policy.next_delay(attempt + 1, api_id, url, error=e) if policy else None
+            if delay is None:
+                raise
+            _log_retry(api_id, url, attempt + 1, delay, e)
+        else:
+            delay = policy.next_delay(attempt + 1, api_id, url, result=result) if policy else None
+            if delay is None:
+                return result
+            _log_retry(api_id, url, attempt + 1, delay, result.get("return_msg"))
+        attempt += 1
+        time.sleep(delay)
+
+async def call_with_retry_async(
+    policy: Optional[RetryPolicy], send: Callable[[], Awaitable[Any]], api_id: Optional[str], url: str
+) -> Any:
+    """Async counterpart of call_with_retry"""
+    attempt = 0
+    while True:
+        try:
+            result = await send()
+        except Exception as e:
+            delay = policy.next_delay(attempt + 1, api_id, url, error=e) if policy else None
+            if delay is None:
+                raise
+            _log_retry(api_id, url, attempt + 1, delay, e)
+        else:
+            delay = policy.next_delay(attempt + 1, api_id, url, result=result) if policy else None
+            if delay is None:
+                return result
+            _log_retry(api_id, url, attempt + 1, delay, result.get("return_msg"))
+        attempt += 1
+        await asyncio.sleep(delay)
+
+def _log_retry(api_id: Optional[str], url: str, attempt: int, delay: float, reason: Any) -> None:
+    logger.warning("Retrying %s api-id=%s (retry %d) in %.2fs: %s", url, api_id, attempt, delay, reason)
+    emit_retry(api_id, url, attempt, delay, reason)
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import warnings
+import weakref
+from typing import Optional
+
+import httpx
+
+from kiwoom_rest_api.core.breaker import CircuitBreaker
+from kiwoom_rest_api.core.cache import ResponseCache
+from kiwoom_rest_api.core.coalesce import RequestCoalescer
+from kiwoom_rest_api.core.rate_limit import RateLimiter
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.config import (
+    DEFAULT_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    USE_HTTP2,
+)
+
+def _h2_available() -> bool:
+    """Check whether the optional 'h2' package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        warnings.warn(
+            "HTTP/2 requested but the 'h2' package is not installed; "
+            "falling back to HTTP/1.1 connection pooling. "
+            "Install it with: pip install kiwoom-rest-api[http2]",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return False
+    return True
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+class KiwoomSession:
+    """Connection pool shared by KiwoomBaseAPI instances
+
+    Holds one httpx.Client and one httpx.AsyncClient (per running event loop),
+    created lazily on first use, so that keep-alive connections to the Kiwoom server are reused across
+    calls and across API classes (StockInfo, Chart, Order, ...).
+
+    With http2=True the async client negotiates HTTP/2 (requires the 'h2'
+    package) so concurrent requests are multiplexed over a single connection;
+    without 'h2' it falls back to HTTP/1.1 pooling.
+
+    Client-side throttling is opt-in: without rate_limiter requests are sent
+    as fast as they are issued and Kiwoom's limit surfaces as 429 / return_code
+    1700, which the retry policy backs off from. Pass RateLimiter() to stay
+    under the per-app-key limit up front.
+
+    Example:
+        >>> with KiwoomSession(max_connections=50, rate_limiter=RateLimiter()) as session:
+        ...     stock_info = StockInfo(base_url=..., token_manager=tm, session=session)
+        ...     chart = Chart(base_url=..., token_manager=tm, session=session)
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        http2: bool = USE_HTTP2,
+        http2_prior_knowledge: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        # 테스트나 재생(replay)용으로 전송 계층을 교체할 수 있음
+        self.transport = transport
+        self.async_transport = async_transport
+        # HTTP/2는 비동기 클라이언트에만 적용 (동시 요청을 하나의 연결로 다중화)
+        self.http2 = http2 and _h2_available()
+        # 평문(http://) 서버에 HTTP/2로 바로 접속 (로컬 목 서버/벤치마크용)
+        self.http2_prior_knowledge = http2_prior_knowledge and self.http2
+        # 세션을 공유하는 모든 API 클래스가 같은 요청 한도(앱키 단위)를 나눠 씀. 명시적으로 주어진 경우에만 사용
+        self.rate_limiter = rate_limiter
+        # 생략 시 기본 재시도 정책 사용. 재시도를 끄려면 RetryPolicy(max_retries=0)
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # 응답 캐시는 명시적으로 주어진 경우에만 사용 (TTL이 설정된 api-id만 캐시)
+        self.response_cache = response_cache
+        # 비동기 경로에서 동시에 들어온 동일 조회 요청을 하나의 HTTP 요청으로 합침
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        # 장애 중인 리소스 경로로의 요청을 보내지 않고 즉시 실패시킴 (명시적으로 주어진 경우에만)
+        self.circuit_breaker = circuit_breaker
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # 비동기 클라이언트를 만든 이벤트 루프 (약한 참조)
+        self._async_loop: Optional["weakref.ref[asyncio.AbstractEventLoop]"] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def client(self) -> httpx.Client:
+        """Return the pooled synchronous client, creating it on first use"""
+        if self._client is None:
+            with self._lock:
+                self._ensure_open()
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the pooled asynchronous client for the running event loop
+
+        httpx.AsyncClient의 연결은 생성된 이벤트 루프에 묶이므로, 실행 중인 루프가 바뀌면
+        (asyncio.run을 여러 번 호출하는 경우 등) 새 클라이언트를 만듭니다. 이전 루프의 클라이언트는
+        이미 닫힌 루프에서 정리할 수 없으므로 닫지 않고 버립니다.
+        """
+        loop = _running_loop()
+        if self._async_client is None or not self._same_loop(loop):
+            with self._lock:
+                self._ensure_open()
+                if self._async_client is None or not self._same_loop(loop):
+                    self._async_client = self._create_async_client()
+                    self._async_loop = weakref.ref(loop) if loop is not None else None
+        return self._async_client
+
+    def _same_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+        # 루프 밖에서 만든 클라이언트(loop is None)는 처음 사용하는 루프에 그대로 씀
+        if loop is None or self._async_loop is None:
+            if loop is not None:
+                self._async_loop = weakref.ref(loop)
+            return True
+        return self._async_loop() is loop
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("KiwoomSession is closed")
+
+    def _create_client(self) -> httpx.Client:
+        return httpx.Client(limits=self.limits, timeout=self.timeout, transport=self.transport)
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self.limits,
+            timeout=self.timeout,
+            transport=self.async_transport,
+            http1=not self.http2_prior_knowledge,
+            http2=self.http2,
+        )
+
+    def close(self) -> None:
+        """Close the synchronous client
+
+        The async client can only be closed from its event loop; use aclose()
+        when the session was used with use_async=True.
+        """
+        with self._lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both the synchronous and asynchronous clients"""
+        with self._lock:
+            self._closed = True
+            async_client, self._async_client = self._async_client, None
+            self._async_loop = None
+        if async_client is not None:
+            await async_client.aclose()
+        self.close()
+
+    def __enter__(self) -> "KiwoomSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "KiwoomSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
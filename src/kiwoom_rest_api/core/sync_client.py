@@ -2,7 +2,9 @@ from typing import Any, Dict, Optional
 
 import httpx
 
+from kiwoom_rest_api.config import DEFAULT_TIMEOUT
 from kiwoom_rest_api.core.base import prepare_request_params, process_response
+from kiwoom_rest_api.core.hooks import instrumentation_enabled, emit_request, emit_response
 
 def make_request(
     endpoint: str,
@@ -12,6 +14,7 @@ def make_request(
     headers: Optional[Dict[str, Any]] = None,
     access_token: Optional[str] = None,
     timeout: Optional[float] = None,
+    client: Optional[httpx.Client] = None,
     **kwargs: Any
 ) -> Dict[str, Any]:
     
@@ -30,14 +33,34 @@ def make_request(
     if 'json' in kwargs and method in ["POST", "PUT", "PATCH"]:
         request_params["json"] = kwargs['json']
     
-    with httpx.Client() as client:
-        response = client.request(
-            method=request_params["method"],
-            url=request_params["url"],
-            params=request_params.get("params"),
-            json=request_params.get("json"),
-            headers=request_params["headers"],
-            timeout=request_params["timeout"],
-        )
-                
-        return process_response(response)
+    # 공유 클라이언트(KiwoomSession)가 주어지면 커넥션을 재사용하고,
+    # 없으면 요청마다 일회용 클라이언트를 생성
+    if client is not None:
+        return _send(client, request_params)
+
+    with httpx.Client(timeout=DEFAULT_TIMEOUT) as one_off_client:
+        return _send(one_off_client, request_params)
+
+def _send(client: httpx.Client, request_params: Dict[str, Any]) -> Dict[str, Any]:
+    request = client.build_request(
+        method=request_params["method"],
+        url=request_params["url"],
+        params=request_params.get("params"),
+        json=request_params.get("json"),
+        headers=request_params["headers"],
+        timeout=request_params["timeout"],
+    )
+
+    if not instrumentation_enabled():
+        return process_response(client.send(request))
+
+    event = emit_request(request)
+    response = None
+    try:
+        response = client.send(request)
+        result = process_response(response)
+    except Exception as e:
+        emit_response(event, response, e)
+        raise
+    emit_response(event, response)
+    return result
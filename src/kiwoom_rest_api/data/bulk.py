@@ -0,0 +1,174 @@
+"""여러 종목의 차트를 동시에 받는 일괄 다운로더
+
+use_async=True Chart 인스턴스로 종목별 연속조회를 수행하며, 동시 실행 종목 수는 concurrency로 제한됩니다.
+실제 초당 요청 수는 세션의 rate_limiter가 제어하므로, concurrency는 대기 중인 요청 수의 상한입니다.
+재시도는 요청(페이지) 단위로 세션의 retry_policy가 처리하므로 (Retry-After, 주문 안전성 포함),
+재시도 후에도 실패한 종목은 결과의 errors에 남습니다.
+
+Example:
+    >>> session = KiwoomSession(rate_limiter=RateLimiter(), retry_policy=RetryPolicy(max_retries=3))
+    >>> chart = Chart(session=session, use_async=True)
+    >>> downloader = BulkDownloader(chart, concurrency=8, progress=print_progress)
+    >>> result = downloader.download(["005930", "000660"], base_dt="20250110", max_pages=2)
+    >>> result.data["005930"]["cur_prc"], result.timings["005930"]
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+ProgressCallback = Callable[["SymbolResult", int, int], Any]
+
+class SymbolResult:
+    """Outcome of one symbol: data (or error) and wall time"""
+
+    __slots__ = ("code", "data", "error", "elapsed")
+
+    def __init__(self, code: str, data: Any, error: Optional[BaseException], elapsed: float):
+        self.code = code
+        self.data = data
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class BulkResult:
+    """Collected results of one bulk download"""
+
+    def __init__(self, elapsed: float, symbols: Dict[str, SymbolResult]):
+        self.elapsed = elapsed
+        self.symbols = symbols
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return {code: result.data for code, result in self.symbols.items() if result.ok}
+
+    @property
+    def errors(self) -> Dict[str, BaseException]:
+        return {code: result.error for code, result in self.symbols.items() if not result.ok}
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        return {code: result.elapsed for code, result in self.symbols.items()}
+
+    def __repr__(self) -> str:
+        return f"<BulkResult ok={len(self.data)} failed={len(self.errors)} elapsed={self.elapsed:.1f}s>"
+
+def print_progress(result: SymbolResult, done: int, total: int) -> None:
+    """Simple progress callback printing one line per symbol"""
+    status = "ok" if result.ok else f"failed: {result.error}"
+    print(f"[{done}/{total}] {result.code} {result.elapsed * 1000:.0f}ms {status}")
+
+async def market_codes_async(stock_info, market_type: str = "0") -> List[str]:
+    """Return every code of a market via ka10099 (use_async=True StockInfo 전용)
+
+    Args:
+        market_type: 시장구분 (0:코스피, 10:코스닥, ...)
+    """
+    codes = []
+    async for row in stock_info.paginate_async(
+        stock_info.stock_information_list_request_ka10099, market_type, list_key="list", rows=True
+    ):
+        codes.append(row["code"])
+    return codes
+
+class BulkDownloader:
+    """Download charts for many symbols with bounded concurrency and progress reporting
+
+    재시도 횟수와 대기 시간은 chart.session.retry_policy로 설정합니다.
+
+    Args:
+        chart: use_async=True Chart 인스턴스
+        concurrency: 동시에 처리할 최대 종목 수
+        progress: 종목 하나가 끝날 때마다 (SymbolResult, 완료 수, 전체 수)로 호출
+        store: HistoryStore를 주면 차트를 반환하는 대신 저장소에 증분 동기화하고 새 봉 개수를 반환
+    """
+
+    def __init__(
+        self,
+        chart,
+        concurrency: int = 8,
+        progress: Optional[ProgressCallback] = None,
+        store=None,
+    ):
+        if not chart.use_async:
+            raise ValueError("BulkDownloader requires a Chart created with use_async=True")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.chart = chart
+        self.concurrency = concurrency
+        self.progress = progress
+        self.store = store
+
+    async def _fetch(self, code: str, request_method, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        if self.store is not None:
+            return await self.store.sync_async(code, *args, **kwargs)
+        return await self.chart.ohlcv_async(request_method, code, *args, **kwargs)
+
+    async def _download_one(self, code: str, semaphore: asyncio.Semaphore, request_method, args, kwargs) -> SymbolResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                data = await self._fetch(code, request_method, args, kwargs)
+            except Exception as e:
+                return SymbolResult(code, None, e, time.perf_counter() - start)
+            return SymbolResult(code, data, None, time.perf_counter() - start)
+
+    async def download_async(
+        self,
+        codes: Iterable[str],
+        base_dt: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        request_method: Optional[Callable[..., Any]] = None,
+        max_pages: Optional[int] = None,
+        stop_date: Optional[str] = None,
+    ) -> BulkResult:
+        """Download every code and return the per-symbol results
+
+        Args:
+            codes: 종목코드 목록 (중복은 한 번만 요청)
+            base_dt: 기준일자 YYYYMMDD (기본값: 오늘)
+            upd_stkpc_tp: 수정주가구분
+            request_method: 차트 메서드 (기본값: chart.stock_daily_chart_request_ka10081). store 사용 시 무시
+            max_pages: 종목별 최대 페이지 수. store 사용 시 무시
+            stop_date: 이 날짜보다 오래된 봉은 받지 않음 (store 사용 시 최초 동기화 시작일)
+        """
+        codes = list(dict.fromkeys(codes))
+        base_dt = base_dt or time.strftime("%Y%m%d")
+        if self.store is not None:
+            args: tuple = ("daily", base_dt, upd_stkpc_tp)
+            kwargs: Dict[str, Any] = {"start_date": stop_date}
+        else:
+            request_method = request_method or self.chart.stock_daily_chart_request_ka10081
+            args = (base_dt, upd_stkpc_tp)
+            kwargs = {"max_pages": max_pages, "stop_date": stop_date}
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.perf_counter()
+        tasks = [
+            asyncio.ensure_future(self._download_one(code, semaphore, request_method, args, kwargs))
+            for code in codes
+        ]
+        symbols: Dict[str, SymbolResult] = {}
+        try:
+            for future in asyncio.as_completed(tasks):
+                result = await future
+                symbols[result.code] = result
+                if self.progress is not None:
+                    self.progress(result, len(symbols), len(codes))
+        finally:
+            for task in tasks:
+                task.cancel()
+        # 입력 순서대로 정렬
+        ordered = {code: symbols[code] for code in codes}
+        return BulkResult(time.perf_counter() - start, ordered)
+
+    def download(self, codes: Iterable[str], **kwargs) -> BulkResult:
+        """Blocking wrapper around download_async() (이미 실행 중인 이벤트 루프에서는 download_async를 사용)"""
+        return asyncio.run(self.download_async(codes, **kwargs))
+
+    async def download_market_async(self, stock_info, market_type: str = "0", **kwargs) -> BulkResult:
+        """Download every code of a market listed by ka10099"""
+        codes = await market_codes_async(stock_info, market_type)
+        return await self.download_async(codes, **kwargs)
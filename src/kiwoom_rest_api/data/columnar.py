@@ -0,0 +1,124 @@
+from typing import Any, Dict, Optional, Sequence
+
+from kiwoom_rest_api.data.numeric import FLOAT, INT, PRICE, require_numpy, to_numpy_column
+
+# 컬럼명 → (변환 종류, 원본 필드 후보). dt는 일봉 이상은 dt(YYYYMMDD), 틱/분봉은 cntr_tm(YYYYMMDDHHMMSS)
+OHLCV_COLUMNS = {
+    "dt": (INT, ("dt", "cntr_tm")),
+    "open_pric": (PRICE, ("open_pric",)),
+    "high_pric": (PRICE, ("high_pric",)),
+    "low_pric": (PRICE, ("low_pric",)),
+    "cur_prc": (PRICE, ("cur_prc",)),
+    "trde_qty": (INT, ("trde_qty",)),
+    "trde_prica": (INT, ("trde_prica",)),
+}
+
+# 차트 api-id별 응답 리스트 필드
+CHART_LIST_KEYS = {
+    "ka10079": "stk_tic_chart_qry",
+    "ka10080": "stk_min_pole_chart_qry",
+    "ka10081": "stk_dt_pole_chart_qry",
+    "ka10082": "stk_stk_pole_chart_qry",
+    "ka10083": "stk_mth_pole_chart_qry",
+    "ka10094": "stk_yr_pole_chart_qry",
+    "ka20004": "inds_tic_chart_qry",
+    "ka20005": "inds_min_pole_qry",
+    "ka20006": "inds_dt_pole_qry",
+    "ka20007": "inds_stk_pole_qry",
+    "ka20008": "inds_mth_pole_qry",
+    "ka20019": "inds_yr_pole_qry",
+}
+
+# 업종 차트: 지수 가격이 소수("+2450.37")이므로 가격 컬럼을 float64로 저장
+DECIMAL_PRICE_API_IDS = frozenset({"ka20004", "ka20005", "ka20006", "ka20007", "ka20008", "ka20019"})
+
+class OHLCVColumns:
+    """Compact columnar OHLCV buffer (one NumPy array per field)
+
+    페이지 단위로 append_rows()를 호출하면 해당 페이지의 문자열 행을 벡터화 변환해 배열 뒤에 붙이며,
+    원본 dict 행은 보관하지 않습니다. 배열은 필요할 때 두 배씩 늘어납니다.
+    모든 컬럼은 int64이며, decimal_prices=True(업종 지수 차트)이면 가격 컬럼만 float64입니다.
+    int64 컬럼에 소수나 해석할 수 없는 값(NaN)이 들어오면 잘라내지 않고 그 컬럼만 float64로 바꿉니다.
+
+    Example:
+        >>> ohlcv = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+        >>> ohlcv["cur_prc"][:5], len(ohlcv)
+    """
+
+    def __init__(self, capacity: int = 1024, decimal_prices: bool = False):
+        np = require_numpy()
+        self._np = np
+        self._size = 0
+        self.decimal_prices = decimal_prices
+        # 컬럼명 → (변환 종류, dtype)
+        self._kinds = {}
+        for name, (kind, _) in OHLCV_COLUMNS.items():
+            if kind == PRICE and decimal_prices:
+                self._kinds[name] = (FLOAT, np.float64)
+            else:
+                self._kinds[name] = (kind, np.int64)
+        self._arrays = {name: np.zeros(max(capacity, 1), dtype=dtype) for name, (_, dtype) in self._kinds.items()}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, name: str):
+        return self._arrays[name][: self._size]
+
+    @property
+    def columns(self) -> Sequence[str]:
+        return tuple(OHLCV_COLUMNS)
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._arrays["dt"])
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, array in self._arrays.items():
+            grown = self._np.zeros(capacity, dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            self._arrays[name] = grown
+
+    def append_rows(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Convert one page of chart rows and append it to the columns"""
+        if not rows:
+            return
+        self._reserve(len(rows))
+        first = rows[0]
+        start, end = self._size, self._size + len(rows)
+        for name, (_, sources) in OHLCV_COLUMNS.items():
+            source = next((field for field in sources if field in first), None)
+            if source is None:
+                # 분봉처럼 거래대금이 없는 차트는 0으로 채움
+                self._arrays[name][start:end] = 0
+                continue
+            kind, _ = self._kinds[name]
+            values = to_numpy_column([row.get(source) for row in rows], kind)
+            if kind == FLOAT:
+                # 소수 지수 가격의 부호는 전일 대비 방향이므로 제거
+                values = self._np.abs(values)
+            elif values.dtype.kind == "f" and self._arrays[name].dtype.kind != "f":
+                # 소수/NaN이 섞인 페이지: int64로 넣으면 잘리거나 쓰레기 값이 되므로 컬럼을 float64로 승격
+                self._arrays[name] = self._arrays[name].astype(values.dtype)
+            self._arrays[name][start:end] = values
+        self._size = end
+
+    def sort(self) -> "OHLCVColumns":
+        """Sort all columns by dt ascending (Kiwoom returns newest first)"""
+        order = self._np.argsort(self["dt"], kind="stable")
+        for name in OHLCV_COLUMNS:
+            self._arrays[name][: self._size] = self._arrays[name][: self._size][order]
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return trimmed copies of every column"""
+        return {name: self[name].copy() for name in OHLCV_COLUMNS}
+
+def list_key_for(api_id: Optional[str]) -> Optional[str]:
+    return CHART_LIST_KEYS.get(api_id or "")
+
+def columns_for(api_id: Optional[str], capacity: int = 1024) -> OHLCVColumns:
+    """Return an empty OHLCVColumns whose price dtype suits the chart api-id"""
+    return OHLCVColumns(capacity, decimal_prices=(api_id or "") in DECIMAL_PRICE_API_IDS)
@@ -0,0 +1,236 @@
+"""로컬 차트 히스토리 저장소
+
+종목·주기별로 OHLCV 봉을 고정 길이 이진 레코드 파일(<root>/<timeframe>/<code>.bin)에 저장하고,
+읽을 때는 np.memmap으로 파일을 그대로 매핑하므로 파싱이나 복사가 없습니다.
+sync()는 저장된 마지막 일자 이후(마지막 봉 포함)만 연속조회로 받아, 그 일자 이전의 기존 레코드와 합칩니다.
+파일은 임시 파일에 다시 쓴 뒤 os.replace로 교체하므로, 이미 매핑해 둔 배열이나 동시에 읽는 프로세스는
+항상 이전 파일이나 완성된 새 파일 중 하나를 봅니다. 단, Windows는 매핑된 파일의 교체를 허용하지 않으므로
+load()/read()로 받은 배열이 남아 있는 종목은 sync()가 PermissionError로 실패합니다 (HistoryStore 참고).
+
+파일 형식: 16바이트 헤더(_MAGIC) + record_dtype() 레코드 배열 (일자 오름차순, little-endian dt int64 + 나머지 float64)
+
+Example:
+    >>> store = HistoryStore("~/kiwoom-history", chart=Chart(session=session))
+    >>> store.sync("005930", "daily", start_date="20150101")
+    >>> bars = store.read("005930", "daily", start="20240101")
+    >>> bars["cur_prc"].mean()
+"""
+import asyncio
+import os
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, Optional
+
+from kiwoom_rest_api.config import HISTORY_PATH
+from kiwoom_rest_api.data.columnar import OHLCV_COLUMNS, OHLCVColumns
+from kiwoom_rest_api.data.numeric import require_numpy
+from kiwoom_rest_api.data.storage import atomic_open
+
+# 주기 → Chart 메서드 (모두 stk_cd, base_dt, upd_stkpc_tp 인자를 받음)
+TIMEFRAMES = {
+    "daily": "stock_daily_chart_request_ka10081",
+    "weekly": "stock_weekly_chart_request_ka10082",
+    "monthly": "stock_monthly_chart_request_ka10083",
+}
+
+# 버전 1은 모든 컬럼이 int64였음
+_MAGIC = b"KWOHLCV2" + b"\x00" * 8
+_HEADER_SIZE = len(_MAGIC)
+
+def record_dtype():
+    """Structured dtype of one stored bar (little-endian int64 dt, float64 prices and volumes)
+
+    가격·거래량은 소수나 빈 값(NaN)이 있어도 그대로 보관하도록 float64입니다.
+    """
+    np = require_numpy()
+    return np.dtype([(name, "<i8" if name == "dt" else "<f8") for name in OHLCV_COLUMNS])
+
+def default_history_path() -> str:
+    """Return the store root (KIWOOM_HISTORY_PATH or ~/.cache/kiwoom_rest_api/history)"""
+    if HISTORY_PATH:
+        return HISTORY_PATH
+    return os.path.join(os.path.expanduser("~"), ".cache", "kiwoom_rest_api", "history")
+
+class HistoryStore:
+    """Incremental, memory-mapped OHLCV history per code and timeframe
+
+    한 저장소 디렉터리에는 한 번에 하나의 프로세스만 sync()하는 것을 전제로 합니다.
+    쓰기는 파일 교체(os.replace)로 이루어지므로 읽기는 잠금 없이 언제든 가능하며, load()/read()로 받은 배열은
+    이후 sync()와 관계없이 받은 시점의 봉을 유지합니다 (최신 봉은 다시 load()).
+    Windows에서는 매핑된 파일을 교체할 수 없으므로, 같은 종목을 sync()하기 전에 load()/read()로 받은 배열을
+    모두 해제하거나(del) 계속 쓸 배열은 복사본(.copy())으로 보관하세요. 매핑이 남아 있으면 파일은 그대로 두고
+    PermissionError가 발생합니다.
+    수정주가(upd_stkpc_tp="1")는 권리락 등으로 과거 봉이 바뀔 수 있으므로, 그런 경우 full=True로 다시 받으세요.
+
+    Args:
+        root: 저장소 디렉터리. 생략 시 default_history_path()
+        chart: 데이터를 받아올 Chart 인스턴스 (sync()/sync_async()에 필요)
+    """
+
+    def __init__(self, root: Optional[str] = None, chart=None):
+        self.np = require_numpy()
+        self.root = os.path.expanduser(root or default_history_path())
+        self.chart = chart
+        self.dtype = record_dtype()
+        self._lock = threading.Lock()
+
+    def path(self, code: str, timeframe: str = "daily") -> str:
+        _check_timeframe(timeframe)
+        return os.path.join(self.root, timeframe, f"{code}.bin")
+
+    def _count(self, path: str) -> int:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return 0
+        # 쓰기 도중 중단되어 남은 불완전한 레코드는 무시
+        return max(0, (size - _HEADER_SIZE) // self.dtype.itemsize)
+
+    def codes(self, timeframe: str = "daily"):
+        """Iterate over the codes stored for a timeframe"""
+        directory = os.path.join(self.root, timeframe)
+        if not os.path.isdir(directory):
+            return
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".bin"):
+                yield name[:-4]
+
+    def load(self, code: str, timeframe: str = "daily"):
+        """Memory-map every stored bar of one code (read-only, zero-copy)
+
+        Returns:
+            record_dtype() 구조체 배열. 저장된 봉이 없으면 길이 0 배열
+        """
+        path = self.path(code, timeframe)
+        count = self._count(path)
+        if count == 0:
+            return self.np.empty(0, dtype=self.dtype)
+        _check_header(path)
+        return self.np.memmap(path, dtype=self.dtype, mode="r", offset=_HEADER_SIZE, shape=(count,))
+
+    def read(self, code: str, timeframe: str = "daily", start: Optional[str] = None, end: Optional[str] = None):
+        """Return the bars with start <= dt <= end as a zero-copy view of the mapped file
+
+        Args:
+            start, end: YYYYMMDD (포함). 생략 시 처음/끝까지
+        """
+        bars = self.load(code, timeframe)
+        dates = bars["dt"]
+        lo = int(self.np.searchsorted(dates, int(start), side="left")) if start else 0
+        hi = int(self.np.searchsorted(dates, int(end), side="right")) if end else len(bars)
+        return bars[lo:hi]
+
+    def last_date(self, code: str, timeframe: str = "daily") -> Optional[str]:
+        """Date of the newest stored bar, or None"""
+        bars = self.load(code, timeframe)
+        return str(int(bars["dt"][-1])) if len(bars) else None
+
+    def _fetch_args(self, code: str, timeframe: str, base_dt: Optional[str], upd_stkpc_tp: str):
+        if self.chart is None:
+            raise RuntimeError("HistoryStore.sync() requires a Chart instance (HistoryStore(chart=...))")
+        method = getattr(self.chart, TIMEFRAMES[timeframe])
+        return method, (code, base_dt or datetime.now().strftime("%Y%m%d"), upd_stkpc_tp)
+
+    def _stop_date(self, code: str, timeframe: str, start_date: Optional[str], full: bool) -> Optional[str]:
+        _check_timeframe(timeframe)
+        if full:
+            return start_date
+        # 마지막 봉(장중에 받은 미완성 봉일 수 있음)부터 다시 받아 덮어씀
+        return self.last_date(code, timeframe) or start_date
+
+    def sync(
+        self,
+        code: str,
+        timeframe: str = "daily",
+        base_dt: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        start_date: Optional[str] = None,
+        full: bool = False,
+    ) -> int:
+        """Fetch the bars missing from the local file and merge them into it
+
+        Args:
+            code: 종목코드
+            timeframe: "daily"(ka10081), "weekly"(ka10082), "monthly"(ka10083)
+            base_dt: 기준일자 YYYYMMDD (기본값: 오늘)
+            upd_stkpc_tp: 수정주가구분 (0 or 1)
+            start_date: 처음 받을 때 이 날짜 이전 봉은 받지 않음 (생략 시 제공되는 전체 기간)
+            full: 저장된 봉을 버리고 처음부터 다시 받음
+
+        Returns:
+            새로 쓴 봉 개수 (덮어쓴 마지막 봉 포함)
+        """
+        method, args = self._fetch_args(code, timeframe, base_dt, upd_stkpc_tp)
+        stop_date = self._stop_date(code, timeframe, start_date, full)
+        columns = self.chart.ohlcv(method, *args, stop_date=stop_date)
+        return self.write(code, timeframe, columns, replace=full)
+
+    async def sync_async(
+        self,
+        code: str,
+        timeframe: str = "daily",
+        base_dt: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        start_date: Optional[str] = None,
+        full: bool = False,
+    ) -> int:
+        """sync()의 비동기 버전 (use_async=True Chart 전용)
+
+        write()는 기존 레코드를 복사하고 fsync하므로 이벤트 루프를 막지 않도록 실행기 스레드에서 수행합니다.
+        """
+        method, args = self._fetch_args(code, timeframe, base_dt, upd_stkpc_tp)
+        stop_date = self._stop_date(code, timeframe, start_date, full)
+        columns = await self.chart.ohlcv_async(method, *args, stop_date=stop_date)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.write, code, timeframe, columns, replace=full))
+
+    def write(self, code: str, timeframe: str, columns: OHLCVColumns, replace: bool = False) -> int:
+        """Merge date-sorted bars into the file
+
+        columns의 첫 일자 이상인 기존 레코드는 버리고 새 레코드를 덧붙인 파일을 임시 파일로 만든 뒤 교체하므로,
+        파일은 항상 일자 오름차순이며 같은 일자는 최신 값으로 교체됩니다.
+        """
+        if len(columns) == 0 and not replace:
+            return 0
+        records = self.np.empty(len(columns), dtype=self.dtype)
+        for name in OHLCV_COLUMNS:
+            records[name] = columns[name]
+        path = self.path(code, timeframe)
+        with self._lock:
+            count = 0 if replace else self._count(path)
+            keep = 0
+            if count and len(records):
+                _check_header(path)
+                existing = self.np.memmap(path, dtype=self.dtype, mode="r", offset=_HEADER_SIZE, shape=(count,))
+                keep = int(self.np.searchsorted(existing["dt"], records["dt"][0], side="left"))
+                del existing
+            try:
+                with atomic_open(path, "wb") as out:
+                    out.write(_MAGIC)
+                    if keep:
+                        with open(path, "rb") as f:
+                            f.seek(_HEADER_SIZE)
+                            out.write(f.read(keep * self.dtype.itemsize))
+                    out.write(records.tobytes())
+            except PermissionError as e:
+                # Windows: load()/read()로 매핑된 파일은 os.replace로 교체할 수 없음 (기존 파일은 그대로 남음)
+                raise PermissionError(
+                    f"Cannot replace {path}; it is probably still memory-mapped by an array from load()/read(). "
+                    "Release those arrays (del) or keep copies (.copy()) before syncing this code."
+                ) from e
+        return len(records)
+
+    def to_columns(self, code: str, timeframe: str = "daily") -> Dict[str, Any]:
+        """Return the stored bars as a dict of column views (same layout as OHLCVColumns.to_dict())"""
+        bars = self.load(code, timeframe)
+        return {name: bars[name] for name in OHLCV_COLUMNS}
+
+def _check_header(path: str) -> None:
+    with open(path, "rb") as f:
+        if f.read(_HEADER_SIZE) != _MAGIC:
+            raise ValueError(f"Not a current kiwoom_rest_api history file: {path} (sync with full=True to rebuild it)")
+
+def _check_timeframe(timeframe: str) -> None:
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unknown timeframe: {timeframe!r} (choose from {', '.join(TIMEFRAMES)})")
@@ -0,0 +1,252 @@
+"""키움 응답의 부호 포함 문자열 숫자("+156600", "-1", "00000197", "+28.68")를 숫자로 변환
+
+필드 종류:
+    PRICE: 가격. 부호는 전일 대비 방향(상승/하락)을 뜻하므로 절대값 정수로 변환 (cur_prc, open_pric, sel_bid ...)
+    INT:   부호 있는 정수 (trde_qty, pred_pre, acc_trde_prica ...)
+    FLOAT: 부호 있는 실수 (flu_rt, cntr_str ...). decimal=True이면 Decimal
+
+Example:
+    >>> convert_row({"stk_cd": "005930", "cur_prc": "-56600", "pred_pre": "-1000", "flu_rt": "-1.73"})
+    {'stk_cd': '005930', 'cur_prc': 56600, 'pred_pre': -1000, 'flu_rt': -1.73}
+"""
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+PRICE = "price"
+INT = "int"
+FLOAT = "float"
+
+_PRICE_FIELDS = (
+    "cur_prc", "open_pric", "high_pric", "low_pric", "close_pric", "pred_close_pric", "base_pric",
+    "sel_bid", "buy_bid", "cntr_pric", "exp_cntr_pric", "52wk_hgst_pric", "52wk_lwst_pric",
+    "tdy_high_pric", "tdy_low_pric", "tdy_close_pric", "upl_pric", "lst_pric", "pur_pric",
+    "sel_1bid", "sel_2bid", "buy_1bid", "buy_2bid", "exec_pric", "ord_pric", "stop_pric",
+    "theory_pric", "wonju_pric", "repl_pric", "trace_cur_prc", "cur_prc_n",
+)
+_INT_FIELDS = (
+    "pred_pre", "trde_qty", "acc_trde_qty", "trde_prica", "acc_trde_prica", "now_trde_qty",
+    "pred_trde_qty", "prev_trde_qty", "cntr_qty", "buy_qty", "sell_qty", "sel_req", "buy_req",
+    "tot_sel_req", "tot_buy_req", "ord_qty", "rmnd_qty", "trde_able_qty", "netprps_qty",
+    "sel_trde_qty", "buy_trde_qty", "pur_amt", "evlt_amt", "evltv_prft", "tot_pur_amt",
+    "tot_evlt_amt", "tot_evlt_pl", "prsm_dpst_aset_amt", "entr", "d2_entra", "mac", "flo_stk",
+    "cap", "stk_num", "rising_stk_num", "fall_stk_num", "rising", "fall", "stdns", "upl", "lst",
+    "oso_qty", "cncl_qty", "cnfm_qty", "trace_pred_pre", "pred_pre_n", "trde_qty_n", "acc_trde_qty_n",
+)
+_FLOAT_FIELDS = (
+    "flu_rt", "pre_rt", "pl_rt", "prft_rt", "tot_prft_rt", "cntr_str", "cntr_str_5min",
+    "cntr_str_20min", "cntr_str_60min", "for_wght", "poss_rt", "trde_tern_rt", "tern_rt", "dt_prft_rt",
+    "per", "pbr", "eps", "bps", "roe", "ev", "flu_rt_n", "trace_flu_rt", "52wk_hgst_pric_pre_rt",
+    "52wk_lwst_pric_pre_rt", "dispty_rt", "limit_exh_rt", "crd_rt", "for_exh_rt",
+)
+
+# 필드명 → 종류. 필요 시 사용자 스키마로 덮어쓸 수 있음
+DEFAULT_SCHEMA: Dict[str, str] = {
+    **{name: PRICE for name in _PRICE_FIELDS},
+    **{name: INT for name in _INT_FIELDS},
+    **{name: FLOAT for name in _FLOAT_FIELDS},
+}
+
+# 스키마에 없는 필드의 종류를 접미사로 추정 (코드/이름/일자/구분 필드는 변환하지 않음)
+_SUFFIX_RULES = (
+    (("_rt",), FLOAT),
+    (("_prc", "_pric", "_bid"), PRICE),
+    (("_qty", "_amt", "_prica", "_cnt", "_req", "_pre"), INT),
+)
+
+def infer_field_type(name: str) -> Optional[str]:
+    """Guess a field's kind from its suffix, or None for non-numeric fields"""
+    for suffixes, kind in _SUFFIX_RULES:
+        if name.endswith(suffixes):
+            return kind
+    return None
+
+def _parse_slow(text: str, kind: str, decimal: bool) -> Any:
+    # "--100", "+-5", "1,234" 처럼 int()/float()가 바로 처리하지 못하는 형태
+    negative = False
+    index = 0
+    while index < len(text) and text[index] in "+-":
+        negative ^= text[index] == "-"
+        index += 1
+    digits = text[index:].replace(",", "").strip()
+    if kind == FLOAT:
+        number = Decimal(digits) if decimal else float(digits)
+    else:
+        number = int(digits) if "." not in digits else float(digits)
+    if kind == PRICE:
+        return number
+    return -number if negative else number
+
+def parse_number(value: Any, kind: str = INT, decimal: bool = False) -> Any:
+    """Convert one Kiwoom string number; empty strings become None
+
+    숫자로 해석할 수 없는 값은 원래 문자열을 그대로 반환합니다.
+    int()/float()/Decimal()이 받아들이는 밑줄 구분("1_000")은 키움 형식이 아니므로 해석하지 않습니다.
+    """
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if not text:
+        return None
+    if "_" in text:
+        return value
+    try:
+        if kind == FLOAT:
+            return Decimal(text) if decimal else float(text)
+        number = int(text)
+        return abs(number) if kind == PRICE else number
+    except (ValueError, InvalidOperation):
+        try:
+            return _parse_slow(text, kind, decimal)
+        except (ValueError, InvalidOperation):
+            return value
+
+def _converter_for(name: str, schema: Dict[str, str], infer: bool, decimal: bool) -> Optional[Callable[[Any], Any]]:
+    kind = schema.get(name)
+    if kind is None and infer:
+        kind = infer_field_type(name)
+    if kind is None:
+        return None
+    return lambda value: parse_number(value, kind, decimal)
+
+def convert_rows(
+    rows: Iterable[Dict[str, Any]],
+    schema: Optional[Dict[str, str]] = None,
+    infer: bool = True,
+    decimal: bool = False,
+    inplace: bool = False,
+) -> List[Dict[str, Any]]:
+    """Convert every known numeric field of a list of rows
+
+    필드별 변환 함수는 한 번만 결정되어 모든 행에 재사용됩니다.
+
+    Args:
+        rows: 응답의 리스트 필드 (예: result["stk_dt_pole_chart_qry"])
+        schema: 필드명 → PRICE/INT/FLOAT. 기본값 DEFAULT_SCHEMA
+        infer: 스키마에 없는 필드를 접미사(_rt, _qty, _pric ...)로 추정할지 여부
+        decimal: FLOAT 필드를 Decimal로 변환
+        inplace: 새 dict를 만들지 않고 기존 행을 수정
+    """
+    schema = DEFAULT_SCHEMA if schema is None else schema
+    converters: Dict[str, Optional[Callable[[Any], Any]]] = {}
+    result = []
+    for row in rows:
+        target = row if inplace else dict(row)
+        for name, value in row.items():
+            if name not in converters:
+                converters[name] = _converter_for(name, schema, infer, decimal)
+            converter = converters[name]
+            if converter is not None:
+                target[name] = converter(value)
+        result.append(target)
+    return result
+
+def convert_row(
+    row: Dict[str, Any],
+    schema: Optional[Dict[str, str]] = None,
+    infer: bool = True,
+    decimal: bool = False,
+) -> Dict[str, Any]:
+    """Convert the numeric fields of a single dict"""
+    return convert_rows([row], schema=schema, infer=infer, decimal=decimal)[0]
+
+def convert_response(
+    response: Dict[str, Any],
+    schema: Optional[Dict[str, str]] = None,
+    infer: bool = True,
+    decimal: bool = False,
+) -> Dict[str, Any]:
+    """Convert top-level numeric fields and every list-of-dicts field of a response
+
+    return_code, cont-yn, next-key 등 응답 메타 필드는 그대로 둡니다.
+    """
+    converted = convert_row(
+        {k: v for k, v in response.items() if not isinstance(v, list)}, schema=schema, infer=infer, decimal=decimal
+    )
+    for name, value in response.items():
+        if isinstance(value, list):
+            if value and isinstance(value[0], dict):
+                converted[name] = convert_rows(value, schema=schema, infer=infer, decimal=decimal)
+            else:
+                converted[name] = value
+    return converted
+
+def require_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for columnar conversion. Install it with: pip install kiwoom-rest-api[numpy]"
+        ) from e
+    return numpy
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+def _parse_column(filled, empty, kind: str):
+    # 원소별 변환. 소수, int64 범위를 넘는 정수, 해석할 수 없는 값("N/A" 등)이 하나라도 있으면 float64로 만들고
+    # 해석할 수 없는 값은 NaN
+    np = require_numpy()
+    values = []
+    integral = kind != FLOAT
+    for text, is_empty in zip(filled.tolist(), empty.tolist()):
+        if is_empty:
+            number = np.nan if kind == FLOAT else 0
+        else:
+            number = parse_number(text, kind)
+            if isinstance(number, str):
+                number = np.nan
+        if not isinstance(number, int) or not _INT64_MIN <= number <= _INT64_MAX:
+            integral = False
+        values.append(number)
+    return np.array(values, dtype=np.int64 if integral else np.float64)
+
+def to_numpy_column(values: Sequence[Any], kind: str = INT):
+    """Vectorized conversion of one string column to a NumPy array
+
+    PRICE/INT → int64 (빈 값은 0), FLOAT → float64 (빈 값은 NaN).
+    PRICE/INT 열에 소수("-2394.49")가 섞여 있으면 잘라내지 않고 float64로 반환하며,
+    숫자로 해석할 수 없는 값("N/A", "1_000" 등)은 예외 없이 NaN이 되고, int64 범위를 넘는 정수는 float64 근사값이 됩니다.
+    """
+    np = require_numpy()
+    raw = np.asarray(["" if value is None else str(value).strip() for value in values], dtype=np.str_)
+    empty = raw == ""
+    if kind == FLOAT:
+        filled = np.where(empty, "nan", raw)
+        dtype = np.float64
+    else:
+        filled = np.where(empty, "0", raw)
+        dtype = np.int64
+    try:
+        # NumPy도 밑줄 구분("1_000")을 숫자로 받아들이므로 그런 값이 있으면 원소별 변환에서 거름
+        if (np.char.find(filled, "_") >= 0).any():
+            raise ValueError("underscore digit separator")
+        column = filled.astype(dtype)
+    except (ValueError, OverflowError):
+        # 드문 형식("--100", "1,234"), 소수, int64 범위 초과, 해석할 수 없는 값이 섞여 있으면 원소별 변환으로 대체
+        column = _parse_column(filled, empty, kind)
+    if kind == PRICE:
+        column = np.abs(column)
+    return column
+
+def to_numpy_columns(
+    rows: Sequence[Dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    schema: Optional[Dict[str, str]] = None,
+    infer: bool = True,
+) -> Dict[str, Any]:
+    """Convert a list of rows to a dict of NumPy arrays, one per field
+
+    숫자 필드는 to_numpy_column으로 벡터화 변환하고, 나머지(종목코드, 일자 등)는 문자열 배열로 둡니다.
+    """
+    np = require_numpy()
+    schema = DEFAULT_SCHEMA if schema is None else schema
+    if fields is None:
+        fields = list(rows[0].keys()) if rows else []
+    columns = {}
+    for name in fields:
+        values = [row.get(name, "") for row in rows]
+        kind = schema.get(name) or (infer_field_type(name) if infer else None)
+        if kind is None:
+            columns[name] = np.asarray(values, dtype=np.str_)
+        else:
+            columns[name] = to_numpy_column(values, kind)
+    return columns
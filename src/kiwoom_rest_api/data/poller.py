@@ -0,0 +1,197 @@
+"""전 종목 시세 스냅샷 폴링과 변경분 감지
+
+SnapshotPoller는 주기적으로 시세를 받아 (종목 x 필드) float64 배열에 보관하고, 직전 스냅샷과의
+차이를 배열 연산으로 한 번에 계산한 뒤 값이 바뀐 종목만 구독자(콜백 또는 asyncio.Queue)에 전달합니다.
+후속 처리량은 전체 종목 수가 아니라 변경된 종목 수에 비례합니다.
+
+Example:
+    >>> stock_info = StockInfo(session=session, use_async=True)
+    >>> poller = SnapshotPoller(stock_info, codes, interval=1.0)
+    >>> poller.subscribe(lambda diff: print(diff.codes, diff.delta[:, 0]))
+    >>> await poller.run()
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence
+
+from kiwoom_rest_api.core.hooks import logger
+from kiwoom_rest_api.data.numeric import DEFAULT_SCHEMA, FLOAT, infer_field_type, require_numpy, to_numpy_column
+
+DEFAULT_FIELDS = ("cur_prc", "flu_rt", "trde_qty", "sel_bid", "buy_bid")
+
+QuoteFetcher = Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]]
+
+class SnapshotDiff:
+    """Rows that changed between two snapshots
+
+    Attributes:
+        codes: 변경된 종목코드 배열
+        fields: 필드명 튜플 (values/delta/changed의 열 순서)
+        values: 변경된 종목의 현재 값 (len(codes) x len(fields))
+        delta: 직전 스냅샷 대비 변화량. 처음 관측된 값은 NaN
+        changed: 필드별 변경 여부 (bool)
+        timestamp: 스냅샷 시각 (time.time())
+    """
+
+    __slots__ = ("codes", "fields", "values", "delta", "changed", "timestamp")
+
+    def __init__(self, codes, fields: Sequence[str], values, delta, changed, timestamp: float):
+        self.codes = codes
+        self.fields = tuple(fields)
+        self.values = values
+        self.delta = delta
+        self.changed = changed
+        self.timestamp = timestamp
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the changed rows as dicts ({"stk_cd", field, f"{field}_delta", ...})"""
+        for index, code in enumerate(self.codes.tolist()):
+            row: Dict[str, Any] = {"stk_cd": code}
+            for column, field in enumerate(self.fields):
+                row[field] = float(self.values[index, column])
+                row[f"{field}_delta"] = float(self.delta[index, column])
+            yield row
+
+class SnapshotPoller:
+    """Poll quotes for a fixed universe and publish only the rows that changed
+
+    Args:
+        stock_info: use_async=True StockInfo (기본 fetch는 ka10095 watchlist_quotes)
+        codes: 감시할 종목코드 목록
+        fields: 비교할 숫자 필드
+        interval: 폴링 주기(초)
+        fetch: 시세를 가져올 코루틴 함수 (codes → {stk_cd: row}). 생략 시 stock_info.watchlist_quotes
+        emit_initial: 첫 스냅샷도 전체 변경분으로 전달할지 여부
+    """
+
+    def __init__(
+        self,
+        stock_info,
+        codes: Sequence[str],
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        interval: float = 1.0,
+        fetch: Optional[QuoteFetcher] = None,
+        emit_initial: bool = True,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+    ):
+        self.np = require_numpy()
+        self.stock_info = stock_info
+        self.codes = self.np.asarray(list(dict.fromkeys(codes)), dtype=self.np.str_)
+        self.fields = tuple(fields)
+        self.interval = interval
+        self.emit_initial = emit_initial
+        self._fetch = fetch or (
+            lambda codes: stock_info.watchlist_quotes(codes, chunk_size=chunk_size, concurrency=concurrency)
+        )
+        self._kinds = [DEFAULT_SCHEMA.get(field) or infer_field_type(field) or FLOAT for field in self.fields]
+        self._index = {code: i for i, code in enumerate(self.codes.tolist())}
+        # 아직 관측되지 않은 값은 NaN
+        self.snapshot = self.np.full((len(self.codes), len(self.fields)), self.np.nan)
+        self.updated_at: Optional[float] = None
+        self._callbacks: List[Callable[[SnapshotDiff], Any]] = []
+        self._queues: List[asyncio.Queue] = []
+        self._running = False
+
+    def subscribe(self, callback: Callable[[SnapshotDiff], Any]) -> None:
+        """Call callback(diff) for every snapshot with at least one change"""
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[SnapshotDiff], Any]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def queue(self, maxsize: int = 0) -> asyncio.Queue:
+        """Return a new asyncio.Queue receiving every SnapshotDiff"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._queues.append(queue)
+        return queue
+
+    def _to_matrix(self, quotes: Dict[str, Dict[str, Any]]):
+        np = self.np
+        rows = [quotes.get(code) for code in self.codes.tolist()]
+        present = np.fromiter((row is not None for row in rows), dtype=bool, count=len(rows))
+        matrix = self.snapshot.copy()
+        if not present.any():
+            return matrix
+        received = [row for row in rows if row is not None]
+        for column, (field, kind) in enumerate(zip(self.fields, self._kinds)):
+            raw = [row.get(field) for row in received]
+            values = to_numpy_column(raw, kind).astype(np.float64)
+            # to_numpy_column은 PRICE/INT의 빈 값을 0으로 채우므로, 빠지거나 빈 값은 해석할 수 없는 값처럼 NaN으로 되돌림
+            blank = np.fromiter((value is None or not str(value).strip() for value in raw), dtype=bool, count=len(raw))
+            values[blank] = np.nan
+            # NaN인 칸은 직전 값을 유지해 값이 잠시 빠진 것을 변경으로 보지 않음
+            matrix[present, column] = np.where(np.isnan(values), matrix[present, column], values)
+        return matrix
+
+    def update(self, quotes: Dict[str, Dict[str, Any]], timestamp: Optional[float] = None) -> SnapshotDiff:
+        """Apply one snapshot ({stk_cd: row}) and return what changed
+
+        응답에 없는 종목, 그리고 응답에서 빠지거나 비어 있거나 숫자로 해석할 수 없는 필드는
+        직전 값을 유지하므로 변경으로 보지 않습니다.
+        """
+        np = self.np
+        current = self._to_matrix(quotes)
+        previous = self.snapshot
+        both_nan = np.isnan(current) & np.isnan(previous)
+        changed = (current != previous) & ~both_nan
+        if self.updated_at is None and not self.emit_initial:
+            changed[:] = False
+        rows = np.flatnonzero(changed.any(axis=1))
+        diff = SnapshotDiff(
+            codes=self.codes[rows],
+            fields=self.fields,
+            values=current[rows],
+            delta=current[rows] - previous[rows],
+            changed=changed[rows],
+            timestamp=timestamp if timestamp is not None else time.time(),
+        )
+        self.snapshot = current
+        self.updated_at = diff.timestamp
+        return diff
+
+    def _publish(self, diff: SnapshotDiff) -> None:
+        for callback in list(self._callbacks):
+            try:
+                callback(diff)
+            except Exception:
+                logger.exception("Snapshot subscriber %r failed", callback)
+        for queue in self._queues:
+            try:
+                queue.put_nowait(diff)
+            except asyncio.QueueFull:
+                logger.warning("Snapshot queue full; dropping diff with %d rows", len(diff))
+
+    async def poll_once(self) -> SnapshotDiff:
+        """Fetch one snapshot, publish its changes and return the diff"""
+        quotes = await self._fetch(self.codes.tolist())
+        diff = self.update(quotes)
+        if len(diff):
+            self._publish(diff)
+        return diff
+
+    async def run(self, iterations: Optional[int] = None) -> None:
+        """Poll every `interval` seconds until stop() is called (or for `iterations` polls)
+
+        요청 실패는 기록만 하고 다음 주기에 다시 시도합니다.
+        """
+        self._running = True
+        count = 0
+        while self._running and (iterations is None or count < iterations):
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.warning("Snapshot poll failed: %r", e)
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def stop(self) -> None:
+        """Stop run() after the current poll"""
+        self._running = False
@@ -0,0 +1,107 @@
+"""ka10095(관심종목정보) 일괄 시세 조회
+
+ka10095는 "|"로 연결한 여러 종목코드를 한 번에 조회하므로, 종목마다 ka10001을 호출하는 대신
+종목 목록을 고른 크기의 묶음으로 나누어 동시에 요청하고 결과를 stk_cd 기준 dict 하나로 합칩니다.
+
+Example:
+    >>> quotes = stock_info.watchlist_quotes(["005930", "000660", "035420"])
+    >>> quotes["005930"]["cur_prc"]
+"""
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List
+
+from kiwoom_rest_api.data.numeric import convert_rows
+
+# 요청 한 번에 담을 최대 종목 수
+WATCHLIST_CHUNK_SIZE = 100
+WATCHLIST_LIST_KEY = "atn_stk_infr"
+
+def chunk_codes(codes: Iterable[str], chunk_size: int = WATCHLIST_CHUNK_SIZE) -> List[List[str]]:
+    """Split codes into the fewest chunks of at most chunk_size, sized as evenly as possible
+
+    중복 코드는 한 번만 요청합니다. 예: 250개, chunk_size=100 → 84/83/83 (100/100/50 대신)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    unique = list(dict.fromkeys(code for code in codes if code))
+    if not unique:
+        return []
+    count = math.ceil(len(unique) / chunk_size)
+    size, extra = divmod(len(unique), count)
+    chunks = []
+    start = 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(unique[start:end])
+        start = end
+    return chunks
+
+def _merge(quotes: Dict[str, Dict[str, Any]], rows: List[Dict[str, Any]], convert: bool) -> None:
+    if convert:
+        rows = convert_rows(rows, inplace=True)
+    for row in rows:
+        code = row.get("stk_cd")
+        if code:
+            quotes[code] = row
+
+def _fetch_chunk(stock_info, chunk: List[str]) -> List[Dict[str, Any]]:
+    return list(stock_info.paginate(
+        stock_info.watchlist_stock_information_request_ka10095, "|".join(chunk), list_key=WATCHLIST_LIST_KEY, rows=True
+    ))
+
+async def _fetch_chunk_async(stock_info, chunk: List[str], semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+    async with semaphore:
+        return [
+            row async for row in stock_info.paginate_async(
+                stock_info.watchlist_stock_information_request_ka10095, "|".join(chunk),
+                list_key=WATCHLIST_LIST_KEY, rows=True,
+            )
+        ]
+
+def fetch_quotes(
+    stock_info,
+    codes: Iterable[str],
+    chunk_size: int = WATCHLIST_CHUNK_SIZE,
+    concurrency: int = 4,
+    convert: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch quotes for many codes with a synchronous StockInfo, running chunks in a thread pool
+
+    Args:
+        stock_info: use_async=False StockInfo 인스턴스
+        codes: 종목코드 목록
+        chunk_size: 요청 한 번에 담을 최대 종목 수
+        concurrency: 동시에 보낼 묶음 요청 수
+        convert: True이면 숫자 필드를 numeric.convert_rows로 변환
+
+    Returns:
+        stk_cd → 관심종목정보 행
+    """
+    chunks = chunk_codes(codes, chunk_size)
+    quotes: Dict[str, Dict[str, Any]] = {}
+    if len(chunks) <= 1 or concurrency <= 1:
+        for chunk in chunks:
+            _merge(quotes, _fetch_chunk(stock_info, chunk), convert)
+        return quotes
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+        for rows in executor.map(lambda chunk: _fetch_chunk(stock_info, chunk), chunks):
+            _merge(quotes, rows, convert)
+    return quotes
+
+async def fetch_quotes_async(
+    stock_info,
+    codes: Iterable[str],
+    chunk_size: int = WATCHLIST_CHUNK_SIZE,
+    concurrency: int = 4,
+    convert: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Async counterpart of fetch_quotes for use_async=True StockInfo instances"""
+    chunks = chunk_codes(codes, chunk_size)
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    results = await asyncio.gather(*(_fetch_chunk_async(stock_info, chunk, semaphore) for chunk in chunks))
+    quotes: Dict[str, Dict[str, Any]] = {}
+    for rows in results:
+        _merge(quotes, rows, convert)
+    return quotes
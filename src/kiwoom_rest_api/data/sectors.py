@@ -0,0 +1,242 @@
+"""업종 분석: ka20003(전업종지수)와 ka20002(업종별주가)를 배열로 적재해 업종별 지표를 벡터 연산으로 계산
+
+업종 지표 (ka20003 행 기준):
+    breadth: (상승+상한 - 하락-하한) / 전체 종목수
+    ad_ratio: 상승(+상한) / 하락(+하한). 하락 종목이 없으면 NaN
+    turnover_share: 전체 거래대금 중 업종 거래대금 비중
+
+구성종목 지표 (ka20002 행 기준):
+    vw_return: 가중 평균 등락률. 기본 가중치는 거래대금(현재가 x 거래량),
+               shares(종목코드 → 상장주식수)를 주면 시가총액 가중
+    ew_return: 단순 평균 등락률
+
+refresh()는 매번 ka20003 한 번으로 전 업종을 받고, 지수나 거래량이 바뀐 업종의 구성종목(ka20002)만 다시 받습니다.
+ka20003 조회가 실패하거나 거절(1700 등)되면 이전 상태를 그대로 둡니다. 구성종목 조회가 실패하거나 거절된 업종은
+이전 구성종목 지표를 유지하고, 지수가 그대로여도 다음 refresh()에서 다시 받습니다. 동기/비동기 경로 모두 같습니다.
+
+Example:
+    >>> analytics = SectorAnalytics(index_code="001", mrkt_tp="0")
+    >>> await analytics.refresh_async(sector)      # use_async=True Sector
+    >>> table = analytics.summary()
+    >>> table["name"][table["breadth"].argsort()[::-1][:5]]
+"""
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from kiwoom_rest_api.core.breaker import REQUEST_ERRORS
+from kiwoom_rest_api.core.hooks import logger
+from kiwoom_rest_api.data.numeric import FLOAT, INT, PRICE, require_numpy, to_numpy_column
+
+INDEX_LIST_KEY = "all_inds_idex"
+CONSTITUENT_LIST_KEY = "inds_stkpc"
+
+# ka20003 숫자 필드 → 변환 종류. 지수(cur_prc)는 소수("+2450.37")이므로 FLOAT로 읽고 부호(전일 대비 방향)는 제거
+INDEX_FIELDS = {
+    "cur_prc": FLOAT,
+    "flu_rt": FLOAT,
+    "trde_qty": INT,
+    "trde_prica": INT,
+    "upl": INT,
+    "rising": INT,
+    "stdns": INT,
+    "fall": INT,
+    "lst": INT,
+    "flo_stk_num": INT,
+}
+
+# 절대값으로 바꾸는 지수 필드
+_INDEX_LEVEL_FIELDS = ("cur_prc",)
+
+# 갱신 여부를 판단하는 필드
+_CHANGE_FIELDS = ("cur_prc", "trde_qty")
+
+def _page_rows(api_id: str, pages: Iterable[Dict[str, Any]], list_key: str) -> Optional[List[Dict[str, Any]]]:
+    """Rows of a paged response, or None if any page was rejected (return_code != 0)"""
+    rows: List[Dict[str, Any]] = []
+    for page in pages:
+        if str(page.get("return_code", 0)) != "0":
+            logger.warning("%s rejected (%s: %s); keeping previous sector state",
+                           api_id, page.get("return_code"), page.get("return_msg"))
+            return None
+        rows.extend(page.get(list_key) or [])
+    return rows
+
+class SectorAnalytics:
+    """Vectorized per-industry breadth and return statistics
+
+    Args:
+        index_code: ka20003 업종코드 (001: 코스피 전업종, 101: 코스닥 전업종)
+        mrkt_tp: ka20002 시장구분 (0:코스피, 1:코스닥, 2:코스피200)
+        stex_tp: 거래소구분 (1:KRX, 2:NXT, 3:통합)
+        shares: 종목코드 → 상장주식수. 주면 vw_return을 시가총액 가중으로 계산 (예: SymbolMaster의 listCount)
+    """
+
+    def __init__(self, index_code: str = "001", mrkt_tp: str = "0", stex_tp: str = "1", shares: Optional[Dict[str, int]] = None):
+        self.np = require_numpy()
+        self.index_code = index_code
+        self.mrkt_tp = mrkt_tp
+        self.stex_tp = stex_tp
+        self.shares = shares
+        np = self.np
+        self.codes = np.empty(0, dtype=np.str_)
+        self.names = np.empty(0, dtype=np.str_)
+        self.index: Dict[str, Any] = {field: np.empty(0) for field in INDEX_FIELDS}
+        # 업종코드 → (상승, 하락, 보합, 가중 등락률, 단순 평균 등락률, 종목수)
+        self._constituents: Dict[str, tuple] = {}
+        # 지수는 갱신됐지만 구성종목을 아직 받지 못한 업종코드
+        self._pending: Set[str] = set()
+
+    def update_index(self, rows: Sequence[Dict[str, Any]]) -> List[str]:
+        """Load ka20003 rows and return the industry codes whose index or volume changed
+
+        이전 refresh에서 구성종목을 받지 못한 업종도 함께 반환합니다. update_constituents()가 호출될 때까지 대기 상태로 남습니다.
+        """
+        np = self.np
+        codes = np.asarray([row.get("stk_cd", "") for row in rows], dtype=np.str_)
+        columns = {
+            field: to_numpy_column([row.get(field, "") for row in rows], kind).astype(np.float64)
+            for field, kind in INDEX_FIELDS.items()
+        }
+        for field in _INDEX_LEVEL_FIELDS:
+            columns[field] = np.abs(columns[field])
+        if codes.shape == self.codes.shape and (codes == self.codes).all():
+            changed_mask = np.zeros(len(codes), dtype=bool)
+            for field in _CHANGE_FIELDS:
+                changed_mask |= columns[field] != self.index[field]
+            changed = [code for code, flag in zip(codes.tolist(), changed_mask.tolist()) if flag or code in self._pending]
+        else:
+            # 업종 구성이 달라졌으면 전부 갱신
+            changed = codes.tolist()
+            current = set(changed)
+            self._constituents = {code: stats for code, stats in self._constituents.items() if code in current}
+        self._pending = set(changed)
+        self.codes = codes
+        self.names = np.asarray([row.get("stk_nm", "") for row in rows], dtype=np.str_)
+        self.index = columns
+        return changed
+
+    def update_constituents(self, inds_cd: str, rows: Sequence[Dict[str, Any]]) -> None:
+        """Compute constituent breadth and weighted returns of one industry from ka20002 rows"""
+        np = self.np
+        self._pending.discard(inds_cd)
+        if not rows:
+            self._constituents[inds_cd] = (0, 0, 0, np.nan, np.nan, 0)
+            return
+        flu_rt = to_numpy_column([row.get("flu_rt", "") for row in rows], FLOAT)
+        price = to_numpy_column([row.get("cur_prc", "") for row in rows], PRICE).astype(np.float64)
+        if self.shares is not None:
+            weights = price * np.asarray([float(self.shares.get(row.get("stk_cd"), 0)) for row in rows])
+        else:
+            weights = price * to_numpy_column([row.get("now_trde_qty", "") for row in rows], INT)
+        valid = ~np.isnan(flu_rt)
+        weight_sum = weights[valid].sum()
+        vw_return = float((weights[valid] * flu_rt[valid]).sum() / weight_sum) if weight_sum > 0 else np.nan
+        ew_return = float(flu_rt[valid].mean()) if valid.any() else np.nan
+        self._constituents[inds_cd] = (
+            int((flu_rt > 0).sum()),
+            int((flu_rt < 0).sum()),
+            int((flu_rt == 0).sum()),
+            vw_return,
+            ew_return,
+            len(rows),
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-industry metrics as aligned NumPy columns (industry order of the last ka20003 response)"""
+        np = self.np
+        index = self.index
+        advancers = index["rising"] + index["upl"]
+        decliners = index["fall"] + index["lst"]
+        total = advancers + decliners + index["stdns"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            breadth = np.where(total > 0, (advancers - decliners) / total, np.nan)
+            ad_ratio = np.where(decliners > 0, advancers / decliners, np.nan)
+            value_total = index["trde_prica"].sum()
+            turnover_share = index["trde_prica"] / value_total if value_total > 0 else np.full(len(self.codes), np.nan)
+
+        stats = np.full((len(self.codes), 6), np.nan)
+        for position, code in enumerate(self.codes.tolist()):
+            if code in self._constituents:
+                stats[position] = self._constituents[code]
+        return {
+            "code": self.codes,
+            "name": self.names,
+            "index": index["cur_prc"],
+            "flu_rt": index["flu_rt"],
+            "advancers": advancers,
+            "decliners": decliners,
+            "breadth": breadth,
+            "ad_ratio": ad_ratio,
+            "turnover_share": turnover_share,
+            "vw_return": stats[:, 3],
+            "ew_return": stats[:, 4],
+            "members": stats[:, 5],
+        }
+
+    def refresh(self, sector) -> List[str]:
+        """Reload the industry index and the constituents of changed industries (sync Sector)
+
+        지수나 거래량이 바뀐 업종코드를 반환합니다. ka20003이 실패하면 아무것도 바꾸지 않고 빈 목록을 반환합니다.
+        동기 경로는 return_code 거절을 예외 없이 페이지로 돌려주므로 페이지마다 return_code를 확인합니다.
+        """
+        try:
+            rows = _page_rows("ka20003", sector.paginate(
+                sector.all_industries_index_request_ka20003, self.index_code, list_key=INDEX_LIST_KEY
+            ), INDEX_LIST_KEY)
+        except REQUEST_ERRORS as e:
+            logger.warning("ka20003 failed (%r); keeping previous sector state", e)
+            return []
+        if rows is None:
+            return []
+        changed = self.update_index(rows)
+        for inds_cd in changed:
+            try:
+                constituent_rows = _page_rows("ka20002", sector.paginate(
+                    sector.industrywise_stock_price_request_ka20002, self.mrkt_tp, inds_cd, self.stex_tp,
+                    list_key=CONSTITUENT_LIST_KEY,
+                ), CONSTITUENT_LIST_KEY)
+            except REQUEST_ERRORS as e:
+                logger.warning("ka20002 industry %s failed (%r); keeping its previous stats", inds_cd, e)
+                continue
+            if constituent_rows is not None:
+                self.update_constituents(inds_cd, constituent_rows)
+        return changed
+
+    async def refresh_async(self, sector, concurrency: int = 4) -> List[str]:
+        """Async counterpart of refresh(); changed industries are fetched concurrently"""
+        try:
+            rows = _page_rows("ka20003", [
+                page async for page in sector.paginate_async(
+                    sector.all_industries_index_request_ka20003, self.index_code, list_key=INDEX_LIST_KEY
+                )
+            ], INDEX_LIST_KEY)
+        except REQUEST_ERRORS as e:
+            # 비동기 경로는 return_code 거절을 APIError로 발생시킴
+            logger.warning("ka20003 failed (%r); keeping previous sector state", e)
+            return []
+        if rows is None:
+            return []
+        changed = self.update_index(rows)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(inds_cd: str) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
+                return _page_rows("ka20002", [
+                    page async for page in sector.paginate_async(
+                        sector.industrywise_stock_price_request_ka20002, self.mrkt_tp, inds_cd, self.stex_tp,
+                        list_key=CONSTITUENT_LIST_KEY,
+                    )
+                ], CONSTITUENT_LIST_KEY)
+
+        results = await asyncio.gather(*(fetch(code) for code in changed), return_exceptions=True)
+        unexpected = None
+        for inds_cd, constituent_rows in zip(changed, results):
+            if isinstance(constituent_rows, REQUEST_ERRORS):
+                logger.warning("ka20002 industry %s failed (%r); keeping its previous stats", inds_cd, constituent_rows)
+            elif isinstance(constituent_rows, BaseException):
+                unexpected = unexpected or constituent_rows
+            elif constituent_rows is not None:
+                self.update_constituents(inds_cd, constituent_rows)
+        if unexpected is not None:
+            raise unexpected
+        return changed
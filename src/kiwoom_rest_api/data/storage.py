@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Optional
+
+def default_data_path(filename: str) -> str:
+    """Return ~/.cache/kiwoom_rest_api/<filename>"""
+    return os.path.join(os.path.expanduser("~"), ".cache", "kiwoom_rest_api", filename)
+
+def read_json(path: str) -> Optional[Any]:
+    """Load a JSON file, or None if it is missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+@contextmanager
+def atomic_open(path: str, mode: str = "w", **kwargs: Any) -> Iterator[IO]:
+    """Open a temporary file next to path that replaces it (os.replace) only when the block succeeds
+
+    같은 디렉터리의 임시 파일에 쓰고 fsync한 뒤 교체하므로, 읽는 쪽은 항상 이전 파일이나 완성된 새 파일만 봅니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def atomic_write_json(path: str, data: Any) -> None:
+    """Write JSON through a temporary file and os.replace so readers never see a partial file"""
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
@@ -0,0 +1,307 @@
+"""종목 마스터
+
+ka10099(종목정보 리스트)로 전 시장의 종목을 받아 로컬 JSON 파일에 저장하고, 종목코드/종목명/시장/업종/상태별
+인덱스를 메모리에 구성합니다. 코드·이름 조회는 dict 한 번, 이름 접두어 검색은 정렬된 이름 목록의 이진 탐색입니다.
+
+Example:
+    >>> master = SymbolMaster.load()
+    >>> master.refresh(stock_info)              # 하루 한 번만 실제로 다시 받음
+    >>> master.resolve("삼성전자")
+    '005930'
+    >>> [s["code"] for s in master.search("삼성")][:3]
+    >>> kospi_normal = master.by_market["0"] - master.by_state.get("관리종목", set())
+"""
+import asyncio
+import bisect
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+from kiwoom_rest_api.config import SYMBOLS_PATH
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.breaker import CircuitOpenError
+from kiwoom_rest_api.core.hooks import logger
+from kiwoom_rest_api.data.storage import atomic_write_json, default_data_path, read_json
+
+# ka10099 시장구분 (0:코스피, 10:코스닥, 3:ELW, 8:ETF, 30:K-OTC, 50:코넥스, 5:신주인수권, 4:뮤추얼펀드, 6:리츠, 9:하이일드)
+ALL_MARKETS = ("0", "10", "3", "8", "30", "50", "5", "4", "6", "9")
+LIST_KEY = "list"
+# 한 시장의 조회만 실패로 처리하고 나머지 시장은 계속 받는 오류
+MARKET_ERRORS = (APIError, CircuitOpenError, httpx.TransportError)
+
+class SymbolChanges:
+    """Codes added, removed or modified by one refresh"""
+
+    __slots__ = ("added", "removed", "changed")
+
+    def __init__(self, added: List[str], removed: List[str], changed: List[str]):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return f"<SymbolChanges added={len(self.added)} removed={len(self.removed)} changed={len(self.changed)}>"
+
+def _listing_rows(market: str, pages: Iterable[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Rows of one market's ka10099 pages, or None if any page was rejected (return_code != 0)"""
+    rows: List[Dict[str, Any]] = []
+    for page in pages:
+        if str(page.get("return_code", 0)) != "0":
+            logger.warning("ka10099 market %s rejected (%s: %s); keeping stored symbols",
+                           market, page.get("return_code"), page.get("return_msg"))
+            return None
+        rows.extend(page.get(LIST_KEY) or [])
+    return rows
+
+def _state_tokens(row: Dict[str, Any]) -> Set[str]:
+    # state는 "증거금20%|담보대출|신용가능"처럼 |로 연결되며, auditInfo(관리종목, 투자주의환기종목 등)도 상태로 색인
+    tokens = {token.strip() for token in str(row.get("state") or "").split("|")}
+    tokens.add(str(row.get("auditInfo") or "").strip())
+    tokens.discard("")
+    return tokens
+
+class SymbolMaster:
+    """In-memory symbol master with persistent storage and O(1) code/name lookups
+
+    Attributes:
+        symbols: 종목코드 → ka10099 행
+        by_name: 종목명 → 종목코드
+        by_market: marketCode → 종목코드 집합
+        by_sector: upName(업종명) → 종목코드 집합
+        by_state: state/auditInfo 항목(관리종목, 거래정지, 증거금100% ...) → 종목코드 집합
+        sources: 종목코드 → 그 종목을 받은 ka10099 시장구분(mrkt_tp). 없으면 marketCode를 사용
+    """
+
+    def __init__(self, path: Optional[str] = None, markets: Iterable[str] = ALL_MARKETS):
+        self.path = path or SYMBOLS_PATH or default_data_path("symbols.json")
+        self.markets = tuple(markets)
+        self.symbols: Dict[str, Dict[str, Any]] = {}
+        self.updated: Optional[str] = None
+        self.sources: Dict[str, str] = {}
+        self._build_indexes()
+
+    @classmethod
+    def load(cls, path: Optional[str] = None, markets: Iterable[str] = ALL_MARKETS) -> "SymbolMaster":
+        """Create a master from the local file (empty if the file does not exist yet)"""
+        master = cls(path, markets)
+        data = read_json(master.path)
+        if isinstance(data, dict):
+            master.symbols = data.get("symbols") or {}
+            master.updated = data.get("updated")
+            master.sources = data.get("sources") or {}
+            master._build_indexes()
+        return master
+
+    def save(self) -> None:
+        atomic_write_json(self.path, {"updated": self.updated, "symbols": self.symbols, "sources": self.sources})
+
+    def _build_indexes(self) -> None:
+        self.by_name: Dict[str, str] = {}
+        self.by_market: Dict[str, Set[str]] = {}
+        self.by_sector: Dict[str, Set[str]] = {}
+        self.by_state: Dict[str, Set[str]] = {}
+        self._names: List[tuple] = []
+        for code, row in self.symbols.items():
+            self._index(code, row)
+        self._names.sort()
+
+    def _index(self, code: str, row: Dict[str, Any]) -> None:
+        name = row.get("name") or ""
+        if name:
+            self.by_name.setdefault(name, code)
+            self._names.append((name.casefold(), code))
+        self.by_market.setdefault(str(row.get("marketCode", "")), set()).add(code)
+        sector = row.get("upName")
+        if sector:
+            self.by_sector.setdefault(sector, set()).add(code)
+        for token in _state_tokens(row):
+            self.by_state.setdefault(token, set()).add(code)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.symbols
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        return self.symbols.get(code)
+
+    def name(self, code: str) -> Optional[str]:
+        row = self.symbols.get(code)
+        return row.get("name") if row else None
+
+    def resolve(self, code_or_name: str) -> Optional[str]:
+        """Return the code for a code or an exact name, or None"""
+        if code_or_name in self.symbols:
+            return code_or_name
+        return self.by_name.get(code_or_name)
+
+    def search(self, prefix: str, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Symbols whose name starts with prefix (대소문자 무시), in name order"""
+        key = prefix.casefold()
+        result = []
+        for index in range(bisect.bisect_left(self._names, (key,)), len(self._names)):
+            name, code = self._names[index]
+            if not name.startswith(key) or (limit is not None and len(result) >= limit):
+                break
+            result.append(self.symbols[code])
+        return result
+
+    def codes(
+        self,
+        market: Optional[str] = None,
+        sector: Optional[str] = None,
+        include_states: Iterable[str] = (),
+        exclude_states: Iterable[str] = (),
+    ) -> Set[str]:
+        """Codes matching every given filter (set intersections over the indexes)
+
+        Example:
+            >>> master.codes(market="0", exclude_states=["관리종목", "거래정지"])
+        """
+        result = set(self.by_market.get(market, ())) if market is not None else set(self.symbols)
+        if sector is not None:
+            result &= self.by_sector.get(sector, set())
+        for state in include_states:
+            result &= self.by_state.get(state, set())
+        for state in exclude_states:
+            result -= self.by_state.get(state, set())
+        return result
+
+    def is_stale(self, today: Optional[str] = None) -> bool:
+        return self.updated != (today or datetime.now().strftime("%Y%m%d"))
+
+    def _source(self, code: str) -> str:
+        return self.sources.get(code) or str(self.symbols[code].get("marketCode", ""))
+
+    def apply(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        today: Optional[str] = None,
+        complete: bool = True,
+        market: Optional[str] = None,
+    ) -> SymbolChanges:
+        """Merge the listing of one or more markets into the master and persist it
+
+        시장별로 비교하므로, 목록에 포함된 시장의 기존 종목 중 목록에 없는 종목만 상장폐지로 보고
+        제거합니다. 목록에 없는 시장(조회 실패 등)의 종목은 그대로 둡니다. 빈 목록은 무시하며 저장하지 않습니다.
+        market은 rows를 받은 ka10099 시장구분(mrkt_tp)이며, 생략하면 각 행의 marketCode를 시장으로 봅니다.
+        complete=False이면 updated를 바꾸지 않아 다음 refresh()에서 다시 받습니다.
+        """
+        listings: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            listings.setdefault(market if market is not None else str(row.get("marketCode", "")), []).append(row)
+        return self._apply_listings(listings, today, complete)
+
+    def _apply_listings(
+        self, listings: Dict[str, List[Dict[str, Any]]], today: Optional[str] = None, complete: bool = True
+    ) -> SymbolChanges:
+        # 시장구분 → 그 시장에서 받은 행. 상장폐지는 같은 시장에서 받았던 종목 중에서만 판단
+        fresh: Dict[str, Dict[str, Any]] = {}
+        sources: Dict[str, str] = {}
+        for market, rows in listings.items():
+            for row in rows:
+                code = row.get("code")
+                if code:
+                    fresh[code] = dict(row)
+                    sources[code] = market
+        if not fresh:
+            return SymbolChanges([], [], [])
+        markets = set(sources.values())
+        added = [code for code in fresh if code not in self.symbols]
+        removed = [code for code in self.symbols if code not in fresh and self._source(code) in markets]
+        changed = [code for code, row in fresh.items() if code in self.symbols and self.symbols[code] != row]
+        changes = SymbolChanges(added, removed, changed)
+        if changes:
+            gone = set(removed)
+            symbols = {code: row for code, row in self.symbols.items() if code not in gone}
+            symbols.update(fresh)
+            self.symbols = symbols
+            self._build_indexes()
+            self.sources = {code: market for code, market in self.sources.items() if code not in gone}
+        self.sources.update(sources)
+        if complete:
+            self.updated = today or datetime.now().strftime("%Y%m%d")
+        self.save()
+        return changes
+
+    def _merge_listings(self, listings: List[Tuple[str, Optional[List[Dict[str, Any]]]]]) -> SymbolChanges:
+        # (요청한 시장구분, 행). 거절된 시장(None)과 빈 시장은 기존 종목을 유지하고,
+        # 거절된 시장이 있으면 다음 refresh()에서 다시 받음
+        return self._apply_listings(
+            {market: rows for market, rows in listings if rows},
+            complete=all(rows is not None for _, rows in listings),
+        )
+
+    def refresh(self, stock_info, force: bool = False) -> SymbolChanges:
+        """Re-download every market with ka10099 at most once per day (use_async=False StockInfo)"""
+        if not force and not self.is_stale():
+            return SymbolChanges([], [], [])
+
+        def fetch(market: str) -> Optional[List[Dict[str, Any]]]:
+            try:
+                return _listing_rows(market, stock_info.paginate(
+                    stock_info.stock_information_list_request_ka10099, market, list_key=LIST_KEY
+                ))
+            except MARKET_ERRORS as e:
+                logger.warning("ka10099 market %s failed (%r); keeping stored symbols", market, e)
+                return None
+
+        return self._merge_listings([(market, fetch(market)) for market in self.markets])
+
+    async def refresh_async(self, stock_info, force: bool = False) -> SymbolChanges:
+        """Async counterpart of refresh(); markets are fetched concurrently"""
+        if not force and not self.is_stale():
+            return SymbolChanges([], [], [])
+
+        async def fetch(market: str) -> Optional[List[Dict[str, Any]]]:
+            try:
+                pages = [
+                    page async for page in stock_info.paginate_async(
+                        stock_info.stock_information_list_request_ka10099, market, list_key=LIST_KEY
+                    )
+                ]
+            except MARKET_ERRORS as e:
+                # 비동기 경로는 return_code 거절을 APIError로 발생시킴
+                logger.warning("ka10099 market %s failed (%r); keeping stored symbols", market, e)
+                return None
+            return _listing_rows(market, pages)
+
+        listings = await asyncio.gather(*(fetch(market) for market in self.markets))
+        return self._merge_listings(list(zip(self.markets, listings)))
+
+    def add_from_ka10100(self, row: Dict[str, Any]) -> None:
+        """Insert or update one symbol from a ka10100 response (e.g. a listing added today) and persist it
+
+        ka10100은 ka10099 시장구분을 알려주지 않으므로, 처음 보는 종목의 시장은 marketCode로 기록합니다.
+        """
+        row = {key: value for key, value in row.items() if key not in ("return_code", "return_msg", "cont-yn", "next-key")}
+        code = row.get("code")
+        if not code:
+            return
+        existing = code in self.symbols
+        self.symbols[code] = row
+        self.sources.setdefault(code, str(row.get("marketCode", "")))
+        if existing:
+            self._build_indexes()
+        else:
+            # 신규 종목은 전체 재구성 없이 인덱스에 추가
+            names = self._names
+            self._names = []
+            self._index(code, row)
+            for entry in self._names:
+                bisect.insort(names, entry)
+            self._names = names
+        self.save()
+
+    def lookup(self, stock_info, code: str) -> Optional[Dict[str, Any]]:
+        """Return a symbol, fetching it with ka10100 when it is not in the master yet (sync StockInfo)"""
+        row = self.symbols.get(code)
+        if row is None:
+            self.add_from_ka10100(stock_info.stock_information_inquiry_request_ka10100(code))
+            row = self.symbols.get(code)
+        return row
@@ -0,0 +1,253 @@
+"""테마 ↔ 종목 양방향 인덱스
+
+ka90001(테마그룹별)로 전체 테마 목록을 받고 ka90002(테마구성종목)로 테마별 구성종목을 받아
+theme → {종목코드: 수익률 필드}, 종목코드 → {테마코드} 두 방향의 dict/set 인덱스를 만듭니다.
+"005930이 속한 테마"는 dict 조회 한 번이며, 결과는 로컬 JSON 파일에 저장됩니다.
+
+증분 갱신(refresh)은 테마 목록만 다시 받고, 새 테마와 목록의 서명(종목수 stk_num, 주요종목 main_stk)이 바뀐 테마,
+구성종목을 받은 지 max_age초가 지난 테마의 구성종목만 다시 받습니다. 종목수와 주요종목이 그대로인 채 다른 구성종목이
+교체되면 목록만으로는 알 수 없으므로, 그런 변경은 max_age 주기로만 반영됩니다.
+테마 행(서명)은 구성종목을 저장한 뒤에 바뀌므로, 구성종목 조회에 실패한 테마는 이전 구성종목을 유지한 채
+다음 refresh에서 다시 받습니다. 테마 목록 조회가 실패·거절되거나 빈 목록이면 저장된 인덱스를 그대로 둡니다.
+동기/비동기 경로 모두 같은 방식으로 동작합니다.
+
+Example:
+    >>> index = ThemeIndex.load()
+    >>> await index.refresh_async(theme_api)   # use_async=True Theme
+    >>> [index.themes[cd]["thema_nm"] for cd in index.themes_of("005930")]
+    >>> index.contains("100", "005930")
+"""
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from kiwoom_rest_api.core.breaker import REQUEST_ERRORS
+from kiwoom_rest_api.core.hooks import logger
+from kiwoom_rest_api.data.storage import atomic_write_json, default_data_path, read_json
+
+THEME_LIST_KEY = "thema_grp"
+COMPONENT_LIST_KEY = "thema_comp_stk"
+# 구성종목 행에서 보관할 필드
+MEMBER_FIELDS = ("stk_nm", "cur_prc", "flu_rt", "dt_prft_rt_n")
+# 구성종목 변경 여부를 추정하는 ka90001 필드 (등락률/수익률은 장중 계속 바뀌므로 제외)
+SIGNATURE_FIELDS = ("stk_num", "main_stk")
+# 서명이 같아도 구성종목을 다시 받는 주기(초)
+DEFAULT_MAX_AGE = 86400.0
+
+def _page_rows(api_id: str, pages: Iterable[Dict[str, Any]], list_key: str) -> Optional[List[Dict[str, Any]]]:
+    """Rows of a paged response, or None if any page was rejected (return_code != 0)"""
+    rows: List[Dict[str, Any]] = []
+    for page in pages:
+        if str(page.get("return_code", 0)) != "0":
+            logger.warning("%s rejected (%s: %s); keeping stored themes", api_id, page.get("return_code"), page.get("return_msg"))
+            return None
+        rows.extend(page.get(list_key) or [])
+    return rows
+
+class ThemeIndex:
+    """Bidirectional theme/stock index with per-theme return-rate fields
+
+    Args:
+        path: 저장 파일 경로 (기본값 ~/.cache/kiwoom_rest_api/themes.json)
+        date_tp: 기간수익률 기준 n일 (ka90001/ka90002 date_tp)
+        stex_tp: 거래소구분 (1:KRX, 2:NXT, 3:통합)
+        max_age: 서명이 같아도 구성종목을 다시 받는 주기(초). None이면 서명이 바뀔 때만 다시 받음
+
+    Attributes:
+        themes: 테마그룹코드 → ka90001 행 (thema_nm, stk_num, flu_rt, dt_prft_rt, main_stk ...)
+        members: 테마그룹코드 → {종목코드: MEMBER_FIELDS}
+        fetched: 테마그룹코드 → 구성종목을 마지막으로 받은 시각 (time.time())
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        date_tp: str = "1",
+        stex_tp: str = "1",
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+    ):
+        self.path = path or default_data_path("themes.json")
+        self.date_tp = date_tp
+        self.stex_tp = stex_tp
+        self.max_age = max_age
+        self.themes: Dict[str, Dict[str, Any]] = {}
+        self.members: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.fetched: Dict[str, float] = {}
+        self._themes_of: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        path: Optional[str] = None,
+        date_tp: str = "1",
+        stex_tp: str = "1",
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+    ) -> "ThemeIndex":
+        index = cls(path, date_tp, stex_tp, max_age)
+        data = read_json(index.path)
+        if isinstance(data, dict):
+            index.themes = data.get("themes") or {}
+            index.members = data.get("members") or {}
+            index.fetched = data.get("fetched") or {}
+            index._rebuild_reverse()
+        return index
+
+    def save(self) -> None:
+        atomic_write_json(self.path, {"themes": self.themes, "members": self.members, "fetched": self.fetched})
+
+    def _rebuild_reverse(self) -> None:
+        self._themes_of = {}
+        for theme_cd, members in self.members.items():
+            for code in members:
+                self._themes_of.setdefault(code, set()).add(theme_cd)
+
+    def _set_members(self, theme_cd: str, rows: Iterable[Dict[str, Any]]) -> None:
+        for code in self.members.get(theme_cd, ()):
+            themes = self._themes_of.get(code)
+            if themes is not None:
+                themes.discard(theme_cd)
+                if not themes:
+                    del self._themes_of[code]
+        members = {}
+        for row in rows:
+            code = row.get("stk_cd")
+            if code:
+                members[code] = {field: row.get(field) for field in MEMBER_FIELDS}
+                self._themes_of.setdefault(code, set()).add(theme_cd)
+        self.members[theme_cd] = members
+        self.fetched[theme_cd] = time.time()
+
+    def _drop_theme(self, theme_cd: str) -> None:
+        self._set_members(theme_cd, ())
+        del self.members[theme_cd]
+        self.fetched.pop(theme_cd, None)
+        self.themes.pop(theme_cd, None)
+
+    def themes_of(self, code: str) -> Set[str]:
+        """Theme group codes containing the stock"""
+        return self._themes_of.get(code, set())
+
+    def codes_of(self, theme_cd: str) -> Set[str]:
+        return set(self.members.get(theme_cd, ()))
+
+    def contains(self, theme_cd: str, code: str) -> bool:
+        return code in self.members.get(theme_cd, ())
+
+    def find(self, name: str) -> List[str]:
+        """Theme group codes whose name contains `name`"""
+        return [theme_cd for theme_cd, row in self.themes.items() if name in (row.get("thema_nm") or "")]
+
+    def _is_stale(self, theme_cd: str, row: Dict[str, Any], now: float) -> bool:
+        if theme_cd not in self.members:
+            return True
+        previous = self.themes.get(theme_cd, {})
+        if any(str(previous.get(field)) != str(row.get(field)) for field in SIGNATURE_FIELDS):
+            return True
+        return self.max_age is not None and now - self.fetched.get(theme_cd, 0.0) >= self.max_age
+
+    def _plan(self, listing: List[Dict[str, Any]], full: bool) -> Dict[str, Dict[str, Any]]:
+        """Update unchanged theme rows and return the rows of themes whose components must be (re)fetched
+
+        (재)조회할 테마의 행은 _store()에서 구성종목과 함께 바꾸므로, 조회에 실패하면 이전 서명이 남아 계속 stale로 판정됩니다.
+        """
+        fresh = {row["thema_grp_cd"]: dict(row) for row in listing if row.get("thema_grp_cd")}
+        if not fresh:
+            # 빈 목록은 모든 테마가 사라졌다기보다 잘못된 응답이므로 저장된 인덱스를 유지
+            logger.warning("ka90001 returned no themes; keeping stored themes")
+            return {}
+        for theme_cd in [theme_cd for theme_cd in self.members if theme_cd not in fresh]:
+            self._drop_theme(theme_cd)
+        now = time.time()
+        stale = {}
+        for theme_cd, row in fresh.items():
+            if full or self._is_stale(theme_cd, row, now):
+                stale[theme_cd] = row
+            else:
+                self.themes[theme_cd] = row
+        self.themes = {theme_cd: self.themes[theme_cd] for theme_cd in fresh if theme_cd in self.themes}
+        return stale
+
+    def _store(self, theme_cd: str, row: Dict[str, Any], rows: Iterable[Dict[str, Any]]) -> None:
+        self._set_members(theme_cd, rows)
+        self.themes[theme_cd] = row
+
+    def _list_args(self) -> tuple:
+        # 전체검색, 상위기간수익률 순
+        return ("0", self.date_tp, "1", self.stex_tp)
+
+    def refresh(self, theme_api, full: bool = False) -> List[str]:
+        """Update the index with a synchronous Theme instance; returns the refetched theme codes
+
+        동기 경로는 return_code 거절(1700 등)을 예외 없이 페이지로 돌려주므로 페이지마다 return_code를 확인합니다.
+        """
+        try:
+            listing = _page_rows("ka90001", theme_api.paginate(
+                theme_api.theme_group_list_request_ka90001, *self._list_args(), list_key=THEME_LIST_KEY
+            ), THEME_LIST_KEY)
+        except REQUEST_ERRORS as e:
+            logger.warning("ka90001 failed (%r); keeping stored themes", e)
+            return []
+        if listing is None:
+            return []
+        stale = self._plan(listing, full)
+        refetched = []
+        try:
+            for theme_cd, row in stale.items():
+                try:
+                    rows = _page_rows("ka90002", theme_api.paginate(
+                        theme_api.theme_component_stocks_request_ka90002, theme_cd, self.stex_tp, self.date_tp,
+                        list_key=COMPONENT_LIST_KEY,
+                    ), COMPONENT_LIST_KEY)
+                except REQUEST_ERRORS as e:
+                    logger.warning("ka90002 theme %s failed (%r); keeping its previous members", theme_cd, e)
+                    continue
+                if rows is not None:
+                    self._store(theme_cd, row, rows)
+                    refetched.append(theme_cd)
+        finally:
+            # 실패 전에 받은 테마는 저장
+            self.save()
+        return refetched
+
+    async def refresh_async(self, theme_api, full: bool = False, concurrency: int = 8) -> List[str]:
+        """Async counterpart of refresh(); component lists are crawled concurrently"""
+        try:
+            listing = _page_rows("ka90001", [
+                page async for page in theme_api.paginate_async(
+                    theme_api.theme_group_list_request_ka90001, *self._list_args(), list_key=THEME_LIST_KEY
+                )
+            ], THEME_LIST_KEY)
+        except REQUEST_ERRORS as e:
+            # 비동기 경로는 return_code 거절을 APIError로 발생시킴
+            logger.warning("ka90001 failed (%r); keeping stored themes", e)
+            return []
+        if listing is None:
+            return []
+        stale = self._plan(listing, full)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def crawl(theme_cd: str) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
+                return _page_rows("ka90002", [
+                    page async for page in theme_api.paginate_async(
+                        theme_api.theme_component_stocks_request_ka90002, theme_cd, self.stex_tp, self.date_tp,
+                        list_key=COMPONENT_LIST_KEY,
+                    )
+                ], COMPONENT_LIST_KEY)
+
+        results = await asyncio.gather(*(crawl(theme_cd) for theme_cd in stale), return_exceptions=True)
+        refetched = []
+        unexpected = None
+        for (theme_cd, row), rows in zip(stale.items(), results):
+            if isinstance(rows, REQUEST_ERRORS):
+                logger.warning("ka90002 theme %s failed (%r); keeping its previous members", theme_cd, rows)
+            elif isinstance(rows, BaseException):
+                unexpected = unexpected or rows
+            elif rows is not None:
+                self._store(theme_cd, row, rows)
+                refetched.append(theme_cd)
+        # 실패 전에 받은 테마는 저장
+        self.save()
+        if unexpected is not None:
+            raise unexpected
+        return refetched
@@ -1,5 +1,8 @@
 from kiwoom_rest_api.core.base_api import KiwoomBaseAPI
-from typing import Union, Dict, Any, Awaitable
+from kiwoom_rest_api.core.pagination import api_id_of, find_list_key
+# columnar는 numpy를 사용할 때만 불러오므로 모듈 수준에서 import해도 numpy가 필요하지 않음
+from kiwoom_rest_api.data.columnar import OHLCVColumns
+from typing import Union, Dict, Any, Awaitable, Callable, Optional
 
 class Chart(KiwoomBaseAPI):
     """한국 주식 섹터 관련 API를 제공하는 클래스"""
@@ -9,7 +12,8 @@ class Chart(KiwoomBaseAPI):
         base_url: str = None, 
         token_manager=None, 
         use_async: bool = False,
-        resource_url: str = "/api/dostk/chart"
+        resource_url: str = "/api/dostk/chart",
+        session=None
     ):
         """
         Chart 클래스 초기화
@@ -18,12 +22,14 @@ class Chart(KiwoomBaseAPI):
             base_url (str, optional): API 기본 URL
             token_manager: 토큰 관리자 객체
             use_async (bool): 비동기 클라이언트 사용 여부 (기본값: False)
+            session (KiwoomSession, optional): 여러 클래스가 공유할 커넥션 풀 세션
         """
         super().__init__(
             base_url=base_url,
             token_manager=token_manager,
             use_async=use_async,
-            resource_url=resource_url
+            resource_url=resource_url,
+            session=session
         )
         
     def stockwise_investor_institution_chart_request_ka10060(
@@ -736,4 +742,77 @@ class Chart(KiwoomBaseAPI):
             "POST",
             json=data,
             headers=headers,
-        )
\ No newline at end of file
+        )
+
+
+    def ohlcv(
+        self,
+        request_method: Callable[..., Any],
+        *args,
+        max_pages: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        stop_date: Optional[str] = None,
+        sort: bool = True,
+        **kwargs
+    ) -> "OHLCVColumns":
+        """
+        차트 API를 연속조회하여 컬럼형 OHLCV(NumPy int64 배열, 업종 차트의 가격 컬럼은 float64)로 반환합니다.
+
+        페이지마다 행을 바로 배열로 변환하고 원본 dict는 보관하지 않으므로,
+        수천 개 봉을 받을 때 메모리 사용량과 변환 비용이 dict 리스트보다 작습니다.
+        numpy 설치가 필요합니다 (pip install kiwoom-rest-api[numpy]).
+
+        Args:
+            request_method: 차트 메서드 (예: chart.stock_daily_chart_request_ka10081)
+            *args, **kwargs: request_method에 전달할 인자
+            max_pages (int, optional): 최대 요청 페이지 수
+            max_rows (int, optional): 최대 봉 개수
+            stop_date (str, optional): 이 날짜보다 오래된 봉이 나오면 중단
+            sort (bool): True이면 일자 오름차순으로 정렬 (기본값: True)
+
+        Returns:
+            OHLCVColumns: dt, open_pric, high_pric, low_pric, cur_prc, trde_qty, trde_prica 컬럼
+
+        Example:
+            >>> ohlcv = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1", max_pages=5)
+            >>> ohlcv["cur_prc"].mean()
+        """
+        from kiwoom_rest_api.data.columnar import columns_for, list_key_for
+
+        api_id = api_id_of(request_method)
+        columns = columns_for(api_id)
+        list_key = list_key_for(api_id)
+        for page in self.paginate(
+            request_method, *args, list_key=list_key, max_pages=max_pages, max_rows=max_rows,
+            stop_date=stop_date, **kwargs
+        ):
+            columns.append_rows(page.get(list_key or find_list_key(page)) or [])
+        return columns.sort() if sort else columns
+
+    async def ohlcv_async(
+        self,
+        request_method: Callable[..., Any],
+        *args,
+        max_pages: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        stop_date: Optional[str] = None,
+        sort: bool = True,
+        **kwargs
+    ) -> "OHLCVColumns":
+        """
+        ohlcv()의 비동기 버전 (use_async=True 인스턴스 전용)
+
+        Example:
+            >>> ohlcv = await chart.ohlcv_async(chart.stock_minute_chart_request_ka10080, "005930", "1", "1")
+        """
+        from kiwoom_rest_api.data.columnar import columns_for, list_key_for
+
+        api_id = api_id_of(request_method)
+        columns = columns_for(api_id)
+        list_key = list_key_for(api_id)
+        async for page in self.paginate_async(
+            request_method, *args, list_key=list_key, max_pages=max_pages, max_rows=max_rows,
+            stop_date=stop_date, **kwargs
+        ):
+            columns.append_rows(page.get(list_key or find_list_key(page)) or [])
+        return columns.sort() if sort else columns
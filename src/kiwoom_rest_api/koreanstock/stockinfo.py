@@ -12,7 +12,8 @@ class StockInfo(KiwoomBaseAPI):
         base_url: str = None, 
         token_manager=None, 
         use_async: bool = False,
-        resource_url: str = "/api/dostk/stkinfo"
+        resource_url: str = "/api/dostk/stkinfo",
+        session=None
     ):
         """
         StockInfo 클래스 초기화
@@ -21,12 +22,14 @@ class StockInfo(KiwoomBaseAPI):
             base_url (str, optional): API 기본 URL
             token_manager: 토큰 관리자 객체
             use_async (bool): 비동기 클라이언트 사용 여부 (기본값: False)
+            session (KiwoomSession, optional): 여러 클래스가 공유할 커넥션 풀 세션
         """
         super().__init__(
             base_url=base_url,
             token_manager=token_manager,
             use_async=use_async,
-            resource_url=resource_url
+            resource_url=resource_url,
+            session=session
         )
     
     def basic_stock_information_request_ka10001(
@@ -1342,6 +1345,36 @@ class StockInfo(KiwoomBaseAPI):
             "stk_cd": stock_code
         }
         return self._execute_request("POST", json=data, headers=headers)
+
+    def watchlist_quotes(
+        self,
+        stock_codes: List[str],
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        convert: bool = False
+    ) -> Union[Dict[str, Dict[str, Any]], Awaitable[Dict[str, Dict[str, Any]]]]:
+        """여러 종목의 시세를 관심종목정보(ka10095)로 일괄 조회
+
+        종목 목록을 chunk_size 이하의 고른 묶음으로 나누어 "|"로 연결해 동시에 요청하고,
+        결과를 종목코드 기준 dict 하나로 합칩니다.
+
+        Args:
+            stock_codes (List[str]): 종목코드 목록
+            chunk_size (int, optional): 요청 한 번에 담을 최대 종목 수. Defaults to 100.
+            concurrency (int, optional): 동시에 보낼 묶음 요청 수. Defaults to 4.
+            convert (bool, optional): 숫자 필드를 int/float로 변환. Defaults to False.
+
+        Returns:
+            Union[Dict[str, Dict[str, Any]], Awaitable[Dict[str, Dict[str, Any]]]]: stk_cd → 관심종목정보
+            {
+                "005930": {"stk_cd": "005930", "stk_nm": "삼성전자", "cur_prc": "+156600", ...},
+                ...
+            }
+        """
+        from kiwoom_rest_api.data.quotes import fetch_quotes, fetch_quotes_async
+
+        fetch = fetch_quotes_async if self.use_async else fetch_quotes
+        return fetch(self, stock_codes, chunk_size=chunk_size, concurrency=concurrency, convert=convert)
         
     def stock_information_list_request_ka10099(
         self,
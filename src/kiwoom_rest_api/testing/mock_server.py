@@ -0,0 +1,326 @@
+"""로컬 목 키움 서버 (오프라인 부하/지연 테스트용)
+
+/oauth2/token과 /api/dostk/*를 흉내 내며, /api/dostk/* 요청은 api-id 헤더로 분기해
+payloads.GENERATORS의 합성 응답을 돌려줍니다. 리스트 응답은 page_size 단위로 잘라
+cont-yn/next-key 헤더로 연속 조회를 지원합니다.
+
+세 가지 방식으로 붙일 수 있습니다.
+    - transport() / async_transport(): 소켓 없이 KiwoomSession에 바로 주입 (테스트용)
+    - serve(): 백그라운드 스레드의 HTTP/1.1 서버 (실제 소켓/커넥션 풀 측정용)
+    - ASGI 앱(인스턴스 자체): hypercorn 등으로 HTTP/2 측정
+
+    python -m kiwoom_rest_api.testing.mock_server --port 8080 --latency-ms 20 --error-rate 0.01 --rate-limit 20
+
+Example:
+    >>> mock = MockKiwoom(latency=0.01, rate_limit=20)
+    >>> session = KiwoomSession(transport=mock.transport(), async_transport=mock.async_transport())
+    >>> with mock.serve() as server:
+    ...     chart = Chart(base_url=server.url)
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+
+from kiwoom_rest_api.config import TOKEN_URL
+from kiwoom_rest_api.core.retry import RATE_LIMIT_RETURN_CODE
+from kiwoom_rest_api.testing.payloads import generate
+
+API_PREFIX = "/api/dostk/"
+
+# (상태 코드, 헤더, 본문)
+MockResponse = Tuple[int, Dict[str, str], bytes]
+
+class MockKiwoom:
+    """Deterministic in-process Kiwoom REST API simulator
+
+    Args:
+        latency: 응답당 기본 지연(초)
+        jitter: 지연에 더해지는 0~jitter초의 균등 난수
+        error_rate: 이 확률로 error_status 응답을 돌려줌 (재시도/장애 경로 테스트)
+        error_status: 주입 오류의 HTTP 상태 코드
+        rate_limit: 초당 허용 요청 수. 초과 시 throttle_status와 return_code 1700, Retry-After 헤더. None이면 무제한
+        burst: 토큰 버킷 크기 (기본값 rate_limit)
+        throttle_status: 요청 한도 초과 응답의 HTTP 상태 코드. 200이면 정상 페이지처럼 오는 return_code 1700 거절을 흉내 냄
+        page_size: 리스트 응답의 페이지당 행 수
+        rows: 리스트 응답의 전체 행 수 (차트 봉 개수, 종목 수 등)
+        require_auth: True이면 발급한 토큰 없이 /api/dostk/* 호출 시 401
+        seed: 지연/오류 주입 난수 시드 (응답 내용은 요청 본문으로 결정되므로 항상 같음)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        throttle_status: int = 429,
+        page_size: int = 100,
+        rows: int = 600,
+        require_auth: bool = False,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(1, int(rate_limit or 1))
+        self.throttle_status = throttle_status
+        self.page_size = max(1, page_size)
+        self.rows = rows
+        self.require_auth = require_auth
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._issued: set = set()
+        # (api-id, 본문) → 전체 응답. 연속 조회 페이지마다 다시 생성하지 않도록 보관
+        self._payloads: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], Optional[str], List[Dict[str, Any]]]]" = OrderedDict()
+        self.requests: Counter = Counter()
+        self.throttled = 0
+        self.errors = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"requests": dict(self.requests), "throttled": self.throttled, "errors": self.errors}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.throttled = 0
+            self.errors = 0
+            self._payloads.clear()
+            self._tokens = float(self.burst)
+
+    def delay(self) -> float:
+        """Seconds the next response should be held back"""
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def _take_token(self) -> Optional[float]:
+        # 토큰 버킷. 허용되면 None, 거절되면 다음 토큰까지 남은 초
+        if self.rate_limit is None:
+            return None
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled) * self.rate_limit)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate_limit
+
+    def handle(self, method: str, path: str, headers: Mapping[str, str], body: bytes) -> MockResponse:
+        """Answer one request; transport-independent core used by every adapter"""
+        headers = {key.lower(): value for key, value in headers.items()}
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return _json_response(400, {"return_code": 2, "return_msg": "요청 본문이 올바른 JSON이 아닙니다"})
+        if not isinstance(payload, dict):
+            payload = {}
+        path = path.split("?", 1)[0]
+        if path == TOKEN_URL:
+            return self._issue_token(payload)
+        if not path.startswith(API_PREFIX) or method.upper() != "POST":
+            return _json_response(404, {"return_code": 2, "return_msg": f"{method} {path} not found"})
+
+        api_id = headers.get("api-id", "")
+        with self._lock:
+            self.requests[api_id] += 1
+            if self.require_auth and headers.get("authorization", "").split(" ")[-1] not in self._issued:
+                return _json_response(401, {"return_code": 3, "return_msg": "인증에 실패했습니다"})
+            wait = self._take_token()
+            if wait is not None:
+                self.throttled += 1
+                return _json_response(
+                    self.throttle_status,
+                    {"return_code": RATE_LIMIT_RETURN_CODE, "return_msg": "허용된 요청 개수를 초과하였습니다"},
+                    {"retry-after": f"{wait:.3f}"},
+                )
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors += 1
+                return _json_response(self.error_status, {"return_code": 1, "return_msg": "일시적인 서버 오류입니다"})
+            return self._page(api_id, payload, headers.get("cont-yn") == "Y", headers.get("next-key", ""))
+
+    def _issue_token(self, payload: Dict[str, Any]) -> MockResponse:
+        if self.require_auth and not (payload.get("appkey") and payload.get("secretkey")):
+            return _json_response(400, {"return_code": 2, "return_msg": "appkey/secretkey가 필요합니다"})
+        with self._lock:
+            token = f"mock-{len(self._issued) + 1:08d}"
+            self._issued.add(token)
+        expires = (datetime.now() + timedelta(hours=24)).strftime("%Y%m%d%H%M%S")
+        return _json_response(200, {"expires_dt": expires, "token_type": "bearer", "token": token,
+                                    "return_code": 0, "return_msg": "정상적으로 처리되었습니다"})
+
+    def _page(self, api_id: str, payload: Dict[str, Any], cont: bool, next_key: str) -> MockResponse:
+        # 호출자가 self._lock을 잡고 있음
+        key = (api_id, json.dumps(payload, sort_keys=True))
+        full = self._payloads.get(key)
+        if full is None:
+            full = generate(api_id, payload, self.rows)
+            self._payloads[key] = full
+            while len(self._payloads) > 256:
+                self._payloads.popitem(last=False)
+        else:
+            self._payloads.move_to_end(key)
+        top, list_key, rows = full
+        offset = int(next_key) if cont and next_key.isdigit() else 0
+        result = dict(top)
+        more = False
+        if list_key is not None:
+            result[list_key] = rows[offset: offset + self.page_size]
+            more = offset + self.page_size < len(rows)
+        result.update(return_code=0, return_msg="정상적으로 처리되었습니다")
+        extra = {"cont-yn": "Y" if more else "N", "next-key": str(offset + self.page_size) if more else "",
+                 "api-id": api_id, "access-control-expose-headers": "cont-yn,next-key,api-id"}
+        return _json_response(200, result, extra)
+
+    def transport(self) -> httpx.MockTransport:
+        """Sync httpx transport for KiwoomSession(transport=...)"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay = self.delay()
+            if delay:
+                time.sleep(delay)
+            return _to_httpx(self.handle(request.method, request.url.path, request.headers, request.read()))
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Async httpx transport for KiwoomSession(async_transport=...)"""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delay = self.delay()
+            if delay:
+                await asyncio.sleep(delay)
+            return _to_httpx(self.handle(request.method, request.url.path, request.headers, await request.aread()))
+
+        return httpx.MockTransport(handler)
+
+    async def __call__(self, scope, receive, send) -> None:
+        # ASGI 진입점 (hypercorn 등으로 HTTP/2 서버를 띄울 때)
+        if scope["type"] != "http":
+            return
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        status, response_headers, content = self.handle(scope["method"], scope["path"], headers, body)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(key.encode("latin-1"), value.encode("latin-1")) for key, value in response_headers.items()],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> "MockServerHandle":
+        """Run a threaded HTTP/1.1 server in the background (port 0 picks a free port)"""
+        return MockServerHandle(self, host, port)
+
+class MockServerHandle:
+    """Background ThreadingHTTPServer wrapping a MockKiwoom; usable as a context manager"""
+
+    def __init__(self, mock: MockKiwoom, host: str, port: int):
+        self.mock = mock
+        self._server = ThreadingHTTPServer((host, port), _make_handler(mock))
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="kiwoom-mock-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "MockServerHandle":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def _make_handler(mock: MockKiwoom):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 쓰므로 Nagle + delayed ACK로 작은 응답마다 ~40ms가 붙지 않게 함
+        disable_nagle_algorithm = True
+
+        def _respond(self) -> None:
+            length = int(self.headers.get("content-length") or 0)
+            body = self.rfile.read(length) if length else b""
+            delay = mock.delay()
+            if delay:
+                time.sleep(delay)
+            status, headers, content = mock.handle(self.command, self.path, dict(self.headers.items()), body)
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("content-length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = _respond
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+def _json_response(status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> MockResponse:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return status, {"content-type": "application/json;charset=UTF-8", **(headers or {})}, body
+
+def _to_httpx(response: MockResponse) -> httpx.Response:
+    status, headers, content = response
+    return httpx.Response(status, headers=headers, content=content)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock Kiwoom REST API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None, help="초당 허용 요청 수")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=600)
+    parser.add_argument("--require-auth", action="store_true")
+    args = parser.parse_args()
+
+    mock = MockKiwoom(
+        latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000, error_rate=args.error_rate,
+        rate_limit=args.rate_limit, page_size=args.page_size, rows=args.rows, require_auth=args.require_auth,
+    )
+    server = mock.serve(args.host, args.port)
+    print(f"Mock Kiwoom server listening on {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.close()
+
+if __name__ == "__main__":
+    main()
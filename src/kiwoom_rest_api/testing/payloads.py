@@ -0,0 +1,223 @@
+"""목 서버용 합성 응답 생성기
+
+api-id별로 실제 응답과 같은 필드 이름/문자열 형식(부호 포함 가격, 0 채움 숫자)을 가진 전체 행 목록을 만듭니다.
+같은 (api-id, 요청 본문)에는 항상 같은 결과를 돌려주도록 본문에서 난수 시드를 정합니다.
+페이지 분할(cont-yn/next-key)은 mock_server가 담당합니다.
+"""
+import hashlib
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 생성기 반환값: (최상위 필드, 리스트 필드명, 전체 행 목록). 리스트가 없으면 리스트 필드명은 None
+Payload = Tuple[Dict[str, Any], Optional[str], List[Dict[str, Any]]]
+Generator = Callable[[Dict[str, Any], random.Random, int], Payload]
+
+def _rng(api_id: str, body: Dict[str, Any]) -> random.Random:
+    digest = hashlib.sha256(f"{api_id}|{json.dumps(body, sort_keys=True)}".encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+def _signed(value: int) -> str:
+    return f"{'+' if value > 0 else '-' if value < 0 else ''}{abs(value)}"
+
+def _signed_cents(value: int) -> str:
+    # 100배 정수를 소수 둘째 자리 문자열로 (지수 값)
+    return f"{'+' if value > 0 else '-' if value < 0 else ''}{abs(value) // 100}.{abs(value) % 100:02d}"
+
+def _rate(value: float) -> str:
+    return f"{'+' if value > 0 else ''}{value:.2f}"
+
+def _business_days(base_dt: str, count: int, step: int = 1) -> List[str]:
+    try:
+        day = datetime.strptime(base_dt[:8], "%Y%m%d")
+    except ValueError:
+        day = datetime.now()
+    days = []
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+        day -= timedelta(days=step)
+    return days
+
+def _code(rng: random.Random) -> str:
+    return f"{rng.randrange(1, 999999):06d}"
+
+def _quote_row(code: str, rng: random.Random) -> Dict[str, Any]:
+    base = rng.randint(1000, 300000)
+    change = rng.randint(-base // 10, base // 10)
+    price = base + change
+    return {
+        "stk_cd": code, "stk_nm": f"종목{code}", "cur_prc": _signed(price if change >= 0 else -price),
+        "base_pric": str(base), "pred_pre": _signed(change), "pred_pre_sig": "2" if change > 0 else "5" if change < 0 else "3",
+        "flu_rt": _rate(change * 100 / base), "trde_qty": str(rng.randint(0, 5_000_000)),
+        "trde_prica": str(rng.randint(0, 500_000)), "cntr_qty": _signed(rng.randint(-500, 500)),
+        "cntr_str": f"{rng.uniform(50, 200):.2f}", "sel_bid": _signed(price + 100), "buy_bid": _signed(price),
+        "open_pric": _signed(base), "high_pric": _signed(max(base, price) + 200), "low_pric": _signed(-(min(base, price) - 200)),
+    }
+
+def _candles(
+    dates: List[str], rng: random.Random, date_key: str, value_field: bool = True, index: bool = False,
+) -> List[Dict[str, Any]]:
+    # index=True이면 업종 지수 봉: 가격을 100배 정수로 만들어 소수 둘째 자리 문자열로 ("+2450.37")
+    signed = _signed_cents if index else _signed
+    price = rng.randint(100_00, 5000_00) if index else rng.randint(5000, 200000)
+    rows = []
+    for dt in dates:
+        move = rng.randint(-price // 30, price // 30)
+        open_price = price
+        close = max(100, price + move)
+        row = {
+            date_key: dt, "cur_prc": signed(close if move >= 0 else -close), "open_pric": signed(open_price),
+            "high_pric": signed(max(open_price, close) + rng.randint(0, price // 50)),
+            "low_pric": signed(-(min(open_price, close) - rng.randint(0, price // 50))),
+            "trde_qty": str(rng.randint(10_000, 20_000_000)), "upd_stkpc_tp": "", "upd_rt": "", "bic_inds_tp": "",
+            "sm_inds_tp": "", "stk_infr": "", "upd_stkpc_event": "", "pred_close_pric": "",
+        }
+        if value_field:
+            row["trde_prica"] = str((close // 100 if index else close) * int(row["trde_qty"]) // 1_000_000)
+        rows.append(row)
+        # 최신순이므로 한 봉 과거로 갈수록 가격을 되돌림
+        price = max(100, price - move)
+    return rows
+
+def _daily_chart(list_key: str, step: int = 1, index: bool = False) -> Generator:
+    def generate(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+        dates = _business_days(str(body.get("base_dt") or body.get("dt") or ""), rows, step)
+        return {"stk_cd": body.get("stk_cd") or body.get("inds_cd", "")}, list_key, _candles(dates, rng, "dt", index=index)
+    return generate
+
+def _intraday_chart(list_key: str, index: bool = False) -> Generator:
+    def generate(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+        start = datetime.now().replace(hour=15, minute=30, second=0, microsecond=0)
+        times = [(start - timedelta(minutes=i)).strftime("%Y%m%d%H%M%S") for i in range(rows)]
+        candles = _candles(times, rng, "cntr_tm", False, index=index)
+        return {"stk_cd": body.get("stk_cd") or body.get("inds_cd", "")}, list_key, candles
+    return generate
+
+def _basic_info(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    row = _quote_row(str(body.get("stk_cd", "005930")), rng)
+    row.update({"setl_mm": "12", "fav": "100", "cap": str(rng.randint(100, 100000)), "flo_stk": str(rng.randint(1000, 6000000)),
+                "per": f"{rng.uniform(3, 40):.2f}", "pbr": f"{rng.uniform(0.3, 5):.2f}", "eps": str(rng.randint(100, 10000))})
+    return row, None, []
+
+def _watchlist(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    codes = [code for code in str(body.get("stk_cd", "")).split("|") if code]
+    return {}, "atn_stk_infr", [_quote_row(code, rng) for code in codes]
+
+def _symbol_list(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    market = str(body.get("mrkt_tp", "0"))
+    states = ["증거금20%|담보대출|신용가능", "증거금40%|담보대출|신용가능", "증거금100%", "관리종목"]
+    listing = [
+        {"code": f"{int(market or 0) * 100000 + i + 1:06d}", "name": f"종목{market}-{i}", "listCount": f"{rng.randint(10**5, 10**9):016d}",
+         "auditInfo": "정상", "regDay": "20090803", "lastPrice": f"{rng.randint(1000, 300000):08d}",
+         "state": rng.choice(states), "marketCode": market, "marketName": "거래소" if market == "0" else "코스닥",
+         "upName": rng.choice(["전기전자", "화학", "의약품", "운수장비", "금융업", "서비스업"]), "upSizeName": "대형주",
+         "companyClassName": "", "orderWarning": "0", "nxtEnable": "Y"}
+        for i in range(rows)
+    ]
+    return {}, "list", listing
+
+def _symbol_info(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    code = str(body.get("stk_cd", ""))
+    return {"code": code, "name": f"종목{code}", "listCount": f"{rng.randint(10**5, 10**9):016d}", "auditInfo": "정상",
+            "regDay": "20090803", "lastPrice": f"{rng.randint(1000, 300000):08d}", "state": "증거금20%|담보대출|신용가능",
+            "marketCode": "0", "marketName": "거래소", "upName": "전기전자", "upSizeName": "대형주", "companyClassName": "",
+            "orderWarning": "0", "nxtEnable": "Y"}, None, []
+
+def _industry_codes(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    names = ["종합(KOSPI)", "대형주", "중형주", "소형주", "음식료업", "섬유의복", "종이목재", "화학", "의약품", "비금속광물",
+             "철강금속", "기계", "전기전자", "의료정밀", "운수장비", "유통업", "전기가스업", "건설업", "운수창고", "통신업"]
+    return {}, "list", [{"marketCode": str(body.get("mrkt_tp", "0")), "code": f"{i + 1:03d}", "name": name, "group": str(i)}
+                        for i, name in enumerate(names)]
+
+def _all_industries(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    industries = []
+    for i in range(20):
+        rising, fall, stdns = rng.randint(0, 60), rng.randint(0, 60), rng.randint(0, 10)
+        # 지수와 전일 대비는 소수 둘째 자리까지 ("+2450.37", "-12.05")
+        index = rng.randint(100_00, 5000_00)
+        change = rng.randint(-index // 50, index // 50)
+        industries.append({
+            "stk_cd": f"{i + 1:03d}", "stk_nm": f"업종{i + 1:03d}", "cur_prc": _signed_cents(index if change >= 0 else -index),
+            "pre_sig": "2" if change > 0 else "5", "pred_pre": _signed_cents(change), "flu_rt": _rate(change * 100 / index),
+            "trde_qty": str(rng.randint(1000, 10**6)), "wght": f"{rng.uniform(0, 30):.2f}", "trde_prica": str(rng.randint(1000, 10**7)),
+            "upl": str(rng.randint(0, 2)), "rising": str(rising), "stdns": str(stdns), "fall": str(fall), "lst": "0",
+            "flo_stk_num": str(rising + fall + stdns),
+        })
+    return {}, "all_inds_idex", industries
+
+def _industry_stocks(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    stocks = []
+    for i in range(rows):
+        row = _quote_row(_code(rng), rng)
+        row["now_trde_qty"] = row.pop("trde_qty")
+        stocks.append(row)
+    return {}, "inds_stkpc", stocks
+
+def _theme_groups(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    return {}, "thema_grp", [
+        {"thema_grp_cd": str(100 + i), "thema_nm": f"테마{i}", "stk_num": str(rng.randint(3, 40)), "flu_sig": "2",
+         "flu_rt": _rate(rng.uniform(-5, 5)), "rising_stk_num": str(rng.randint(0, 20)), "fall_stk_num": str(rng.randint(0, 20)),
+         "dt_prft_rt": _rate(rng.uniform(-20, 20)), "main_stk": "삼성전자"}
+        for i in range(rows)
+    ]
+
+def _theme_stocks(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    members = []
+    for _ in range(rng.randint(3, 40)):
+        row = _quote_row(_code(rng), rng)
+        members.append({key: row[key] for key in ("stk_cd", "stk_nm", "cur_prc", "pred_pre", "flu_rt", "sel_bid", "buy_bid")})
+        members[-1].update({"flu_sig": "2", "acc_trde_qty": row["trde_qty"], "sel_req": "100", "buy_req": "100",
+                            "dt_prft_rt_n": _rate(rng.uniform(-20, 20))})
+    return {"flu_rt": _rate(rng.uniform(-5, 5)), "dt_prft_rt": _rate(rng.uniform(-20, 20))}, "thema_comp_stk", members
+
+def _order(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    return {"ord_no": f"{rng.randrange(10**7):07d}", "dmst_stex_tp": body.get("dmst_stex_tp", "KRX")}, None, []
+
+def _account_balance(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    holdings = []
+    for _ in range(rng.randint(1, 30)):
+        price = rng.randint(1000, 300000)
+        quantity = rng.randint(1, 5000)
+        holdings.append({
+            "stk_cd": f"A{_code(rng)}", "stk_nm": "보유종목", "evltv_prft": _signed(rng.randint(-10**7, 10**7)),
+            "prft_rt": f"{rng.uniform(-30, 30):.2f}", "pur_pric": f"{price:015d}", "rmnd_qty": f"{quantity:015d}",
+            "trde_able_qty": f"{quantity:015d}", "cur_prc": f"{price:015d}", "evlt_amt": f"{price * quantity:015d}",
+        })
+    total = sum(int(row["evlt_amt"]) for row in holdings)
+    return {"tot_evlt_amt": f"{total:015d}", "tot_pur_amt": f"{total:015d}", "tot_prft_rt": "0.00"}, "acnt_evlt_remn_indv_tot", holdings
+
+def _default(body: Dict[str, Any], rng: random.Random, rows: int) -> Payload:
+    return {}, None, []
+
+GENERATORS: Dict[str, Generator] = {
+    "ka10001": _basic_info,
+    "ka10004": _basic_info,
+    "ka10095": _watchlist,
+    "ka10099": _symbol_list,
+    "ka10100": _symbol_info,
+    "ka10101": _industry_codes,
+    "ka10079": _intraday_chart("stk_tic_chart_qry"),
+    "ka10080": _intraday_chart("stk_min_pole_chart_qry"),
+    "ka10081": _daily_chart("stk_dt_pole_chart_qry"),
+    "ka10082": _daily_chart("stk_stk_pole_chart_qry", step=7),
+    "ka10083": _daily_chart("stk_mth_pole_chart_qry", step=30),
+    "ka10094": _daily_chart("stk_yr_pole_chart_qry", step=365),
+    "ka20002": _industry_stocks,
+    "ka20003": _all_industries,
+    "ka20004": _intraday_chart("inds_tic_chart_qry", index=True),
+    "ka20005": _intraday_chart("inds_min_pole_qry", index=True),
+    "ka20006": _daily_chart("inds_dt_pole_qry", index=True),
+    "ka20007": _daily_chart("inds_stk_pole_qry", step=7, index=True),
+    "ka20008": _daily_chart("inds_mth_pole_qry", step=30, index=True),
+    "ka20019": _daily_chart("inds_yr_pole_qry", step=365, index=True),
+    "ka90001": _theme_groups,
+    "ka90002": _theme_stocks,
+    "kt00018": _account_balance,
+    **{api_id: _order for api_id in ("kt10000", "kt10001", "kt10002", "kt10003", "kt10006", "kt10007", "kt10008", "kt10009")},
+}
+
+def generate(api_id: str, body: Dict[str, Any], rows: int) -> Payload:
+    """Build the full (unpaginated) synthetic response for one request"""
+    return GENERATORS.get(api_id, _default)(body, _rng(api_id, body), rows)
@@ -0,0 +1,39 @@
+import importlib.util
+import os
+
+BENCH_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "benchmarks", "bench_pipeline.py")
+
+
+def _load_bench():
+    # benchmarks/는 패키지가 아니므로 파일 경로로 불러옴
+    spec = importlib.util.spec_from_file_location("bench_pipeline", BENCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _case(name, rps, p99_ms):
+    return {"name": name, "rps": rps, "p99_ms": p99_ms}
+
+
+def test_compare_flags_only_cases_past_the_threshold():
+    bench = _load_bench()
+    baseline = {"results": [
+        _case("make_request/c1/r1", 1000.0, 2.0),
+        _case("execute_request/c8/r100", 500.0, 10.0),
+        _case("execute_cached/c1/r1", 2000.0, 1.0),
+    ]}
+    results = [
+        # 처리량 10% 감소: 임계값(15%) 이내
+        _case("make_request/c1/r1", 900.0, 2.1),
+        # 처리량 20% 감소
+        _case("execute_request/c8/r100", 400.0, 10.0),
+        # p99 50% 증가
+        _case("execute_cached/c1/r1", 2000.0, 1.5),
+        _case("make_request_async/c1/r1", 800.0, 3.0),
+    ]
+
+    assert bench.compare(results, baseline, 0.15) == ["execute_request/c8/r100", "execute_cached/c1/r1"]
+    assert [case["status"] for case in results] == ["ok", "REGRESSION", "REGRESSION", "new"]
+    assert results[0]["rps_change"] == -0.1 and results[2]["p99_change"] == 0.5
+    assert "rps_change" not in results[3]
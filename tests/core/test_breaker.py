@@ -0,0 +1,128 @@
+import asyncio
+import socket
+import threading
+import time
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.breaker import CircuitBreaker, CircuitOpenError
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.rank_info import RankInfo
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class _Server:
+    def __init__(self, status=503):
+        self.status = status
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.status is None:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(self.status, json={"return_code": 0 if self.status == 200 else 1, "return_msg": "x"})
+
+
+def _session(server, breaker):
+    transport = httpx.MockTransport(server)
+    return KiwoomSession(
+        transport=transport, async_transport=transport, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker
+    )
+
+
+def test_opens_fails_fast_and_recovers_through_half_open():
+    changes = []
+    breaker = CircuitBreaker(
+        failure_rate=0.5, min_requests=4, open_duration=0.05, on_state_change=lambda *change: changes.append(change)
+    )
+    server = _Server(status=None)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(server, breaker))
+
+    for _ in range(4):
+        with pytest.raises(httpx.ReadTimeout):
+            stock_info.basic_stock_information_request_ka10001("005930")
+    assert breaker.state("/api/dostk/stkinfo") == "open"
+    with pytest.raises(CircuitOpenError) as excinfo:
+        stock_info.basic_stock_information_request_ka10001("005930")
+    assert server.calls == 4 and excinfo.value.retry_after > 0
+    assert breaker.states()["/api/dostk/stkinfo"]["trips"] == 1
+
+    # 시험 요청 실패 → 다시 열림, 성공 → 닫힘
+    time.sleep(0.06)
+    assert breaker.state("/api/dostk/stkinfo") == "half_open"
+    with pytest.raises(httpx.ReadTimeout):
+        stock_info.basic_stock_information_request_ka10001("005930")
+    assert breaker.state("/api/dostk/stkinfo") == "open"
+    time.sleep(0.06)
+    server.status = 200
+    assert stock_info.basic_stock_information_request_ka10001("005930")["return_code"] == 0
+    assert breaker.state("/api/dostk/stkinfo") == "closed"
+    assert [state for _, _, state in changes] == ["open", "half_open", "open", "half_open", "closed"]
+
+
+def test_async_callers_are_shed_while_open():
+    breaker = CircuitBreaker(min_requests=2, open_duration=60)
+    server = _Server(status=503)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=_session(server, breaker))
+
+    async def run():
+        for code in ("000001", "000002"):
+            with pytest.raises(APIError):
+                await stock_info.basic_stock_information_request_ka10001(code)
+        return await asyncio.gather(
+            *[stock_info.basic_stock_information_request_ka10001(f"{i:06d}") for i in range(100)], return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, CircuitOpenError) for result in results)
+    assert server.calls == 2
+
+
+def test_keys_and_non_failures():
+    breaker = CircuitBreaker(min_requests=2, per_api_id=True)
+    server = _Server(status=503)
+    rank_info = RankInfo(base_url="https://api.kiwoom.com", session=_session(server, breaker))
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(_Server(status=429), breaker))
+
+    for _ in range(2):
+        with pytest.raises(APIError):
+            rank_info.top_order_book_volume_request_ka10020("001", "1", "0000", "0", "0", "1")
+        with pytest.raises(APIError):
+            stock_info.basic_stock_information_request_ka10001("005930")
+
+    assert breaker.state("/api/dostk/rkinfo", "ka10020") == "open"
+    assert breaker.state("/api/dostk/rkinfo", "ka10027") == "closed"
+    # 요청 한도 초과(429)는 장애로 보지 않음
+    assert breaker.state("/api/dostk/stkinfo", "ka10001") == "closed"
+    breaker.reset("/api/dostk/rkinfo", "ka10020")
+    assert breaker.state("/api/dostk/rkinfo", "ka10020") == "closed"
+
+
+def test_session_timeout_trips_breaker_on_stalled_server():
+    # 연결은 받지만 응답하지 않는 서버
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    accepted = []
+    threading.Thread(target=lambda: accepted.extend(listener.accept() for _ in range(2)), daemon=True).start()
+
+    breaker = CircuitBreaker(min_requests=2, open_duration=60)
+    session = KiwoomSession(timeout=0.2, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker)
+    rank_info = RankInfo(base_url=f"http://127.0.0.1:{listener.getsockname()[1]}", session=session)
+    started = time.monotonic()
+    try:
+        for _ in range(2):
+            with pytest.raises(httpx.ReadTimeout):
+                rank_info.top_order_book_volume_request_ka10020("001", "1", "0000", "0", "0", "1")
+        with pytest.raises(CircuitOpenError):
+            rank_info.top_order_book_volume_request_ka10020("001", "1", "0000", "0", "0", "1")
+    finally:
+        session.close()
+        for connection, _ in accepted:
+            connection.close()
+        listener.close()
+    assert time.monotonic() - started < 5
+    assert breaker.state("/api/dostk/rkinfo") == "open"
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import time
+
+import httpx
+
+from kiwoom_rest_api.core.cache import ResponseCache
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class CountingServer:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"mrkt_tp": body.get("mrkt_tp"), "version": self.calls, "list": [], "return_code": 0})
+
+
+def _stock_info(cache: ResponseCache, use_async: bool = False):
+    server = CountingServer()
+    transport = httpx.MockTransport(server)
+    session = KiwoomSession(transport=transport, async_transport=transport, response_cache=cache)
+    return StockInfo(base_url="https://api.kiwoom.com", use_async=use_async, session=session), server
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_cache_hits_by_api_id_and_body():
+    cache = ResponseCache()
+    stock_info, server = _stock_info(cache)
+    first = stock_info.industry_code_list_request_ka10101("0")
+    first["list"].append("mutated")
+    assert stock_info.industry_code_list_request_ka10101("0")["list"] == []
+    stock_info.industry_code_list_request_ka10101("1")
+    # TTL이 없는 api-id는 캐시하지 않음
+    stock_info.basic_stock_information_request_ka10001("005930")
+    stock_info.basic_stock_information_request_ka10001("005930")
+    assert server.calls == 4
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_stale_while_revalidate_sync():
+    cache = ResponseCache(ttls={"ka10101": 0.05}, stale_ttl=10)
+    stock_info, server = _stock_info(cache)
+    assert stock_info.industry_code_list_request_ka10101("0")["version"] == 1
+    time.sleep(0.06)
+    # 만료된 응답을 즉시 반환하고 백그라운드에서 갱신
+    assert stock_info.industry_code_list_request_ka10101("0")["version"] == 1
+    _wait_for(lambda: cache.refreshes == 1)
+    assert stock_info.industry_code_list_request_ka10101("0")["version"] == 2
+    assert server.calls == 2
+
+
+def test_stale_while_revalidate_async():
+    cache = ResponseCache(ttls={"ka10101": 0.05}, stale_ttl=10)
+    stock_info, server = _stock_info(cache, use_async=True)
+
+    async def run():
+        await stock_info.industry_code_list_request_ka10101("0")
+        await asyncio.sleep(0.06)
+        stale = await asyncio.gather(*(stock_info.industry_code_list_request_ka10101("0") for _ in range(5)))
+        await asyncio.sleep(0.01)
+        return [page["version"] for page in stale], await stock_info.industry_code_list_request_ka10101("0")
+
+    versions, fresh = asyncio.run(run())
+    assert versions == [1] * 5
+    assert fresh["version"] == 2
+    assert server.calls == 2
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(max_entries=2)
+    stock_info, server = _stock_info(cache)
+    for market in ("0", "1", "2", "0"):
+        stock_info.industry_code_list_request_ka10101(market)
+    assert server.calls == 4 and cache.evictions == 2 and len(cache) == 2
+
+    cache = ResponseCache(max_bytes=120)
+    stock_info, _ = _stock_info(cache)
+    for market in ("0", "1", "2"):
+        stock_info.industry_code_list_request_ka10101(market)
+    assert cache.size_bytes <= 120 and cache.evictions >= 1
+
+
+class _Tokens:
+    def __init__(self, token):
+        self.token = token
+
+    def get_token(self):
+        return self.token
+
+
+def test_cache_is_scoped_by_token_manager():
+    cache = ResponseCache()
+    server = CountingServer()
+    transport = httpx.MockTransport(server)
+    session = KiwoomSession(transport=transport, response_cache=cache)
+    alice = StockInfo(base_url="https://api.kiwoom.com", token_manager=_Tokens("alice"), session=session)
+    bob = StockInfo(base_url="https://api.kiwoom.com", token_manager=_Tokens("bob"), session=session)
+    assert alice.industry_code_list_request_ka10101("0")["version"] == 1
+    # 다른 계정은 같은 요청이라도 캐시를 공유하지 않음
+    assert bob.industry_code_list_request_ka10101("0")["version"] == 2
+    assert alice.industry_code_list_request_ka10101("0")["version"] == 1
+    assert server.calls == 2
@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.core import hooks
+from kiwoom_rest_api.core.cassette import CassetteMiss, CassettePlayer, CassetteRecorder, read_cassette
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+@pytest.fixture(autouse=True)
+def _clean_hooks():
+    yield
+    hooks.clear_hooks()
+
+
+def _record(path, latency=0.0):
+    mock = MockKiwoom(latency=latency, page_size=50, rows=120)
+    session = KiwoomSession(transport=mock.transport(), async_transport=mock.async_transport())
+    chart = Chart(base_url="https://api.kiwoom.com", session=session)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=session)
+    with CassetteRecorder(str(path)) as recorder:
+        ohlcv = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+        quote = asyncio.run(stock_info.basic_stock_information_request_ka10001("005930"))
+        chart.stock_daily_chart_request_ka10081("000660", "20250110", "1")
+        chart.stock_daily_chart_request_ka10081("000660", "20250110", "1")
+    return recorder, ohlcv, quote
+
+
+@pytest.mark.parametrize("name", ["day.jsonl", "day.jsonl.gz"])
+def test_record_then_replay_without_network(tmp_path, name):
+    path = tmp_path / name
+    recorder, ohlcv, quote = _record(path)
+    assert recorder.records == 6
+    entries = list(read_cassette(str(path)))
+    assert [entry["api_id"] for entry in entries[:3]] == ["ka10081"] * 3
+    assert entries[1]["cont_yn"] == "Y" and entries[0]["headers"]["cont-yn"] == "Y"
+
+    player = CassettePlayer(str(path))
+    chart = Chart(base_url="https://mockapi.kiwoom.com", session=player.session())
+    replayed = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+    assert list(replayed["cur_prc"]) == list(ohlcv["cur_prc"])
+
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=player.session())
+    assert asyncio.run(stock_info.basic_stock_information_request_ka10001("005930")) == quote
+
+    # 같은 요청은 기록된 횟수만큼 순서대로 재생
+    chart.stock_daily_chart_request_ka10081("000660", "20250110", "1")
+    chart.stock_daily_chart_request_ka10081("000660", "20250110", "1")
+    assert player.remaining == 0
+    with pytest.raises(CassetteMiss):
+        chart.stock_daily_chart_request_ka10081("000660", "20250110", "1")
+
+
+def test_replay_with_token_manager_never_touches_network(tmp_path, monkeypatch):
+    path = tmp_path / "day.jsonl"
+    _, ohlcv, quote = _record(path)
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("replay must not reach the network")
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", no_network)
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", no_network)
+    # 공유 토큰 캐시가 켜져 있어도 가짜 토큰을 저장하지 않아야 함
+    monkeypatch.setattr("kiwoom_rest_api.auth.token.USE_TOKEN_CACHE", True)
+    monkeypatch.setattr("kiwoom_rest_api.auth.token_store.TOKEN_CACHE_PATH", str(tmp_path / "tokens.json"))
+
+    player = CassettePlayer(str(path))
+    session = player.session()
+    token_manager = player.token_manager(session)
+    chart = Chart(base_url="https://api.kiwoom.com", token_manager=token_manager, session=session)
+    replayed = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+    assert list(replayed["cur_prc"]) == list(ohlcv["cur_prc"])
+    assert token_manager.get_token() == "cassette-replay"
+
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", token_manager=player.token_manager(), use_async=True,
+                           session=player.session())
+    assert asyncio.run(stock_info.basic_stock_information_request_ka10001("005930")) == quote
+    assert not (tmp_path / "tokens.json").exists()
+
+    # 재생 세션 없이 만든 TokenManager는 실제 서버에 토큰을 요청함
+    with pytest.raises(AssertionError, match="network"):
+        TokenManager(token_store=None).get_token()
+
+
+def test_replay_pacing(tmp_path):
+    path = tmp_path / "paced.jsonl"
+    _record(path, latency=0.02)
+
+    def replay(speed):
+        chart = Chart(base_url="https://api.kiwoom.com", session=CassettePlayer(str(path), speed=speed).session())
+        start = time.perf_counter()
+        chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+        return time.perf_counter() - start
+
+    assert replay(1.0) >= 0.05
+    assert replay(None) < 0.05
@@ -0,0 +1,118 @@
+import asyncio
+
+import httpx
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.account import Account
+from kiwoom_rest_api.koreanstock.order import Order
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class SlowServer:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.content)
+        number = len(self.calls)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"calls": number, "rows": [{"cur_prc": "+100"}], "return_code": 0})
+
+
+def _api(cls, server, **session_kwargs):
+    session = KiwoomSession(async_transport=httpx.MockTransport(server), **session_kwargs)
+    return cls(base_url="https://api.kiwoom.com", use_async=True, session=session)
+
+
+def test_identical_concurrent_requests_share_one_call():
+    server = SlowServer()
+    stock_info = _api(StockInfo, server)
+
+    async def run():
+        return await asyncio.gather(
+            *(stock_info.basic_stock_information_request_ka10001("005930") for _ in range(5)),
+            stock_info.basic_stock_information_request_ka10001("000660"),
+        )
+
+    results = asyncio.run(run())
+    assert len(server.calls) == 2
+    assert [result["calls"] for result in results[:5]] == [1] * 5
+    # 결과는 호출자마다 별도 dict이며 중첩된 행도 공유하지 않음
+    results[0]["calls"] = 99
+    results[0]["rows"][0]["cur_prc"] = "0"
+    assert results[1]["calls"] == 1 and results[1]["rows"] == [{"cur_prc": "+100"}]
+    stats = stock_info.session.coalescer.stats()
+    assert stats["coalesced"] == 4 and stats["in_flight"] == 0
+
+
+def test_cancelled_waiter_does_not_cancel_shared_request():
+    server = SlowServer()
+    stock_info = _api(StockInfo, server)
+
+    async def run():
+        first = asyncio.ensure_future(stock_info.basic_stock_information_request_ka10001("005930"))
+        second = asyncio.ensure_future(stock_info.basic_stock_information_request_ka10001("005930"))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run())["calls"] == 1
+    assert len(server.calls) == 1
+
+
+def test_orders_and_disabled_sessions_are_not_coalesced():
+    server = SlowServer()
+    order = _api(Order, server)
+
+    async def run_orders():
+        return await asyncio.gather(*(order.stock_buy_order_request_kt10000("KRX", "005930", "1", "3") for _ in range(2)))
+
+    asyncio.run(run_orders())
+    assert len(server.calls) == 2
+
+    server = SlowServer()
+    stock_info = _api(StockInfo, server, coalesce_requests=False)
+
+    async def run_queries():
+        return await asyncio.gather(*(stock_info.basic_stock_information_request_ka10001("005930") for _ in range(3)))
+
+    asyncio.run(run_queries())
+    assert len(server.calls) == 3
+
+
+class _Tokens:
+    def __init__(self, token):
+        self.token = token
+
+    async def get_token_async(self):
+        return self.token
+
+
+def test_requests_from_different_accounts_are_not_shared():
+    server = SlowServer()
+    session = KiwoomSession(async_transport=httpx.MockTransport(server))
+    alice = StockInfo(base_url="https://api.kiwoom.com", token_manager=_Tokens("alice"), use_async=True, session=session)
+    bob = StockInfo(base_url="https://api.kiwoom.com", token_manager=_Tokens("bob"), use_async=True, session=session)
+
+    async def run():
+        return await asyncio.gather(
+            alice.basic_stock_information_request_ka10001("005930"),
+            bob.basic_stock_information_request_ka10001("005930"),
+        )
+
+    results = asyncio.run(run())
+    assert len(server.calls) == 2
+    assert {result["calls"] for result in results} == {1, 2}
+
+
+def test_account_requests_are_not_coalesced():
+    server = SlowServer()
+    account = _api(Account, server)
+
+    async def run():
+        return await asyncio.gather(
+            *(account.account_evaluation_balance_detail_request_kt00018("1", "KRX") for _ in range(2))
+        )
+
+    asyncio.run(run())
+    assert len(server.calls) == 2
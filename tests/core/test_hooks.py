@@ -0,0 +1,61 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core import hooks
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if b"999999" in request.content:
+        return httpx.Response(400, json={"msg1": "종목코드 오류"})
+    return httpx.Response(200, json={"stk_cd": "005930", "return_code": 0})
+
+
+@pytest.fixture
+def events():
+    requests, responses = [], []
+    hooks.add_request_hook(requests.append)
+    hooks.add_response_hook(responses.append)
+    yield requests, responses
+    hooks.clear_hooks()
+
+
+def test_hooks_receive_request_and_response(events):
+    requests, responses = events
+    transport = httpx.MockTransport(_handler)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=KiwoomSession(transport=transport))
+
+    stock_info.basic_stock_information_request_ka10001("005930")
+    with pytest.raises(APIError):
+        stock_info.basic_stock_information_request_ka10001("999999")
+
+    assert [event.api_id for event in requests] == ["ka10001", "ka10001"]
+    assert requests[0].bytes_out > 0
+    ok, failed = responses
+    assert ok.status_code == 200 and ok.error is None and ok.bytes_in > 0 and ok.latency >= 0
+    assert failed.status_code == 400 and isinstance(failed.error, APIError)
+
+
+def test_async_path_is_silent_and_logs_at_debug(events, caplog, capsys):
+    requests, responses = events
+    transport = httpx.MockTransport(_handler)
+    stock_info = StockInfo(
+        base_url="https://api.kiwoom.com", use_async=True, session=KiwoomSession(async_transport=transport)
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="kiwoom_rest_api"):
+        asyncio.run(stock_info.basic_stock_information_request_ka10001("005930"))
+
+    assert capsys.readouterr().out == ""
+    assert "api-id=ka10001 status=200" in caplog.text
+    assert len(responses) == 1
+
+
+def test_instrumentation_disabled_by_default():
+    hooks.clear_hooks()
+    assert not hooks.instrumentation_enabled()
@@ -0,0 +1,54 @@
+import sys
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import process_response
+from kiwoom_rest_api.core.json_codec import (
+    _select_default_backend,
+    decode_json,
+    encode_json,
+    get_json_backend,
+    set_json_backend,
+)
+
+BODY = '{"stk_cd": "005930", "stk_nm": "삼성전자", "cur_prc": "+56600", "return_code": 0}'.encode("utf-8")
+HEADERS = {"cont-yn": "N", "next-key": "", "access-control-expose-headers": "cont-yn,next-key"}
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    original = get_json_backend()
+    yield
+    set_json_backend(original)
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+def test_backends_decode_identically(backend):
+    pytest.importorskip(backend)
+    set_json_backend(backend)
+
+    result = process_response(httpx.Response(200, content=BODY, headers=HEADERS))
+    assert result == {
+        "stk_cd": "005930", "stk_nm": "삼성전자", "cur_prc": "+56600", "return_code": 0, "cont-yn": "N", "next-key": "",
+    }
+
+    # 잘못된 JSON은 백엔드와 무관하게 원문을 그대로 돌려줌
+    assert process_response(httpx.Response(200, content=b"not json")) == {"content": "not json"}
+
+    # 캐시 저장용 인코딩은 같은 백엔드로 왕복 가능해야 함
+    assert decode_json(encode_json(result)) == result
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
+
+
+def test_configured_backend_falls_back_to_stdlib(monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    with caplog.at_level("WARNING", logger="kiwoom_rest_api"):
+        assert _select_default_backend("orjson") == "json"
+        assert _select_default_backend("simplejson") == "json"
+    assert get_json_backend() == "json"
+    assert caplog.text.count("falling back") == 2
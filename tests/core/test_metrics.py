@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core import hooks
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.metrics import MetricsRegistry
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+@pytest.fixture
+def metrics():
+    registry = MetricsRegistry().install()
+    yield registry
+    registry.uninstall()
+    hooks.clear_hooks()
+
+
+def _session(mock, max_retries=0):
+    policy = RetryPolicy(max_retries=max_retries, backoff=0, jitter=False)
+    return KiwoomSession(transport=mock.transport(), async_transport=mock.async_transport(), retry_policy=policy)
+
+
+def test_calls_bytes_latency_and_pagination_depth(metrics):
+    chart = Chart(base_url="https://api.kiwoom.com", session=_session(MockKiwoom(page_size=40, rows=100)))
+    chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+
+    series = metrics.snapshot()["ka10081 /api/dostk/chart"]
+    assert series["calls"] == 3 and series["errors"] == 0
+    assert series["bytes_out"] > 0 and series["bytes_in"] > series["bytes_out"]
+    assert series["latency"]["count"] == 3 and series["latency"]["p99"] is not None
+    assert series["pagination"] == {"walks": 1, "pages": 3, "mean_pages": 3.0, "rows": 100}
+
+
+def test_retries_and_error_codes(metrics):
+    mock = MockKiwoom(error_rate=1.0)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(mock, max_retries=2))
+    with pytest.raises(APIError):
+        stock_info.basic_stock_information_request_ka10001("005930")
+
+    def rejected(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"return_code": 5, "return_msg": "조회 불가"})
+
+    transport = httpx.MockTransport(rejected)
+    session = KiwoomSession(transport=transport, async_transport=transport)
+    StockInfo(base_url="https://api.kiwoom.com", session=session).basic_stock_information_request_ka10001("005930")
+    with pytest.raises(APIError):
+        asyncio.run(
+            StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=session)
+            .basic_stock_information_request_ka10001("005930")
+        )
+
+    series = metrics.snapshot()["ka10001 /api/dostk/stkinfo"]
+    assert series["calls"] == 5 and series["retries"] == 2
+    assert series["error_codes"] == {"http:500": 3, "return_code:5": 2}
+
+
+def test_prometheus_exposition(metrics):
+    mock = MockKiwoom()
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(mock))
+    stock_info.basic_stock_information_request_ka10001("005930")
+
+    text = metrics.to_prometheus()
+    labels = 'api_id="ka10001",resource_url="/api/dostk/stkinfo"'
+    assert "# TYPE kiwoom_request_duration_seconds histogram" in text
+    assert f"kiwoom_requests_total{{{labels}}} 1" in text
+    assert f'kiwoom_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+
+    server = metrics.serve(port=0)
+    try:
+        response = httpx.get(f"http://127.0.0.1:{server.server_address[1]}/metrics")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert response.status_code == 200 and response.text.startswith("# HELP")
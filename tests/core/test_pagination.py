@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import httpx
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+# 3페이지 x 3행, 최신 일자부터 내림차순
+PAGES = {
+    "": (["20250110", "20250109", "20250108"], "page2"),
+    "page2": (["20250107", "20250106", "20250105"], "page3"),
+    "page3": (["20250104", "20250103", "20250102"], ""),
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    key = request.headers.get("next-key", "")
+    dates, next_key = PAGES[key]
+    body = {
+        "stk_cd": json.loads(request.content)["stk_cd"],
+        "stk_dt_pole_chart_qry": [{"dt": dt, "cur_prc": "+100"} for dt in dates],
+        "return_code": 0,
+    }
+    headers = {
+        "cont-yn": "Y" if next_key else "N",
+        "next-key": next_key,
+        "access-control-expose-headers": "cont-yn,next-key",
+    }
+    return httpx.Response(200, json=body, headers=headers)
+
+
+def _chart(use_async: bool = False) -> Chart:
+    transport = httpx.MockTransport(_handler)
+    session = KiwoomSession(transport=transport, async_transport=transport)
+    return Chart(base_url="https://api.kiwoom.com", use_async=use_async, session=session)
+
+
+def test_paginate_follows_next_key():
+    chart = _chart()
+    pages = list(chart.paginate(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1"))
+    assert len(pages) == 3
+    assert pages[-1]["cont-yn"] == "N"
+
+
+def test_paginate_rows_with_stop_date_and_max_rows():
+    chart = _chart()
+    rows = list(chart.paginate(
+        chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1", rows=True, stop_date="20250106"
+    ))
+    assert [row["dt"] for row in rows] == ["20250110", "20250109", "20250108", "20250107", "20250106"]
+
+    rows = list(chart.paginate(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1", rows=True, max_rows=4))
+    assert len(rows) == 4
+
+
+def test_paginate_async():
+    chart = _chart(use_async=True)
+
+    async def run():
+        return [page async for page in chart.paginate_async(
+            chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1", max_pages=2
+        )]
+
+    pages = asyncio.run(run())
+    assert len(pages) == 2
+    assert pages[1]["stk_dt_pole_chart_qry"][0]["dt"] == "20250107"
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import httpx
+
+from kiwoom_rest_api.config import RATE_LIMIT_PER_SECOND
+from kiwoom_rest_api.core.rate_limit import RateLimiter, TokenBucket
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+
+def test_token_bucket_delays_instead_of_failing():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    waits = [bucket.acquire() for _ in range(4)]
+    elapsed = time.monotonic() - start
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] > 0
+    assert elapsed >= 0.09
+
+
+def test_buckets_by_api_id_and_family():
+    limiter = RateLimiter(default_limit=5, api_id_limits={"ka10081": (2, 2)})
+
+    limiter.acquire("ka10081", "https://api.kiwoom.com/api/dostk/chart")
+    limiter.acquire("kt10000", "https://api.kiwoom.com/api/dostk/ordr")
+
+    levels = limiter.levels()
+    assert levels["api:ka10081"] < 2
+    assert levels["family:/api/dostk/ordr"] < 5
+    assert levels["default"] == 5
+
+
+def test_async_requests_are_throttled():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"return_code": 0}))
+    limiter = RateLimiter(default_limit=(50, 1), api_id_limits={})
+    session = KiwoomSession(async_transport=transport, rate_limiter=limiter)
+    chart = Chart(base_url="https://api.kiwoom.com", use_async=True, session=session)
+
+    async def run():
+        start = time.monotonic()
+        # 서로 다른 종목 (동일 요청은 하나로 합쳐지므로)
+        await asyncio.gather(*[chart.stock_daily_chart_request_ka10081(f"00593{i}", "20250101", "1") for i in range(5)])
+        await session.aclose()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.07
+
+
+def test_default_chart_and_ranking_budgets():
+    limiter = RateLimiter(default_limit=10)
+    levels = limiter.levels()
+    assert levels["api:ka10081"] == 3 and levels["api:ka10027"] == 2
+    # 차트 api-id는 기본 버킷 대신 자신의 버킷을 사용
+    limiter.acquire("ka10081", "https://api.kiwoom.com/api/dostk/chart")
+    assert limiter.levels()["default"] == 10
+    assert "api:ka10081" not in RateLimiter(api_id_limits={}).levels()
+
+
+def test_app_key_bucket_caps_concurrent_api_ids():
+    limiter = RateLimiter(global_limit=(4, 4))
+    # 차트(3/s)와 순위(2/s) 버킷에는 여유가 있어도 앱키 단위 합계는 전역 한도를 넘지 않음
+    url = "https://api.kiwoom.com/api/dostk/chart"
+    waits = [limiter.acquire(api_id, url) for api_id in ("ka10081", "ka10082", "ka10027", "ka10030")]
+    assert waits == [0.0] * 4
+    assert limiter.level("ka10083", url) < 1
+    assert limiter.acquire("ka10083", url) > 0
+    assert RateLimiter().levels()["global"] == RATE_LIMIT_PER_SECOND
@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.order import Order
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+def _flaky(failures, status=503, headers=None):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["api-id"])
+        if len(calls) <= failures:
+            return httpx.Response(status, json={"return_code": 1, "return_msg": "busy"}, headers=headers or {})
+        return httpx.Response(200, json={"return_code": 0, "ord_no": "0000139"})
+
+    return handler, calls
+
+
+def _session(handler, **policy) -> KiwoomSession:
+    transport = httpx.MockTransport(handler)
+    policy = RetryPolicy(**{"backoff": 0, "jitter": False, **policy})
+    return KiwoomSession(transport=transport, async_transport=transport, retry_policy=policy)
+
+
+def test_query_api_is_retried_sync_and_async():
+    handler, calls = _flaky(2)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(handler))
+    assert stock_info.basic_stock_information_request_ka10001("005930")["return_code"] == 0
+    assert len(calls) == 3
+
+    handler, calls = _flaky(1)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=_session(handler))
+    assert asyncio.run(stock_info.basic_stock_information_request_ka10001("005930"))["return_code"] == 0
+    assert len(calls) == 2
+
+
+def test_retries_are_bounded():
+    handler, calls = _flaky(10)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(handler, max_retries=2))
+    with pytest.raises(APIError):
+        stock_info.basic_stock_information_request_ka10001("005930")
+    assert len(calls) == 3
+
+
+def test_orders_are_not_retried_on_server_errors():
+    handler, calls = _flaky(1)
+    order = Order(base_url="https://api.kiwoom.com", session=_session(handler))
+    with pytest.raises(APIError):
+        order.stock_buy_order_request_kt10000("KRX", "005930", "1", "3")
+    assert calls == ["kt10000"]
+
+    # 요청 한도 거절(429)은 주문이 접수되지 않았으므로 재시도
+    handler, calls = _flaky(1, status=429)
+    order = Order(base_url="https://api.kiwoom.com", session=_session(handler))
+    assert order.stock_buy_order_request_kt10000("KRX", "005930", "1", "3")["ord_no"] == "0000139"
+    assert len(calls) == 2
+
+
+def test_classification_and_retry_after():
+    policy = RetryPolicy(jitter=False, backoff=1.0)
+    connect_error = httpx.ConnectError("refused")
+    read_timeout = httpx.ReadTimeout("slow")
+    assert policy.next_delay(1, "kt10001", "https://api.kiwoom.com/api/dostk/ordr", error=connect_error) == 1.0
+    assert policy.next_delay(1, "kt10001", "https://api.kiwoom.com/api/dostk/ordr", error=read_timeout) is None
+    assert policy.next_delay(2, "ka10001", "https://api.kiwoom.com/api/dostk/stkinfo", error=read_timeout) == 2.0
+    assert policy.next_delay(1, "ka10001", "", result={"return_code": 1700, "return_msg": "limit"}) == 1.0
+    assert policy.next_delay(1, "ka10001", "", error=APIError(400, "bad request")) is None
+
+    throttled = APIError(429, "too many", headers={"retry-after": "3"})
+    assert policy.next_delay(1, "ka10001", "", error=throttled) == 3.0
+    assert policy.next_delay(3, "ka10001", "", error=throttled) is None
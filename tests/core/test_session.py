@@ -0,0 +1,99 @@
+import asyncio
+import sys
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"return_code": 0, "return_msg": "정상", "api_id": request.headers.get("api-id")},
+        headers={"cont-yn": "N", "next-key": "", "access-control-expose-headers": "cont-yn,next-key"},
+    )
+
+
+def test_session_is_shared_across_api_classes():
+    transport = httpx.MockTransport(_handler)
+    with KiwoomSession(transport=transport) as session:
+        stock_info = StockInfo(base_url="https://api.kiwoom.com", session=session)
+        chart = Chart(base_url="https://api.kiwoom.com", session=session)
+
+        assert stock_info.session.client is chart.session.client
+
+        result = stock_info.basic_stock_information_request_ka10001("005930")
+        assert result["api_id"] == "ka10001"
+        assert result["cont-yn"] == "N"
+
+        # 공유 세션은 개별 인스턴스의 close()로 닫히지 않음
+        stock_info.close()
+        assert not session.closed
+
+    assert session.closed
+
+
+def test_owned_session_closed_by_context_manager():
+    with StockInfo(base_url="https://api.kiwoom.com") as stock_info:
+        session = stock_info.session
+        assert not session.closed
+    assert session.closed
+
+
+def test_async_session_reuses_client():
+    transport = httpx.MockTransport(_handler)
+
+    async def run():
+        session = KiwoomSession(async_transport=transport)
+        async with StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=session) as stock_info:
+            results = await asyncio.gather(
+                *[stock_info.basic_stock_information_request_ka10001("005930") for _ in range(5)]
+            )
+            client = session.async_client
+            await session.aclose()
+            return results, client
+
+    results, client = asyncio.run(run())
+    assert [r["api_id"] for r in results] == ["ka10001"] * 5
+    assert client.is_closed
+
+
+def test_async_client_follows_event_loop():
+    # 실제 소켓을 쓰는 목 서버: 이전 루프에 묶인 연결을 재사용하면 "Event loop is closed"
+    with MockKiwoom().serve() as server:
+        chart = Chart(base_url=server.url, use_async=True)
+        first = asyncio.run(chart.stock_daily_chart_request_ka10081("005930", "20250110", "1"))
+        client = chart.session.async_client
+        second = asyncio.run(chart.stock_daily_chart_request_ka10081("005930", "20250110", "1"))
+        assert first["return_code"] == second["return_code"] == 0
+        assert chart.session.async_client is not client
+
+
+def test_session_timeout_applies_to_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return _handler(request)
+
+    async def run(session):
+        stock_info = StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=session)
+        await stock_info.basic_stock_information_request_ka10001("005930")
+        await session.aclose()
+
+    transport = httpx.MockTransport(handler)
+    with KiwoomSession(timeout=2.0, transport=transport, async_transport=transport) as session:
+        StockInfo(base_url="https://api.kiwoom.com", session=session).basic_stock_information_request_ka10001("005930")
+        asyncio.run(run(session))
+    assert seen == [{"connect": 2.0, "read": 2.0, "write": 2.0, "pool": 2.0}] * 2
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.warns(RuntimeWarning):
+        session = KiwoomSession(http2=True)
+    assert session.http2 is False
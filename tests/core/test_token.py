@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.auth.token_store import FileTokenStore
+from kiwoom_rest_api.core.session import KiwoomSession
+
+
+def _token_transport(calls: list, delay: float = 0.0) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if delay:
+            time.sleep(delay)
+        expires_dt = (datetime.now() + timedelta(hours=24)).strftime("%Y%m%d%H%M%S")
+        return httpx.Response(
+            200, json={"token": f"token-{len(calls)}", "expires_dt": expires_dt, "return_code": 0}
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_concurrent_threads_share_one_token_request():
+    calls = []
+    transport = _token_transport(calls, delay=0.05)
+    token_manager = TokenManager(session=KiwoomSession(transport=transport))
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(token_manager.get_token())) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["/oauth2/token"]
+    assert set(tokens) == {"token-1"}
+
+
+def test_concurrent_tasks_share_one_async_token_request():
+    calls = []
+    transport = _token_transport(calls)
+    token_manager = TokenManager(session=KiwoomSession(async_transport=transport))
+
+    async def run():
+        return await asyncio.gather(*[token_manager.get_token_async() for _ in range(50)])
+
+    tokens = asyncio.run(run())
+    assert calls == ["/oauth2/token"]
+    assert set(tokens) == {"token-1"}
+
+
+def test_token_inside_refresh_margin_is_refreshed_in_background():
+    calls = []
+    transport = _token_transport(calls)
+    token_manager = TokenManager(session=KiwoomSession(async_transport=transport), refresh_margin=600)
+    token_manager._access_token = "old-token"
+    token_manager._token_expiry = datetime.now() + timedelta(seconds=120)
+
+    async def run():
+        first = await token_manager.get_token_async()
+        await token_manager._async_task
+        return first, await token_manager.get_token_async()
+
+    assert asyncio.run(run()) == ("old-token", "token-1")
+
+
+def test_failed_background_refresh_is_logged(caplog):
+    transport = httpx.MockTransport(lambda request: httpx.Response(500, json={"return_code": 1, "return_msg": "busy"}))
+    token_manager = TokenManager(session=KiwoomSession(async_transport=transport), refresh_margin=600)
+    token_manager._access_token = "old-token"
+    token_manager._token_expiry = datetime.now() + timedelta(seconds=120)
+
+    async def run():
+        token = await token_manager.get_token_async()
+        task = token_manager._async_task
+        await asyncio.wait([task])
+        return token, task
+
+    with caplog.at_level("WARNING", logger="kiwoom_rest_api"):
+        token, task = asyncio.run(run())
+    assert token == "old-token" and task.done()
+    assert "Token refresh failed" in caplog.text
+
+
+def test_file_token_store_is_shared_between_managers(tmp_path):
+    calls = []
+    transport = _token_transport(calls, delay=0.05)
+    store_path = str(tmp_path / "tokens.json")
+
+    managers = [
+        TokenManager(session=KiwoomSession(transport=transport), token_store=FileTokenStore(store_path))
+        for _ in range(5)
+    ]
+    tokens = []
+    threads = [threading.Thread(target=lambda m=m: tokens.append(m.get_token())) for m in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["/oauth2/token"]
+    assert set(tokens) == {"token-1"}
+
+    # 새로 시작한 프로세스에 해당: 생성 시점에 캐시된 토큰을 읽어 바로 사용
+    fresh = TokenManager(session=KiwoomSession(transport=transport), token_store=FileTokenStore(store_path))
+    assert fresh._is_access_token_valid()
+    assert fresh.get_token() == "token-1"
+    assert len(calls) == 1
+
+
+def test_file_token_store_is_shared_between_async_managers(tmp_path):
+    calls = []
+    transport = _token_transport(calls, delay=0.05)
+    store_path = str(tmp_path / "tokens.json")
+
+    # 파일 캐시를 쓰면 발급 요청은 잠금을 잡은 실행기 스레드에서 동기 클라이언트로 보냄
+    managers = [
+        TokenManager(
+            session=KiwoomSession(transport=transport, async_transport=transport), token_store=FileTokenStore(store_path)
+        )
+        for _ in range(5)
+    ]
+    tokens = []
+    # 매니저마다 별도 이벤트 루프(프로세스에 해당)에서 동시에 발급 요청
+    threads = [
+        threading.Thread(target=lambda m=m: tokens.append(asyncio.run(m.get_token_async()))) for m in managers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["/oauth2/token"]
+    assert set(tokens) == {"token-1"}
+    assert FileTokenStore(store_path).load(managers[0]._cache_key())["token"] == "token-1"
+
+
+def test_sync_token_call_on_loop_thread_during_async_refresh_does_not_deadlock(tmp_path):
+    calls = []
+    transport = _token_transport(calls, delay=0.2)
+
+    async def slow_async(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return transport.handle_request(request)
+
+    token_manager = TokenManager(
+        session=KiwoomSession(transport=transport, async_transport=httpx.MockTransport(slow_async)),
+        token_store=FileTokenStore(str(tmp_path / "tokens.json")),
+    )
+    results = []
+
+    async def run():
+        task = asyncio.ensure_future(token_manager.get_token_async())
+        await asyncio.sleep(0.05)
+        # 비동기 발급이 잠금을 잡고 있는 동안 이벤트 루프 스레드에서 동기 호출
+        results.append(token_manager.access_token)
+        results.append(await task)
+
+    thread = threading.Thread(target=lambda: asyncio.run(run()), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert results == ["token-1", "token-1"] and calls == ["/oauth2/token"]
+
+
+def test_malformed_cache_entry_is_a_cache_miss(tmp_path):
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    probe = TokenManager(token_store=store)
+    expires_dt = (datetime.now() + timedelta(hours=24)).strftime("%Y%m%d%H%M%S")
+    store.save(probe._cache_key(), {
+        "token": "cached", "expires_dt": expires_dt, "refresh_token": "refresh", "refresh_expires_dt": "not-a-date",
+    })
+
+    token_manager = TokenManager(token_store=store)
+    assert not token_manager._is_access_token_valid() and token_manager._refresh_token is None
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import httpx
+
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.bulk import BulkDownloader, market_codes_async
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+class FakeServer:
+    def __init__(self, flaky=(), broken=()):
+        self.flaky = set(flaky)
+        self.broken = set(broken)
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.headers["api-id"] == "ka10099":
+            return httpx.Response(200, json={"list": [{"code": "005930"}, {"code": "000660"}], "return_code": 0})
+        code = body["stk_cd"]
+        self.calls[code] = self.calls.get(code, 0) + 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if code in self.broken:
+            return httpx.Response(400, json={"return_code": 2, "return_msg": "잘못된 종목코드"})
+        if code in self.flaky and self.calls[code] == 1:
+            return httpx.Response(503, json={"return_code": 1, "return_msg": "busy"})
+        rows = [{"dt": "20250110", "cur_prc": "+100", "open_pric": "1", "high_pric": "1", "low_pric": "1",
+                 "trde_qty": "1", "trde_prica": "1"}]
+        return httpx.Response(200, json={"stk_cd": code, "stk_dt_pole_chart_qry": rows, "return_code": 0})
+
+
+def _session(server) -> KiwoomSession:
+    # 재시도는 세션의 retry_policy가 요청 단위로 처리
+    policy = RetryPolicy(max_retries=2, backoff=0, jitter=False)
+    return KiwoomSession(async_transport=httpx.MockTransport(server), retry_policy=policy)
+
+
+def test_bulk_download_bounds_concurrency_and_retries():
+    server = FakeServer(flaky={"000003"}, broken={"000004"})
+    chart = Chart(base_url="https://api.kiwoom.com", use_async=True, session=_session(server))
+    progress = []
+    downloader = BulkDownloader(chart, concurrency=3, progress=lambda r, done, total: progress.append((r.code, done, total)))
+    codes = [f"{i:06d}" for i in range(10)]
+    result = asyncio.run(downloader.download_async(codes, base_dt="20250110"))
+
+    assert server.peak <= 3
+    assert list(result.symbols) == codes
+    assert set(result.errors) == {"000004"}
+    # 400은 재시도하지 않고, 503은 세션 정책으로 한 번 재시도
+    assert server.calls["000004"] == 1
+    assert server.calls["000003"] == 2
+    assert result.data["000003"]["cur_prc"].tolist() == [100]
+    assert len(progress) == 10 and progress[-1][1:] == (10, 10)
+    assert all(seconds > 0 for seconds in result.timings.values())
+
+
+def test_download_can_run_twice():
+    # download()는 호출마다 새 이벤트 루프를 만들므로 세션의 비동기 클라이언트도 새 루프에 맞춰 다시 생성되어야 함
+    with MockKiwoom(rows=3, page_size=3).serve() as server:
+        downloader = BulkDownloader(Chart(base_url=server.url, use_async=True), concurrency=2)
+        for _ in range(2):
+            result = downloader.download(["005930", "000660"], base_dt="20250110")
+            assert not result.errors
+            assert len(result.data["005930"]) == 3
+
+
+def test_market_codes_from_ka10099():
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", use_async=True, session=_session(FakeServer()))
+    assert asyncio.run(market_codes_async(stock_info, "0")) == ["005930", "000660"]
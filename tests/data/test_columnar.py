@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import httpx
+import numpy as np
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.columnar import OHLCVColumns
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+# 2페이지 x 3봉, 최신 일자부터 내림차순
+PAGES = {
+    "": (["20250110", "20250109", "20250108"], "page2"),
+    "page2": (["20250107", "20250106", "20250105"], ""),
+}
+
+
+def _candle(dt: str) -> dict:
+    day = int(dt[-2:])
+    return {
+        "dt": dt, "cur_prc": f"-{1000 + day}", "open_pric": f"+{990 + day}", "high_pric": f"{1010 + day}",
+        "low_pric": f"-{980 + day}", "trde_qty": str(day * 10), "trde_prica": "", "upd_stkpc_tp": "",
+    }
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    dates, next_key = PAGES[request.headers.get("next-key", "")]
+    body = {
+        "stk_cd": json.loads(request.content)["stk_cd"],
+        "stk_dt_pole_chart_qry": [_candle(dt) for dt in dates],
+        "return_code": 0,
+    }
+    headers = {
+        "cont-yn": "Y" if next_key else "N",
+        "next-key": next_key,
+        "access-control-expose-headers": "cont-yn,next-key",
+    }
+    return httpx.Response(200, json=body, headers=headers)
+
+
+def _chart(use_async: bool = False) -> Chart:
+    transport = httpx.MockTransport(_handler)
+    session = KiwoomSession(transport=transport, async_transport=transport)
+    return Chart(base_url="https://api.kiwoom.com", use_async=use_async, session=session)
+
+
+def test_ohlcv_columns_sorted_and_unsigned():
+    chart = _chart()
+    ohlcv = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+    assert len(ohlcv) == 6
+    assert ohlcv["dt"].tolist() == [20250105, 20250106, 20250107, 20250108, 20250109, 20250110]
+    assert ohlcv["cur_prc"].tolist() == [1005, 1006, 1007, 1008, 1009, 1010]
+    assert ohlcv["low_pric"].dtype == np.int64 and ohlcv["low_pric"][0] == 985
+    assert ohlcv["trde_prica"].tolist() == [0] * 6
+
+
+def test_ohlcv_async_with_max_rows():
+    chart = _chart(use_async=True)
+    ohlcv = asyncio.run(chart.ohlcv_async(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1", max_rows=4))
+    assert ohlcv["dt"].tolist() == [20250107, 20250108, 20250109, 20250110]
+
+
+def test_columns_grow_beyond_capacity():
+    columns = OHLCVColumns(capacity=2)
+    columns.append_rows([_candle("20250101"), _candle("20250102")])
+    columns.append_rows([_candle(f"202501{day:02d}") for day in range(3, 10)])
+    assert len(columns) == 9
+    assert columns.to_dict()["trde_qty"].tolist() == [day * 10 for day in range(1, 10)]
+
+
+def test_industry_chart_keeps_decimal_prices():
+    mock = MockKiwoom(rows=5, page_size=5)
+    session = KiwoomSession(transport=mock.transport())
+    chart = Chart(base_url="https://api.kiwoom.com", session=session)
+    ohlcv = chart.ohlcv(chart.industry_daily_chart_request_ka20006, "001", "20250110")
+    page = chart.industry_daily_chart_request_ka20006("001", "20250110")
+    expected = sorted((int(row["dt"]), abs(float(row["cur_prc"]))) for row in page["inds_dt_pole_qry"])
+    assert ohlcv["cur_prc"].dtype == np.float64 and ohlcv["trde_qty"].dtype == np.int64
+    assert list(zip(ohlcv["dt"].tolist(), ohlcv["cur_prc"].tolist())) == expected
+    assert any(value != int(value) for value in ohlcv["cur_prc"].tolist())
+
+
+def test_malformed_and_decimal_cells_promote_the_column():
+    columns = OHLCVColumns(capacity=2)
+    columns.append_rows([_candle("20250101")])
+    columns.append_rows([dict(_candle("20250102"), cur_prc="-1002.5"), dict(_candle("20250103"), cur_prc="N/A")])
+    columns.append_rows([_candle("20250104")])
+    cur_prc = columns["cur_prc"]
+    assert cur_prc.dtype == np.float64
+    assert cur_prc[:2].tolist() == [1001.0, 1002.5] and np.isnan(cur_prc[2]) and cur_prc[3] == 1004.0
+    # 다른 컬럼은 int64 그대로
+    assert columns["open_pric"].dtype == np.int64 and columns["trde_qty"].tolist() == [10, 20, 30, 40]
@@ -0,0 +1,144 @@
+import json
+import math
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.columnar import OHLCVColumns
+from kiwoom_rest_api.data.history import HistoryStore
+from kiwoom_rest_api.koreanstock.chart import Chart
+
+PAGE_SIZE = 3
+
+
+class FakeServer:
+    """ka10081 일봉을 최신순으로 PAGE_SIZE개씩 제공"""
+
+    def __init__(self, closes):
+        self.closes = dict(closes)
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        dates = sorted(self.closes, reverse=True)
+        start = int(request.headers.get("next-key") or 0)
+        page = dates[start:start + PAGE_SIZE]
+        more = start + PAGE_SIZE < len(dates)
+        body = {
+            "stk_cd": json.loads(request.content)["stk_cd"],
+            "stk_dt_pole_chart_qry": [
+                {"dt": dt, "cur_prc": f"+{self.closes[dt]}", "open_pric": "100", "high_pric": "200",
+                 "low_pric": "50", "trde_qty": "10", "trde_prica": "1"}
+                for dt in page
+            ],
+            "return_code": 0,
+        }
+        headers = {
+            "cont-yn": "Y" if more else "N",
+            "next-key": str(start + PAGE_SIZE) if more else "",
+            "access-control-expose-headers": "cont-yn,next-key",
+        }
+        return httpx.Response(200, json=body, headers=headers)
+
+
+def _store(tmp_path, server):
+    session = KiwoomSession(transport=httpx.MockTransport(server))
+    return HistoryStore(str(tmp_path), chart=Chart(base_url="https://api.kiwoom.com", session=session))
+
+
+def test_sync_fetches_only_missing_tail(tmp_path):
+    server = FakeServer({f"202501{day:02d}": 1000 + day for day in range(1, 11)})
+    store = _store(tmp_path, server)
+    assert store.sync("005930", base_dt="20250110") == 10
+    assert server.requests == 4
+
+    # 장중에 받은 마지막 봉은 갱신되고 새 봉 두 개가 추가됨
+    server.closes.update({"20250110": 2000, "20250111": 1011, "20250112": 1012})
+    server.requests = 0
+    assert store.sync("005930", base_dt="20250112") == 3
+    # 마지막 저장 일자보다 오래된 봉이 보이는 두 번째 페이지에서 중단
+    assert server.requests == 2
+
+    bars = store.read("005930")
+    assert bars["dt"].tolist() == [int(f"202501{day:02d}") for day in range(1, 13)]
+    assert bars["cur_prc"][-3:].tolist() == [2000, 1011, 1012]
+    assert store.last_date("005930") == "20250112"
+
+
+def test_read_range_is_zero_copy_view(tmp_path):
+    store = _store(tmp_path, FakeServer({f"202502{day:02d}": day for day in range(1, 8)}))
+    store.sync("000660", base_dt="20250207", start_date="20250203")
+    bars = store.read("000660", start="20250204", end="20250206")
+    assert bars["dt"].tolist() == [20250204, 20250205, 20250206]
+    assert not bars.flags.owndata
+    assert list(store.codes()) == ["000660"]
+    assert len(store.read("999999")) == 0
+
+
+def test_write_replaces_file_without_touching_open_views(tmp_path):
+    server = FakeServer({f"202503{day:02d}": day for day in range(1, 5)})
+    store = _store(tmp_path, server)
+    store.sync("005930", base_dt="20250304")
+    before = store.read("005930")
+    assert before["cur_prc"].tolist() == [1, 2, 3, 4]
+
+    server.closes.update({"20250304": 40, "20250305": 5})
+    store.sync("005930", base_dt="20250305")
+    # 이미 매핑된 배열은 이전 파일을 계속 보고, 새로 읽으면 갱신된 봉이 보임
+    assert before["cur_prc"].tolist() == [1, 2, 3, 4]
+    assert store.read("005930")["cur_prc"].tolist() == [1, 2, 3, 40, 5]
+    assert sorted(p.name for p in (tmp_path / "daily").iterdir()) == ["005930.bin"]
+
+
+def test_write_while_mapped_fails_cleanly_when_replace_is_refused(tmp_path, monkeypatch):
+    server = FakeServer({f"202503{day:02d}": day for day in range(1, 4)})
+    store = _store(tmp_path, server)
+    store.sync("005930", base_dt="20250303")
+    mapped = store.read("005930")
+
+    # Windows처럼 매핑된 파일의 교체를 거부
+    def refuse(src, dst):
+        raise PermissionError(13, "The process cannot access the file", dst)
+
+    monkeypatch.setattr("kiwoom_rest_api.data.storage.os.replace", refuse)
+    server.closes.update({"20250303": 30, "20250304": 4})
+    with pytest.raises(PermissionError, match=r"load\(\)/read\(\)"):
+        store.sync("005930", base_dt="20250304")
+    monkeypatch.undo()
+
+    # 기존 파일과 매핑은 그대로이고 임시 파일도 남지 않음
+    assert mapped["cur_prc"].tolist() == [1, 2, 3]
+    assert store.read("005930")["cur_prc"].tolist() == [1, 2, 3]
+    assert sorted(p.name for p in (tmp_path / "daily").iterdir()) == ["005930.bin"]
+
+    # 복사본만 남기고 매핑을 해제하면 다시 쓸 수 있음
+    kept = mapped.copy()
+    del mapped
+    assert store.sync("005930", base_dt="20250304") == 2
+    assert kept["cur_prc"].tolist() == [1, 2, 3]
+    assert store.read("005930")["cur_prc"].tolist() == [1, 2, 30, 4]
+
+
+def test_decimal_and_malformed_values_round_trip(tmp_path):
+    columns = OHLCVColumns()
+    columns.append_rows([
+        {"dt": "20250102", "cur_prc": "+1000.5", "open_pric": "1000", "high_pric": "1001", "low_pric": "999",
+         "trde_qty": "N/A", "trde_prica": "12"},
+        {"dt": "20250101", "cur_prc": "-990", "open_pric": "990", "high_pric": "995", "low_pric": "985",
+         "trde_qty": "7", "trde_prica": "3"},
+    ])
+    store = HistoryStore(str(tmp_path))
+    assert store.write("005930", "daily", columns.sort()) == 2
+
+    bars = store.read("005930")
+    assert bars["dt"].tolist() == [20250101, 20250102]
+    assert bars["cur_prc"].tolist() == [990, 1000.5]
+    assert bars["trde_qty"][0] == 7 and math.isnan(bars["trde_qty"][1])
+
+    # 이전 형식(모든 컬럼 int64) 파일은 섞어 쓰지 않고 full=True로 다시 받도록 알림
+    path = store.path("005930")
+    with open(path, "r+b") as f:
+        f.write(b"KWOHLCV1")
+    with pytest.raises(ValueError, match="full=True"):
+        store.write("005930", "daily", columns)
@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import pytest
+
+from kiwoom_rest_api.data.numeric import (
+    FLOAT,
+    INT,
+    PRICE,
+    convert_response,
+    convert_row,
+    parse_number,
+    to_numpy_column,
+    to_numpy_columns,
+)
+
+
+def test_parse_number_sign_handling():
+    assert parse_number("+156600", PRICE) == 156600
+    assert parse_number("-156600", PRICE) == 156600  # 가격의 부호는 등락 방향
+    assert parse_number("-1000") == -1000
+    assert parse_number("00000197") == 197
+    assert parse_number("+28.68", FLOAT) == 28.68
+    assert parse_number("-0.35", FLOAT, decimal=True) == Decimal("-0.35")
+    assert parse_number("1,234") == 1234
+    assert parse_number("") is None
+    assert parse_number("N/A") == "N/A"
+    assert parse_number("1_000") == "1_000" and parse_number("+1_0.5", FLOAT) == "+1_0.5"
+
+
+def test_convert_row_uses_schema_and_inference():
+    row = {"stk_cd": "005930", "cur_prc": "-56600", "flu_rt": "+1.25", "acc_trde_qty": "0001234", "dt": "20250110"}
+    assert convert_row(row) == {"stk_cd": "005930", "cur_prc": 56600, "flu_rt": 1.25, "acc_trde_qty": 1234, "dt": "20250110"}
+    assert convert_row(row, schema={}, infer=False) == row
+    assert convert_row({"flu_rt": "-0.35"}, decimal=True) == {"flu_rt": Decimal("-0.35")}
+
+
+def test_convert_response_converts_top_level_and_lists():
+    response = {
+        "stk_cd": "005930",
+        "cur_prc": "-56600",
+        "stk_dt_pole_chart_qry": [
+            {"dt": "20250110", "cur_prc": "+56600", "trde_qty": "0001234", "flu_rt": "+1.25", "pred_pre": "-700"},
+        ],
+        "return_code": 0,
+        "cont-yn": "N",
+    }
+    converted = convert_response(response)
+    assert converted["cur_prc"] == 56600
+    assert converted["stk_dt_pole_chart_qry"][0] == {
+        "dt": "20250110", "cur_prc": 56600, "trde_qty": 1234, "flu_rt": 1.25, "pred_pre": -700,
+    }
+    assert converted["cont-yn"] == "N"
+    assert response["stk_dt_pole_chart_qry"][0]["cur_prc"] == "+56600"
+
+
+def test_numpy_columns():
+    np = pytest.importorskip("numpy")
+    rows = [
+        {"dt": "20250110", "cur_prc": "-56600", "flu_rt": "+1.5", "trde_qty": "--3"},
+        {"dt": "20250109", "cur_prc": "+57000", "flu_rt": "", "trde_qty": "4"},
+    ]
+    columns = to_numpy_columns(rows)
+    assert columns["cur_prc"].tolist() == [56600, 57000]
+    assert columns["trde_qty"].dtype == np.int64
+    assert np.isnan(columns["flu_rt"][1])
+    assert columns["dt"].tolist() == ["20250110", "20250109"]
+
+
+def test_numpy_column_keeps_decimals_and_maps_malformed_to_nan():
+    np = pytest.importorskip("numpy")
+    prices = to_numpy_column(["-2394.49", "+2400.10", ""], PRICE)
+    assert prices.dtype == np.float64
+    assert prices.tolist() == [2394.49, 2400.10, 0.0]
+
+    quantities = to_numpy_column(["--3", "1,234", "N/A"], INT)
+    assert quantities.dtype == np.float64
+    assert quantities[:2].tolist() == [3.0, 1234.0] and np.isnan(quantities[2])
+
+    rates = to_numpy_column(["+1.5", "-", "N/A"], FLOAT)
+    assert rates[0] == 1.5 and np.isnan(rates[1:]).all()
+
+    # int64 범위를 넘는 정수는 예외 없이 float64, 밑줄 구분은 NaN
+    huge = to_numpy_column(["99999999999999999999", "1"], INT)
+    assert huge.dtype == np.float64 and huge.tolist() == [1e20, 1.0]
+    underscored = to_numpy_column(["1_000", "5"], INT)
+    assert np.isnan(underscored[0]) and underscored[1] == 5
+    assert np.isnan(to_numpy_column(["1_000.5"], FLOAT)[0])
+
+    # 정수만 있으면 int64 유지
+    assert to_numpy_column(["--100", "+5"], INT).dtype == np.int64
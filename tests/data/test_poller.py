@@ -0,0 +1,74 @@
+import asyncio
+import math
+
+from kiwoom_rest_api.data.poller import SnapshotPoller
+
+CODES = ["005930", "000660", "035420"]
+
+
+def _quotes(prices):
+    return {code: {"stk_cd": code, "cur_prc": f"+{price}", "trde_qty": "10"} for code, price in prices.items()}
+
+
+def test_update_emits_only_changed_rows():
+    poller = SnapshotPoller(None, CODES, fields=("cur_prc", "trde_qty"), fetch=lambda codes: None)
+    first = poller.update(_quotes({"005930": 100, "000660": 200, "035420": 300}))
+    assert first.codes.tolist() == CODES
+    assert math.isnan(first.delta[0, 0])
+
+    diff = poller.update(_quotes({"005930": 100, "000660": 190, "035420": 300}))
+    assert diff.codes.tolist() == ["000660"]
+    assert diff.delta[0].tolist() == [-10.0, 0.0]
+    assert diff.changed[0].tolist() == [True, False]
+    assert next(diff.rows()) == {"stk_cd": "000660", "cur_prc": 190.0, "cur_prc_delta": -10.0,
+                                 "trde_qty": 10.0, "trde_qty_delta": 0.0}
+
+    # 응답에서 빠진 종목은 직전 값을 유지
+    assert len(poller.update(_quotes({"005930": 100}))) == 0
+
+
+def test_run_publishes_to_callbacks_and_queues():
+    snapshots = iter([
+        {"005930": 100, "000660": 200, "035420": 300},
+        {"005930": 100, "000660": 200, "035420": 300},
+        {"005930": 101, "000660": 200, "035420": 299},
+    ])
+
+    async def fetch(codes):
+        return _quotes(next(snapshots))
+
+    async def run():
+        poller = SnapshotPoller(None, CODES, fields=("cur_prc",), interval=0, fetch=fetch, emit_initial=False)
+        received = []
+        poller.subscribe(received.append)
+        queue = poller.queue()
+        await poller.run(iterations=3)
+        return received, queue
+
+    received, queue = asyncio.run(run())
+    assert len(received) == 1 and queue.qsize() == 1
+    assert received[0].codes.tolist() == ["005930", "035420"]
+    assert received[0].delta[:, 0].tolist() == [1.0, -1.0]
+
+
+def test_missing_or_unparseable_field_keeps_previous_value():
+    poller = SnapshotPoller(None, CODES, fields=("cur_prc", "trde_qty"), fetch=lambda codes: None)
+    quotes = _quotes({"005930": 100, "000660": 200, "035420": 300})
+    del quotes["035420"]["trde_qty"]
+    first = poller.update(quotes)
+    # 처음부터 없던 값은 0이 아니라 NaN
+    assert math.isnan(poller.snapshot[2, 1])
+    assert first.changed[2].tolist() == [True, False]
+
+    # 필드가 빠지거나 비어 있거나 해석할 수 없으면 변경으로 보지 않고 직전 값을 유지
+    quotes = _quotes({"005930": 100, "000660": 200, "035420": 300})
+    del quotes["005930"]["trde_qty"]
+    quotes["000660"]["trde_qty"] = ""
+    quotes["035420"] = {"stk_cd": "035420", "cur_prc": "N/A"}
+    assert len(poller.update(quotes)) == 0
+    assert poller.snapshot[:, 0].tolist() == [100.0, 200.0, 300.0]
+    assert poller.snapshot[:2, 1].tolist() == [10.0, 10.0]
+
+    diff = poller.update(_quotes({"005930": 100, "000660": 200, "035420": 300}))
+    assert diff.codes.tolist() == ["035420"]
+    assert diff.changed[0].tolist() == [False, True]
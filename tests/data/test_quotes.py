@@ -0,0 +1,49 @@
+import asyncio
+import json
+
+import httpx
+
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.quotes import chunk_codes
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+
+class WatchlistServer:
+    def __init__(self):
+        self.chunks = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        codes = json.loads(request.content)["stk_cd"].split("|")
+        self.chunks.append(codes)
+        rows = [{"stk_cd": code, "cur_prc": f"-{int(code)}", "flu_rt": "+1.50"} for code in codes]
+        return httpx.Response(200, json={"atn_stk_infr": rows, "return_code": 0})
+
+
+def _stock_info(server, use_async=False) -> StockInfo:
+    transport = httpx.MockTransport(server)
+    session = KiwoomSession(transport=transport, async_transport=transport)
+    return StockInfo(base_url="https://api.kiwoom.com", use_async=use_async, session=session)
+
+
+def test_chunk_codes_balanced_and_deduplicated():
+    codes = [f"{i:06d}" for i in range(250)]
+    assert [len(chunk) for chunk in chunk_codes(codes, 100)] == [84, 83, 83]
+    assert chunk_codes(["005930", "005930", "000660"], 100) == [["005930", "000660"]]
+    assert chunk_codes([], 100) == []
+
+
+def test_watchlist_quotes_sync_merges_chunks():
+    server = WatchlistServer()
+    codes = [f"{i:06d}" for i in range(1, 251)]
+    quotes = _stock_info(server).watchlist_quotes(codes, chunk_size=100, convert=True)
+    assert len(server.chunks) == 3
+    assert list(quotes) == codes
+    assert quotes["000042"]["cur_prc"] == 42 and quotes["000042"]["flu_rt"] == 1.5
+
+
+def test_watchlist_quotes_async():
+    server = WatchlistServer()
+    stock_info = _stock_info(server, use_async=True)
+    quotes = asyncio.run(stock_info.watchlist_quotes([f"{i:06d}" for i in range(1, 21)], chunk_size=7))
+    assert sorted(len(chunk) for chunk in server.chunks) == [6, 7, 7]
+    assert quotes["000020"]["cur_prc"] == "-20"
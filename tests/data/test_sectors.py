@@ -0,0 +1,162 @@
+import asyncio
+import json
+import math
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.sectors import SectorAnalytics
+from kiwoom_rest_api.koreanstock.sector import Sector
+from kiwoom_rest_api.testing.payloads import generate
+
+
+def _industry(code, name, price, rising, fall, stdns, value):
+    return {"stk_cd": code, "stk_nm": name, "cur_prc": f"+{price}", "flu_rt": "+0.50", "trde_qty": "1000",
+            "trde_prica": str(value), "upl": "0", "rising": str(rising), "stdns": str(stdns), "fall": str(fall), "lst": "0"}
+
+
+class SectorServer:
+    def __init__(self):
+        self.industries = [_industry("005", "음식료업", "3500.25", 6, 2, 2, 100), _industry("013", "전기전자", "2000.10", 1, 3, 0, 300)]
+        self.constituents = {
+            "005": [{"stk_cd": "000080", "cur_prc": "+100", "now_trde_qty": "10", "flu_rt": "+2.00"},
+                    {"stk_cd": "097950", "cur_prc": "-300", "now_trde_qty": "10", "flu_rt": "-1.00"}],
+            "013": [{"stk_cd": "005930", "cur_prc": "+50000", "now_trde_qty": "1", "flu_rt": "+1.00"}],
+        }
+        self.constituent_requests = []
+        self.failing = set()
+        # return_code 1700으로 거절할 api-id 또는 업종코드
+        self.rejected = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        rejected = {"return_code": 1700, "return_msg": "허용된 요청 개수를 초과하였습니다"}
+        if request.headers["api-id"] == "ka20003":
+            if "ka20003" in self.rejected:
+                return httpx.Response(200, json=rejected)
+            return httpx.Response(200, json={"all_inds_idex": self.industries, "return_code": 0})
+        self.constituent_requests.append(body["inds_cd"])
+        if body["inds_cd"] in self.failing:
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+        if body["inds_cd"] in self.rejected:
+            return httpx.Response(200, json=rejected)
+        return httpx.Response(200, json={"inds_stkpc": self.constituents[body["inds_cd"]], "return_code": 0})
+
+
+def _sector(server, use_async=False):
+    transport = httpx.MockTransport(server)
+    session = KiwoomSession(transport=transport, async_transport=transport, retry_policy=RetryPolicy(max_retries=0))
+    return Sector(base_url="https://api.kiwoom.com", use_async=use_async, session=session)
+
+
+def test_summary_metrics():
+    server = SectorServer()
+    analytics = SectorAnalytics()
+    assert analytics.refresh(_sector(server)) == ["005", "013"]
+    table = analytics.summary()
+    assert table["code"].tolist() == ["005", "013"]
+    assert table["index"].tolist() == [3500.25, 2000.10]
+    assert table["breadth"].tolist() == [0.4, -0.5]
+    assert table["ad_ratio"].tolist() == [3.0, 1 / 3]
+    assert table["turnover_share"].tolist() == [0.25, 0.75]
+    # 거래대금 가중: (1000 * 2 + 3000 * -1) / 4000
+    assert table["vw_return"][0] == -0.25 and table["ew_return"][0] == 0.5
+    assert table["members"].tolist() == [2, 1]
+
+
+def test_refresh_async_only_refetches_changed_industries():
+    server = SectorServer()
+    sector = _sector(server, use_async=True)
+    analytics = SectorAnalytics(shares={"000080": 30, "097950": 1, "005930": 1})
+    asyncio.run(analytics.refresh_async(sector))
+    # 시가총액 가중: (3000 * 2 + 300 * -1) / 3300
+    assert math.isclose(analytics.summary()["vw_return"][0], 5700 / 3300)
+
+    server.constituent_requests.clear()
+    # 소수점 이하만 바뀐 지수도 변경으로 감지
+    server.industries[1] = _industry("013", "전기전자", "2000.55", 2, 2, 0, 320)
+    assert asyncio.run(analytics.refresh_async(sector)) == ["013"]
+    assert server.constituent_requests == ["013"]
+    assert analytics.summary()["breadth"].tolist() == [0.4, 0.0]
+
+
+def test_failed_constituents_are_retried_on_next_refresh():
+    server = SectorServer()
+    sector = _sector(server)
+    analytics = SectorAnalytics()
+    analytics.refresh(sector)
+
+    server.industries[0] = _industry("005", "음식료업", "3510.00", 6, 2, 2, 100)
+    server.failing.add("005")
+    assert analytics.refresh(sector) == ["005"]
+    assert analytics.summary()["members"].tolist() == [2, 1]
+
+    # 지수는 그대로지만 구성종목을 받지 못한 업종은 다시 조회
+    server.failing.clear()
+    server.constituent_requests.clear()
+    assert analytics.refresh(sector) == ["005"]
+    assert server.constituent_requests == ["005"]
+    assert analytics.refresh(sector) == []
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_rejected_pages_keep_previous_state(use_async):
+    server = SectorServer()
+    sector = _sector(server, use_async=use_async)
+    analytics = SectorAnalytics()
+
+    def refresh():
+        return asyncio.run(analytics.refresh_async(sector)) if use_async else analytics.refresh(sector)
+
+    refresh()
+    before = analytics.summary()
+
+    # 동기 경로는 거절을 정상 페이지로, 비동기 경로는 APIError로 받지만 결과는 같음
+    server.rejected.add("ka20003")
+    server.constituent_requests.clear()
+    assert refresh() == [] and server.constituent_requests == []
+    assert analytics.summary()["code"].tolist() == ["005", "013"]
+    assert analytics.summary()["members"].tolist() == [2, 1]
+
+    # 거절된 업종은 이전 구성종목 지표를 유지하고 다음 refresh()에서 다시 받음
+    server.rejected = {"005"}
+    server.industries[0] = _industry("005", "음식료업", "3510.00", 6, 2, 2, 100)
+    server.constituents["005"] = server.constituents["005"][:1]
+    assert refresh() == ["005"]
+    assert analytics.summary()["ew_return"][0] == before["ew_return"][0]
+    server.rejected.clear()
+    assert refresh() == ["005"]
+    assert analytics.summary()["members"].tolist() == [1, 1]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_industry_does_not_discard_others(use_async):
+    server = SectorServer()
+    sector = _sector(server, use_async=use_async)
+    analytics = SectorAnalytics()
+
+    def refresh():
+        return asyncio.run(analytics.refresh_async(sector)) if use_async else analytics.refresh(sector)
+
+    refresh()
+    server.industries[0] = _industry("005", "음식료업", "3510.00", 6, 2, 2, 100)
+    server.industries[1] = _industry("013", "전기전자", "2010.00", 1, 3, 0, 300)
+    server.constituents["013"] = server.constituents["013"] * 2
+    server.failing.add("005")
+    # 실패한 업종만 이전 지표를 유지하고, 받은 업종은 반영됨
+    assert refresh() == ["005", "013"]
+    assert analytics.summary()["members"].tolist() == [2, 2]
+    server.failing.clear()
+    server.constituent_requests.clear()
+    assert refresh() == ["005"] and server.constituent_requests == ["005"]
+
+
+def test_index_values_keep_decimals():
+    _, _, rows = generate("ka20003", {"inds_cd": "001"}, 20)
+    analytics = SectorAnalytics()
+    analytics.update_index(rows)
+    expected = [abs(float(row["cur_prc"])) for row in rows]
+    assert analytics.summary()["index"].tolist() == expected
+    assert any(value != int(value) for value in expected)
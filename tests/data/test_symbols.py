@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import httpx
+
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.symbols import SymbolMaster
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+
+LISTING = {
+    "0": [
+        {"code": "005930", "name": "삼성전자", "marketCode": "0", "upName": "전기전자", "state": "증거금20%|담보대출", "auditInfo": "정상"},
+        {"code": "028260", "name": "삼성물산", "marketCode": "0", "upName": "유통업", "state": "증거금40%", "auditInfo": "정상"},
+    ],
+    "10": [
+        {"code": "900100", "name": "Alpha Bio", "marketCode": "10", "upName": "제약", "state": "관리종목", "auditInfo": "투자주의환기종목"},
+    ],
+    # ETF는 요청한 시장구분(8)과 다른 marketCode로 내려옴
+    "8": [
+        {"code": "069500", "name": "KODEX 200", "marketCode": "0", "upName": "", "state": "증거금100%", "auditInfo": "정상"},
+    ],
+}
+
+
+class ListingServer:
+    def __init__(self, rejected=(), failing=(), unreachable=()):
+        self.requests = 0
+        self.rejected = set(rejected)
+        self.failing = set(failing)
+        self.unreachable = set(unreachable)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        body = json.loads(request.content)
+        if request.headers["api-id"] == "ka10100":
+            return httpx.Response(200, json={"code": body["stk_cd"], "name": "신규상장", "marketCode": "10", "return_code": 0})
+        if body["mrkt_tp"] in self.unreachable:
+            raise httpx.ConnectError("connection refused", request=request)
+        if body["mrkt_tp"] in self.failing:
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+        if body["mrkt_tp"] in self.rejected:
+            return httpx.Response(200, json={"list": [], "return_code": 5, "return_msg": "일시적 오류"})
+        return httpx.Response(200, json={"list": LISTING.get(body["mrkt_tp"], []), "return_code": 0})
+
+
+def _stock_info(server, use_async=False):
+    transport = httpx.MockTransport(server)
+    session = KiwoomSession(transport=transport, async_transport=transport, retry_policy=RetryPolicy(max_retries=0))
+    return StockInfo(base_url="https://api.kiwoom.com", use_async=use_async, session=session)
+
+
+def test_refresh_builds_indexes_and_persists(tmp_path):
+    path = str(tmp_path / "symbols.json")
+    server = ListingServer()
+    master = SymbolMaster(path, markets=("0", "10"))
+    changes = master.refresh(_stock_info(server))
+    assert len(changes.added) == 3 and server.requests == 2
+
+    assert master.resolve("삼성전자") == "005930" and master.resolve("028260") == "028260"
+    assert [row["code"] for row in master.search("삼성")] == ["028260", "005930"]
+    assert [row["code"] for row in master.search("alpha")] == ["900100"]
+    assert master.codes(market="0") == {"005930", "028260"}
+    assert master.codes(exclude_states=["관리종목"]) == {"005930", "028260"}
+    assert master.by_state["투자주의환기종목"] == {"900100"}
+    assert master.by_sector["전기전자"] == {"005930"}
+
+    # 같은 날에는 다시 받지 않고, 파일에서 그대로 복원됨
+    assert not master.refresh(_stock_info(server)) and server.requests == 2
+    reloaded = SymbolMaster.load(path)
+    assert len(reloaded) == 3 and reloaded.resolve("Alpha Bio") == "900100"
+
+
+def test_apply_detects_changes_and_lookup_fetches_missing(tmp_path):
+    master = SymbolMaster(str(tmp_path / "symbols.json"))
+    master.apply(LISTING["0"], today="20250101")
+    renamed = [dict(LISTING["0"][0], name="삼성전자보통주")]
+    changes = master.apply(renamed, today="20250102")
+    assert changes.removed == ["028260"] and changes.changed == ["005930"]
+    assert master.resolve("삼성전자") is None and master.resolve("삼성전자보통주") == "005930"
+
+    server = ListingServer()
+    assert master.lookup(_stock_info(server), "123450")["name"] == "신규상장"
+    assert master.search("신규")[0]["code"] == "123450" and "123450" in master.by_market["10"]
+    reloaded = SymbolMaster.load(master.path)
+    assert reloaded.resolve("신규상장") == "123450" and reloaded.sources["123450"] == "10"
+
+
+def test_failed_or_empty_market_keeps_stored_symbols(tmp_path):
+    master = SymbolMaster(str(tmp_path / "symbols.json"), markets=("0", "10"))
+    # 코스닥 거절: 코스피만 반영하고 updated를 남기지 않아 다음 refresh()에서 다시 받음
+    assert len(master.refresh(_stock_info(ListingServer(rejected={"10"}))).added) == 2
+    assert master.is_stale()
+    assert master.refresh(_stock_info(ListingServer())).added == ["900100"] and not master.is_stale()
+
+    # 한 시장이 거절되어도 다른 시장의 종목은 지워지지 않음
+    assert not master.refresh(_stock_info(ListingServer(rejected={"10"})), force=True) and len(master) == 3
+    changes = asyncio.run(master.refresh_async(_stock_info(ListingServer(rejected={"0"}), use_async=True), force=True))
+    assert not changes and master.codes(market="0") == {"005930", "028260"}
+
+    # 모든 시장이 거절되거나 빈 목록이면 아무것도 지우지 않음
+    assert not master.refresh(_stock_info(ListingServer(rejected={"0", "10"})), force=True)
+    assert not master.apply([], today="20250103") and len(master) == 3
+    assert len(SymbolMaster.load(master.path)) == 3
+
+
+def test_delisting_is_decided_per_requested_market(tmp_path):
+    master = SymbolMaster(str(tmp_path / "symbols.json"), markets=("0", "8"))
+    master.refresh(_stock_info(ListingServer()))
+    assert master.codes(market="0") == {"005930", "028260", "069500"}
+
+    # ETF 시장(8)만 실패: marketCode가 0인 ETF도 코스피 목록과 비교해 지우지 않음
+    for server in (ListingServer(rejected={"8"}), ListingServer(failing={"8"}), ListingServer(unreachable={"8"})):
+        assert not master.refresh(_stock_info(server), force=True)
+        assert "069500" in master and len(master) == 3
+    assert SymbolMaster.load(master.path).sources["069500"] == "8"
+
+
+def test_unreachable_market_does_not_abort_other_markets(tmp_path):
+    master = SymbolMaster(str(tmp_path / "symbols.json"), markets=("0", "10"))
+    assert len(master.refresh(_stock_info(ListingServer(unreachable={"0"}))).added) == 1
+    assert master.codes(market="10") == {"900100"} and master.is_stale()
+    changes = asyncio.run(master.refresh_async(_stock_info(ListingServer(unreachable={"10"}), use_async=True)))
+    assert len(changes.added) == 2 and len(SymbolMaster.load(master.path)) == 3
@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.data.themes import ThemeIndex
+from kiwoom_rest_api.koreanstock.theme import Theme
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+class ThemeServer:
+    def __init__(self):
+        self.themes = {
+            "100": ("반도체", ["005930", "000660"]),
+            "200": ("2차전지", ["373220", "005930"]),
+        }
+        self.component_requests = []
+        self.failing = set()
+        # 지정하면 ka90001이 이 행을 돌려줌 (빈 목록 응답 등)
+        self.listing_rows = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.headers["api-id"] == "ka90001":
+            rows = [
+                {"thema_grp_cd": cd, "thema_nm": name, "stk_num": str(len(codes)), "flu_rt": "+1.00", "dt_prft_rt": "+5.00",
+                 "main_stk": codes[0]}
+                for cd, (name, codes) in self.themes.items()
+            ]
+            if self.listing_rows is not None:
+                rows = self.listing_rows
+            return httpx.Response(200, json={"thema_grp": rows, "return_code": 0})
+        theme_cd = body["thema_grp_cd"]
+        self.component_requests.append(theme_cd)
+        if theme_cd in self.failing:
+            return httpx.Response(500, json={"return_code": 1, "return_msg": "error"})
+        rows = [{"stk_cd": code, "stk_nm": code, "flu_rt": "+2.00", "dt_prft_rt_n": "+3.00"} for code in self.themes[theme_cd][1]]
+        return httpx.Response(200, json={"thema_comp_stk": rows, "return_code": 0})
+
+
+def _theme(server, use_async=False):
+    transport = httpx.MockTransport(server)
+    session = KiwoomSession(transport=transport, async_transport=transport, retry_policy=RetryPolicy(max_retries=0))
+    return Theme(base_url="https://api.kiwoom.com", use_async=use_async, session=session)
+
+
+def test_build_async_and_query_both_directions(tmp_path):
+    server = ThemeServer()
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+    assert sorted(asyncio.run(index.refresh_async(_theme(server, use_async=True)))) == ["100", "200"]
+
+    assert index.themes_of("005930") == {"100", "200"}
+    assert index.codes_of("200") == {"373220", "005930"}
+    assert index.contains("100", "000660") and not index.contains("200", "000660")
+    assert index.members["100"]["005930"]["dt_prft_rt_n"] == "+3.00"
+    assert index.find("반도") == ["100"]
+    assert ThemeIndex.load(index.path).themes_of("373220") == {"200"}
+
+
+def test_incremental_refresh_only_refetches_changed_themes(tmp_path):
+    server = ThemeServer()
+    theme = _theme(server)
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+    index.refresh(theme)
+
+    server.component_requests.clear()
+    server.themes["100"] = ("반도체", ["005930"])
+    server.themes["300"] = ("로봇", ["000660"])
+    del server.themes["200"]
+    assert sorted(index.refresh(theme)) == ["100", "300"]
+    assert sorted(server.component_requests) == ["100", "300"]
+    assert index.themes_of("005930") == {"100"}
+    assert index.themes_of("000660") == {"300"}
+    assert index.themes_of("373220") == set()
+
+
+def test_member_swap_detected_by_signature_or_age(tmp_path):
+    server = ThemeServer()
+    theme = _theme(server)
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+    index.refresh(theme)
+
+    # 종목수는 같지만 주요종목이 바뀌면 다시 받음
+    server.component_requests.clear()
+    server.themes["100"] = ("반도체", ["042700", "000660"])
+    assert index.refresh(theme) == ["100"]
+    assert index.themes_of("042700") == {"100"}
+
+    # 종목수와 주요종목이 그대로인 교체는 max_age가 지나야 반영됨
+    server.themes["100"] = ("반도체", ["042700", "005930"])
+    assert index.refresh(theme) == []
+    index.max_age = 0
+    assert sorted(index.refresh(theme)) == ["100", "200"]
+    assert index.codes_of("100") == {"042700", "005930"}
+    assert ThemeIndex.load(index.path).fetched.keys() == {"100", "200"}
+
+
+def test_failed_crawl_keeps_theme_stale(tmp_path):
+    server = ThemeServer()
+    theme = _theme(server, use_async=True)
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+    asyncio.run(index.refresh_async(theme))
+
+    server.themes["100"] = ("반도체", ["042700", "000660"])
+    server.themes["200"] = ("2차전지", ["247540", "005930"])
+    server.failing.add("100")
+    assert asyncio.run(index.refresh_async(theme)) == ["200"]
+    # 성공한 테마는 반영되고, 실패한 테마는 이전 서명과 구성종목이 남아 있음
+    assert index.themes_of("247540") == {"200"}
+    assert index.themes["100"]["main_stk"] == "005930"
+    assert index.codes_of("100") == {"005930", "000660"}
+
+    server.failing.clear()
+    assert asyncio.run(index.refresh_async(theme)) == ["100"]
+    assert index.themes_of("042700") == {"100"}
+    assert ThemeIndex.load(index.path).themes["100"]["main_stk"] == "042700"
+
+
+def test_rejected_theme_list_keeps_stored_index(tmp_path):
+    def theme(mock):
+        session = KiwoomSession(transport=mock.transport(), retry_policy=RetryPolicy(max_retries=0))
+        return Theme(base_url="https://api.kiwoom.com", session=session)
+
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+    assert len(index.refresh(theme(MockKiwoom(rows=3)))) == 3
+    stored = ThemeIndex.load(index.path)
+
+    # 동기 경로에서 1700 거절은 예외 없이 정상 페이지로 옴
+    throttled = MockKiwoom(rows=3, rate_limit=1, burst=0, throttle_status=200)
+    assert index.refresh(theme(throttled), full=True) == []
+    assert throttled.stats()["requests"] == {"ka90001": 1}
+    assert index.themes == stored.themes and index.members == stored.members
+    reloaded = ThemeIndex.load(index.path)
+    assert reloaded.themes == stored.themes and reloaded.fetched == stored.fetched
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_component_keeps_previous_members(tmp_path, use_async):
+    server = ThemeServer()
+    theme = _theme(server, use_async=use_async)
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+
+    def refresh():
+        return asyncio.run(index.refresh_async(theme)) if use_async else index.refresh(theme)
+
+    refresh()
+    server.themes["100"] = ("반도체", ["042700", "000660"])
+    server.themes["200"] = ("2차전지", ["247540", "005930"])
+    server.failing.add("100")
+    # 동기/비동기 모두 실패한 테마만 건너뛰고 나머지를 반영
+    assert refresh() == ["200"]
+    assert index.codes_of("100") == {"005930", "000660"} and index.themes_of("247540") == {"200"}
+    server.failing.clear()
+    assert refresh() == ["100"]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_empty_theme_list_keeps_stored_index(tmp_path, use_async):
+    server = ThemeServer()
+    theme = _theme(server, use_async=use_async)
+    index = ThemeIndex(str(tmp_path / "themes.json"))
+
+    def refresh():
+        return asyncio.run(index.refresh_async(theme, full=True)) if use_async else index.refresh(theme, full=True)
+
+    refresh()
+    server.listing_rows = []
+    server.component_requests.clear()
+    assert refresh() == [] and server.component_requests == []
+    assert index.themes_of("005930") == {"100", "200"}
+    assert ThemeIndex.load(index.path).codes_of("200") == {"373220", "005930"}
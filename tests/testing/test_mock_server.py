@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from kiwoom_rest_api.auth.token import TokenManager
+from kiwoom_rest_api.core.base import APIError
+from kiwoom_rest_api.core.retry import RetryPolicy
+from kiwoom_rest_api.core.session import KiwoomSession
+from kiwoom_rest_api.koreanstock.chart import Chart
+from kiwoom_rest_api.koreanstock.stockinfo import StockInfo
+from kiwoom_rest_api.testing.mock_server import MockKiwoom
+
+
+def _session(mock: MockKiwoom, **kwargs) -> KiwoomSession:
+    return KiwoomSession(transport=mock.transport(), async_transport=mock.async_transport(), **kwargs)
+
+
+def test_token_and_authenticated_call(monkeypatch):
+    monkeypatch.setattr("kiwoom_rest_api.auth.token.get_api_key", lambda: "app-key")
+    monkeypatch.setattr("kiwoom_rest_api.auth.token.get_api_secret", lambda: "app-secret")
+    mock = MockKiwoom(require_auth=True)
+    session = _session(mock)
+    token_manager = TokenManager(session=session)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", token_manager=token_manager, session=session)
+    result = stock_info.basic_stock_information_request_ka10001("005930")
+    assert result["return_code"] == 0 and result["stk_cd"] == "005930"
+
+    status, _, body = mock.handle("POST", "/api/dostk/stkinfo", {"api-id": "ka10001"}, b"{}")
+    assert status == 401 and json.loads(body)["return_code"] == 3
+
+
+def test_chart_is_paginated_deterministically():
+    mock = MockKiwoom(page_size=100, rows=250)
+    chart = Chart(base_url="https://api.kiwoom.com", session=_session(mock))
+    ohlcv = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+    assert len(ohlcv) == 250
+    assert list(ohlcv["dt"]) == sorted(ohlcv["dt"])
+    assert mock.stats()["requests"] == {"ka10081": 3}
+
+    again = chart.ohlcv(chart.stock_daily_chart_request_ka10081, "005930", "20250110", "1")
+    assert list(again["cur_prc"]) == list(ohlcv["cur_prc"])
+
+
+def test_throttling_and_error_injection_drive_retries():
+    mock = MockKiwoom(rate_limit=5, burst=1)
+    stock_info = StockInfo(
+        base_url="https://api.kiwoom.com", use_async=True,
+        session=_session(mock, retry_policy=RetryPolicy(max_retries=5, backoff=0.01, jitter=False)),
+    )
+
+    async def run():
+        return await asyncio.gather(*[stock_info.basic_stock_information_request_ka10001(f"{i:06d}") for i in range(3)])
+
+    assert all(result["return_code"] == 0 for result in asyncio.run(run()))
+    assert mock.throttled > 0
+
+    failing = MockKiwoom(error_rate=1.0, seed=1)
+    stock_info = StockInfo(base_url="https://api.kiwoom.com", session=_session(failing, retry_policy=RetryPolicy(max_retries=0)))
+    with pytest.raises(APIError) as excinfo:
+        stock_info.basic_stock_information_request_ka10001("005930")
+    assert excinfo.value.status_code == 500
+    assert failing.errors == 1
+
+
+def test_socket_server():
+    mock = MockKiwoom(latency=0.001)
+    with mock.serve() as server:
+        response = httpx.post(
+            f"{server.url}/api/dostk/stkinfo",
+            headers={"api-id": "ka10095"},
+            json={"stk_cd": "005930|000660"},
+        )
+    assert response.status_code == 200
+    assert [row["stk_cd"] for row in response.json()["atn_stk_infr"]] == ["005930", "000660"]
+    assert response.headers["cont-yn"] == "N"